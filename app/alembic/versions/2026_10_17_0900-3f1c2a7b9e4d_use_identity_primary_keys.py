@@ -0,0 +1,66 @@
+"""use identity primary keys
+
+Revision ID: 3f1c2a7b9e4d
+Revises: 9d538fba92b0
+Create Date: 2026-10-17 09:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+from app.core.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = "3f1c2a7b9e4d"
+down_revision: Union[str, Sequence[str], None] = "9d538fba92b0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+USER_TABLE = f'"{settings.postgres_db_schema}"."user"'
+USER_ID_SEQUENCE = f'"{settings.postgres_db_schema}"."user_id_seq"'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Replace the serial default with an identity column, continuing after the
+    # highest existing id
+    op.execute(f"ALTER TABLE {USER_TABLE} ALTER COLUMN id DROP DEFAULT")
+    op.execute(f"DROP SEQUENCE IF EXISTS {USER_ID_SEQUENCE}")
+    op.execute(
+        f"ALTER TABLE {USER_TABLE} ALTER COLUMN id "
+        "ADD GENERATED BY DEFAULT AS IDENTITY (START WITH 1 CACHE 1000)"
+    )
+    op.execute(
+        f"SELECT setval(pg_get_serial_sequence('{USER_TABLE}', 'id'), "
+        f"COALESCE((SELECT MAX(id) FROM {USER_TABLE}), 0) + 1, false)"
+    )
+
+    # The primary key already indexes id
+    op.drop_index(op.f("ix_user_id"), table_name="user", schema=settings.postgres_db_schema)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f("ix_user_id"),
+        "user",
+        ["id"],
+        unique=False,
+        schema=settings.postgres_db_schema,
+    )
+
+    op.execute(f"ALTER TABLE {USER_TABLE} ALTER COLUMN id DROP IDENTITY")
+    op.execute(f"CREATE SEQUENCE {USER_ID_SEQUENCE} OWNED BY {USER_TABLE}.id")
+    op.execute(
+        f"SELECT setval('{USER_ID_SEQUENCE}', "
+        f"COALESCE((SELECT MAX(id) FROM {USER_TABLE}), 0) + 1, false)"
+    )
+    op.alter_column(
+        "user",
+        "id",
+        server_default=sa.text(f"nextval('{USER_ID_SEQUENCE}'::regclass)"),
+        schema=settings.postgres_db_schema,
+    )
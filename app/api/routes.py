@@ -1,9 +1,12 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 from app.schemas.health_check import HealthCheckResponse
 
 api_router = APIRouter()
 
+# The healthy response never changes, so it is serialized once at import
+HEALTHY_RESPONSE_BODY = HealthCheckResponse(status="healthy").model_dump_json().encode()
+
 
 @api_router.get(
     "/health",
@@ -12,4 +15,4 @@ api_router = APIRouter()
     summary="Health Check",
 )
 async def health_check():
-    return {"status": "healthy"}
+    return Response(content=HEALTHY_RESPONSE_BODY, media_type="application/json")
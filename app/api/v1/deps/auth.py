@@ -1,3 +1,4 @@
+import asyncio
 from typing import Annotated
 
 from fastapi import Depends, Form
@@ -82,9 +83,12 @@ async def generate_access_token(
         BadRequestException: If registration fails (e.g., duplicate email).
     """
     service = _get_auth_service(db)
-    hashed_password = service.get_password_hash(user_in.password.get_secret_value())
+    # Hashing is CPU-bound, so keep it off the event loop
+    hashed_password = await asyncio.to_thread(
+        service.get_password_hash, user_in.password.get_secret_value()
+    )
     try:
-        return await service.register_user(
+        token_pair = await service.register_user(
             UserCreate(
                 first_name="",
                 last_name="",
@@ -96,6 +100,11 @@ async def generate_access_token(
     except DuplicateResourceError as e:
         raise http_exceptions.BadRequestException(detail=str(e))
 
+    # Repository writes don't commit on their own; commit the unit of work once
+    await db.commit()
+
+    return token_pair
+
 
 async def generate_refresh_token(
     token_payload: TokenPayload,
@@ -53,7 +53,7 @@ async def rate_limit_api(request: Request) -> None:
     Moderate rate limiting for general API endpoints.
 
     - **Limit:** 100 requests per minute per IP
-    - **Strategy:** IP-based
+    - **Strategy:** IP-based, fixed window
     - **Use case:** Standard API protection for public endpoints
 
     Args:
@@ -69,6 +69,7 @@ async def rate_limit_api(request: Request) -> None:
         key=key,
         limit=settings.rate_limit_default,
         window=settings.rate_limit_window,
+        algorithm="fixed",
     )
 
     request.state.rate_limit_info = info
@@ -89,7 +90,7 @@ async def rate_limit_public(request: Request) -> None:
     Lenient rate limiting for public/read-only endpoints.
 
     - **Limit:** 1000 requests per minute per IP
-    - **Strategy:** IP-based
+    - **Strategy:** IP-based, fixed window
     - **Use case:** Public endpoints like health checks, documentation
 
     Args:
@@ -105,6 +106,7 @@ async def rate_limit_public(request: Request) -> None:
         key=key,
         limit=settings.rate_limit_lenient,
         window=settings.rate_limit_window,
+        algorithm="fixed",
     )
 
     request.state.rate_limit_info = info
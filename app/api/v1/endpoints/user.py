@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 
 from app.api.v1.deps.auth import get_current_user
 from app.api.v1.deps.rate_limit import create_rate_limit_user_and_ip
@@ -41,4 +41,9 @@ router = APIRouter()
     description="Get the details of the currently authenticated user.",
 )
 async def read_user_me(current_user: Annotated[User, Depends(get_current_user)]):
-    return current_user
+    # The user was loaded from the database, so serialize it directly instead
+    # of having FastAPI re-validate it against the response model
+    return Response(
+        content=UserResponse.dump_trusted_json(current_user),
+        media_type="application/json",
+    )
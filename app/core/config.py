@@ -3,13 +3,14 @@ import os
 import tomllib
 from datetime import timedelta
 from enum import StrEnum
+from functools import cached_property
 from pathlib import Path
 
-from pydantic import Field, SecretStr, computed_field
+from pydantic import Field, SecretStr, computed_field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from yarl import URL
 
-from app.core.credentials import ApplePayStoreCredentials, FirebaseServiceAccount
+from app.core.credentials import ApplePayStoreCredentials, FirebaseServiceAccount, read_key_file
 
 PROJECT_DIR = Path(__file__).parent.parent.parent
 PROJECT_TOML_PATH = PROJECT_DIR / "pyproject.toml"
@@ -17,6 +18,19 @@ PROJECT_TOML_PATH = PROJECT_DIR / "pyproject.toml"
 with open(PROJECT_TOML_PATH, "rb") as f:
     PYPROJECT_CONTENT = tomllib.load(f)["project"]
 
+# Log level loguru names TRACE; the stdlib logging module has no level below DEBUG
+TRACE_LOG_LEVEL = 5
+
+# Levels log_level accepts, mapped to the loguru level name each one enables
+LOG_LEVEL_NAMES = {
+    TRACE_LOG_LEVEL: "TRACE",
+    logging.DEBUG: "DEBUG",
+    logging.INFO: "INFO",
+    logging.WARNING: "WARNING",
+    logging.ERROR: "ERROR",
+    logging.CRITICAL: "CRITICAL",
+}
+
 
 class Environment(StrEnum):
     LOCAL = "local"
@@ -63,7 +77,7 @@ class Settings(BaseSettings):
 
     # Current working environment
     current_environment: Environment
-    log_level: int = logging.INFO
+    log_level: int = logging.INFO  # TRACE (5) or a stdlib level from DEBUG (10) to CRITICAL (50)
     debug: bool
 
     # Variables for the database
@@ -73,6 +87,10 @@ class Settings(BaseSettings):
     postgres_password: str
     postgres_db: str
     postgres_db_schema: str
+    db_insertmanyvalues_page_size: int = 1000  # Rows per batched multi-row INSERT statement
+    db_pool_size: int = 25  # Persistent connections kept per worker
+    db_max_overflow: int = 25  # Extra connections opened under burst load per worker
+    db_pool_recycle: int = 1800  # Seconds before a pooled connection is replaced
 
     # firebase
     firebase_project_id: str
@@ -88,9 +106,13 @@ class Settings(BaseSettings):
     redis_user: str | None = None
     redis_pass: str
     redis_base: int | None = None
-    redis_max_pool_connections: int  # Maximum number of connections in the Redis pool
+    # Maximum number of connections in each worker's Redis pool
+    redis_max_pool_connections: int = Field(ge=1, le=1000)
+    redis_pool_wait_timeout: int = 5  # Seconds to wait for a free pooled connection
     redis_socket_connect_timeout: int  # Socket connect timeout in seconds
     redis_socket_timeout: int  # Socket timeout in seconds
+    redis_health_check_interval: int = 30  # PING connections idle this many seconds before reuse
+    redis_protocol: int = Field(default=3, ge=2, le=3)  # RESP version, 2 for Redis < 6
 
     # Cache settings
     cache_enabled: bool
@@ -98,6 +120,10 @@ class Settings(BaseSettings):
     cache_ttl_short: int  # Short cache TTL in seconds
     cache_ttl_long: int  # Long cache TTL in seconds
     cache_ttl_very_long: int  # Very long cache TTL in seconds
+    user_cache_ttl: int = 30  # In-process authenticated user cache TTL in seconds, 0 disables it
+    user_cache_max_size: int = 1024  # Maximum users held by the in-process user cache
+    token_revocation_cache_ttl: int = 5  # Seconds JTI and revoke-all lookups are cached, 0 disables
+    token_revocation_cache_max_size: int = 10000  # Maximum entries per revocation cache
 
     # Rate limiting settings (requests per window)
     rate_limit_enabled: bool
@@ -157,21 +183,42 @@ class Settings(BaseSettings):
     resend_api_key: SecretStr
     brevo_api_key: SecretStr
 
+    @field_validator("log_level")
+    @classmethod
+    def validate_log_level(cls, value: int) -> int:
+        """
+        Reject log levels that have no loguru level name.
+
+        Args:
+            value: The configured stdlib log level
+
+        Returns:
+            int: The log level, unchanged
+
+        Raises:
+            ValueError: If the level is not TRACE, DEBUG, INFO, WARNING, ERROR or CRITICAL
+        """
+        if value not in LOG_LEVEL_NAMES:
+            raise ValueError(
+                f"log_level must be one of {', '.join(map(str, LOG_LEVEL_NAMES))}, got {value}"
+            )
+        return value
+
     @computed_field
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
         """
-        Parse CORS origins from a comma-separated string.
+        Parse CORS origins from a comma-separated string, once per settings instance.
         """
-        return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
+        return [origin for origin in (o.strip() for o in self.cors_origins.split(",")) if origin]
 
     @computed_field
-    @property
+    @cached_property
     def allowed_hosts_list(self) -> list[str]:
         """
-        Parse allowed hosts from a comma-separated string.
+        Parse allowed hosts from a comma-separated string, once per settings instance.
         """
-        return [host.strip() for host in self.allowed_hosts.split(",") if host.strip()]
+        return [host for host in (h.strip() for h in self.allowed_hosts.split(",")) if host]
 
     @computed_field
     @property
@@ -238,8 +285,9 @@ class Settings(BaseSettings):
         # Check if the private key path is provided and exists
         # If it does, read the private key from the file
         if self.firebase_private_key_path is not None:
-            if self.firebase_private_key_path.is_file():
-                self.firebase_private_key = self.firebase_private_key_path.read_text()
+            private_key = read_key_file(self.firebase_private_key_path)
+            if private_key is not None:
+                self.firebase_private_key = private_key
 
         return FirebaseServiceAccount(
             project_id=self.firebase_project_id,
@@ -279,8 +327,9 @@ class Settings(BaseSettings):
         # Check if the private key path is provided and exists
         # If it does, read the private key from the file
         if self.apple_pay_store_private_key_path is not None:
-            if self.apple_pay_store_private_key_path.is_file():
-                self.apple_pay_store_private_key = self.apple_pay_store_private_key_path.read_text()
+            private_key = read_key_file(self.apple_pay_store_private_key_path)
+            if private_key is not None:
+                self.apple_pay_store_private_key = private_key
 
         return ApplePayStoreCredentials(
             private_key=self.apple_pay_store_private_key.replace("\\", "\\\\"),
@@ -1,8 +1,49 @@
+import functools
+import stat
 from pathlib import Path
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
+@functools.lru_cache(maxsize=8)
+def _read_key_file_cached(path: str, mtime_ns: int) -> str:
+    """
+    Read a key file; ``mtime_ns`` is only part of the cache key.
+
+    Args:
+        path: Resolved path of the key file
+        mtime_ns: Modification time of the file, so edits miss the cache
+
+    Returns:
+        str: The file content
+    """
+    return Path(path).read_text()
+
+
+def read_key_file(path: Path) -> str | None:
+    """
+    Read a private key file, reusing the content while the file is unchanged.
+
+    Credentials are rebuilt from settings on use, so the key file is only read
+    from disk again when its modification time changes.
+
+    Args:
+        path: Path of the key file
+
+    Returns:
+        str | None: The file content, or None if the path is not a regular file
+    """
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+
+    if not stat.S_ISREG(stat_result.st_mode):
+        return None
+
+    return _read_key_file_cached(str(path.resolve()), stat_result.st_mtime_ns)
+
+
 # --- APPLE_PAY_START ---
 class ApplePayStoreCredentials(BaseModel):
     """
@@ -64,7 +105,9 @@ class FirebaseServiceAccount(BaseModel):
     def validate_fields(self):
         self.client_x509_cert_url = self.client_x509_cert_url + self.client_email
 
-        if self.private_key_path is not None and self.private_key_path.is_file():
-            self.private_key = self.private_key_path.read_text()
+        if self.private_key_path is not None:
+            private_key = read_key_file(self.private_key_path)
+            if private_key is not None:
+                self.private_key = private_key
 
         return self
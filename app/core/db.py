@@ -12,6 +12,15 @@ engine = create_async_engine(
     echo=True if settings.debug else False,
     future=True,
     pool_pre_ping=True,
+    # Size the pool for concurrent requests; keep
+    # WORKERS_COUNT * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below Postgres max_connections
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,
+    # Reuse the most recently returned connection so bursts are served by warm
+    # connections (with cached prepared statements) while idle ones time out
+    pool_use_lifo=True,
+    insertmanyvalues_page_size=settings.db_insertmanyvalues_page_size,
 )
 
 sync_engine = create_engine(
@@ -19,9 +28,11 @@ sync_engine = create_engine(
     echo=True if settings.debug else False,
     future=True,
     pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle,
+    pool_use_lifo=True,
+    insertmanyvalues_page_size=settings.db_insertmanyvalues_page_size,
 )
 
-# Set pool size and max overflow for async engine
 meta = MetaData(
     schema=settings.postgres_db_schema,
     naming_convention={
@@ -6,21 +6,14 @@ class AppStoreException(AppException):
     Exception related to App Store operations
     """
 
-    def __init__(self, message, exception: Exception | None = None):
-        super().__init__(message, exception)
-
 
 class AppStoreClientNotInitializedException(AppStoreException):
     """
     Exception raised when the App Store client is not initialized
     """
 
-    def __init__(
-        self,
-        message="App Store client not initialized",
-        exception: Exception | None = None,
-    ):
-        super().__init__(message, exception)
+    def __init__(self, message="App Store client not initialized"):
+        super().__init__(message)
 
 
 class AppStoreNotFoundException(AppStoreException):
@@ -28,12 +21,8 @@ class AppStoreNotFoundException(AppStoreException):
     Exception raised when the App Store resource is not found
     """
 
-    def __init__(
-        self,
-        message="App Store resource not found",
-        exception: Exception | None = None,
-    ):
-        super().__init__(message, exception)
+    def __init__(self, message="App Store resource not found"):
+        super().__init__(message)
 
 
 class AppStorePrivateKeyMissingException(AppStoreException):
@@ -41,12 +30,8 @@ class AppStorePrivateKeyMissingException(AppStoreException):
     Exception raised when the App Store private key is missing
     """
 
-    def __init__(
-        self,
-        message="App Store private key is missing or invalid",
-        exception: Exception | None = None,
-    ):
-        super().__init__(message, exception)
+    def __init__(self, message="App Store private key is missing or invalid"):
+        super().__init__(message)
 
 
 class AppStoreInvalidCredentialsException(AppStoreException):
@@ -54,12 +39,8 @@ class AppStoreInvalidCredentialsException(AppStoreException):
     Exception raised when the App Store credentials are invalid
     """
 
-    def __init__(
-        self,
-        message="App Store credentials are invalid",
-        exception: Exception | None = None,
-    ):
-        super().__init__(message, exception)
+    def __init__(self, message="App Store credentials are invalid"):
+        super().__init__(message)
 
 
 class AppStoreConnectionAbortedException(AppStoreException):
@@ -67,12 +48,8 @@ class AppStoreConnectionAbortedException(AppStoreException):
     Exception raised when the App Store connection is aborted
     """
 
-    def __init__(
-        self,
-        message="App Store connection aborted",
-        exception: Exception | None = None,
-    ):
-        super().__init__(message, exception)
+    def __init__(self, message="App Store connection aborted"):
+        super().__init__(message)
 
 
 class AppStoreConnectionRefusedException(AppStoreException):
@@ -80,12 +57,8 @@ class AppStoreConnectionRefusedException(AppStoreException):
     Exception raised when the App Store connection is refused
     """
 
-    def __init__(
-        self,
-        message="App Store connection refused",
-        exception: Exception | None = None,
-    ):
-        super().__init__(message, exception)
+    def __init__(self, message="App Store connection refused"):
+        super().__init__(message)
 
 
 class AppStoreRateLimitExceededException(AppStoreException):
@@ -93,12 +66,8 @@ class AppStoreRateLimitExceededException(AppStoreException):
     Exception raised when the App Store connection is rate-limited
     """
 
-    def __init__(
-        self,
-        message="App Store connection rate-limited",
-        exception: Exception | None = None,
-    ):
-        super().__init__(message, exception)
+    def __init__(self, message="App Store connection rate-limited"):
+        super().__init__(message)
 
 
 class AppStoreTimeoutException(AppStoreException):
@@ -106,12 +75,8 @@ class AppStoreTimeoutException(AppStoreException):
     Exception raised when the App Store connection times out
     """
 
-    def __init__(
-        self,
-        message="App Store connection timed out",
-        exception: Exception | None = None,
-    ):
-        super().__init__(message, exception)
+    def __init__(self, message="App Store connection timed out"):
+        super().__init__(message)
 
 
 class AppStoreConnectionErrorException(AppStoreException):
@@ -119,12 +84,8 @@ class AppStoreConnectionErrorException(AppStoreException):
     Exception raised when there is a connection error with the App Store
     """
 
-    def __init__(
-        self,
-        message="App Store connection error",
-        exception: Exception | None = None,
-    ):
-        super().__init__(message, exception)
+    def __init__(self, message="App Store connection error"):
+        super().__init__(message)
 
 
 class AppStoreResponseException(AppStoreException):
@@ -132,12 +93,8 @@ class AppStoreResponseException(AppStoreException):
     Exception raised for errors in the App Store response
     """
 
-    def __init__(
-        self,
-        message="App Store response error",
-        exception: Exception | None = None,
-    ):
-        super().__init__(message, exception)
+    def __init__(self, message="App Store response error"):
+        super().__init__(message)
 
 
 class AppStoreValidationException(AppStoreException):
@@ -145,9 +102,5 @@ class AppStoreValidationException(AppStoreException):
     Exception raised for validation errors with App Store data
     """
 
-    def __init__(
-        self,
-        message="App Store validation error",
-        exception: Exception | None = None,
-    ):
-        super().__init__(message, exception)
+    def __init__(self, message="App Store validation error"):
+        super().__init__(message)
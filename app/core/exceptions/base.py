@@ -1,23 +1,27 @@
-from typing import Any, Optional
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
 
 from fastapi import HTTPException as FastAPIHTTPException
 
+# Shared default for exceptions without extra headers; read-only, so sharing
+# one instance across every raised exception is safe
+EMPTY_HEADERS: Mapping[str, str] = MappingProxyType({})
+
 
 class AppException(Exception):
     """
     Base for all custom/domain exceptions.
     Services raise AppException subclasses; deps catch and translate to HTTP exceptions.
+    The underlying error, if any, is chained with ``raise ... from exc`` and
+    available as ``__cause__``.
     """
 
-    def __init__(self, message, exception: Exception | None = None):
+    def __init__(self, message):
         super().__init__(message)
         self.message = message
-        self.exception = exception
 
     def __str__(self):
-        if self.exception:
-            return f"{self.message}\nException: {self.exception}"
-
         return self.message
 
 
@@ -26,7 +30,7 @@ class HTTPException(FastAPIHTTPException):
         self,
         status_code: int,
         detail: Any = None,
-        headers: Optional[dict[str, str]] = None,
+        headers: Mapping[str, str] = EMPTY_HEADERS,
     ) -> None:
         """
         Initializes the HTTPException with the provided status code, detail, and headers.
@@ -34,4 +38,10 @@ class HTTPException(FastAPIHTTPException):
         :param detail: Optional message or data providing details about the exception.
         :param headers: Optional headers to include in the HTTP response.
         """
-        super().__init__(status_code=status_code, detail=detail, headers=headers)
+        # FastAPI annotates headers as a dict, but only hands it to Starlette,
+        # which accepts any Mapping
+        super().__init__(
+            status_code=status_code,
+            detail=detail,
+            headers=headers,  # type: ignore[arg-type]
+        )
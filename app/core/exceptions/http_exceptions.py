@@ -1,15 +1,16 @@
-from typing import Any, Optional
+from collections.abc import Mapping
+from typing import Any
 
 from starlette import status
 
-from app.core.exceptions.base import HTTPException
+from app.core.exceptions.base import EMPTY_HEADERS, HTTPException
 
 
 class BadRequestException(HTTPException):
     def __init__(
         self,
         detail: Any = None,
-        headers: Optional[dict[str, str]] = None,
+        headers: Mapping[str, str] = EMPTY_HEADERS,
     ) -> None:
         """
         The server cannot or will not process the request due to an apparent
@@ -29,7 +30,7 @@ class ForbiddenException(HTTPException):
     def __init__(
         self,
         detail: Any = None,
-        headers: Optional[dict[str, str]] = None,
+        headers: Mapping[str, str] = EMPTY_HEADERS,
     ) -> None:
         """
         The request contained valid data and was understood by the server, but the
@@ -54,7 +55,7 @@ class InternalServerErrorException(HTTPException):
     def __init__(
         self,
         detail: Any = None,
-        headers: Optional[dict[str, str]] = None,
+        headers: Mapping[str, str] = EMPTY_HEADERS,
     ) -> None:
         """
         A generic error message, given when an unexpected condition was
@@ -73,7 +74,7 @@ class NotFoundException(HTTPException):
     def __init__(
         self,
         detail: Any = None,
-        headers: Optional[dict[str, str]] = None,
+        headers: Mapping[str, str] = EMPTY_HEADERS,
     ) -> None:
         """
         The requested resource could not be found but may be available in the
@@ -92,7 +93,7 @@ class NotImplementedException(HTTPException):
     def __init__(
         self,
         detail: Any = None,
-        headers: Optional[dict[str, str]] = None,
+        headers: Mapping[str, str] = EMPTY_HEADERS,
     ) -> None:
         """
         The server either does not recognize the request method,
@@ -113,7 +114,7 @@ class ServiceUnavailableException(HTTPException):
     def __init__(
         self,
         detail: Any = None,
-        headers: Optional[dict[str, str]] = None,
+        headers: Mapping[str, str] = EMPTY_HEADERS,
     ) -> None:
         """
         The server cannot handle the request (because it is overloaded or
@@ -133,7 +134,7 @@ class TooManyRequestsException(HTTPException):
     def __init__(
         self,
         detail: Any = None,
-        headers: Optional[dict[str, str]] = None,
+        headers: Mapping[str, str] = EMPTY_HEADERS,
     ) -> None:
         """
         The user has sent too many requests in a given amount of time.
@@ -152,7 +153,7 @@ class UnauthorizedException(HTTPException):
     def __init__(
         self,
         detail: Any = None,
-        headers: Optional[dict[str, str]] = None,
+        headers: Mapping[str, str] = EMPTY_HEADERS,
     ) -> None:
         """
         Similar to 403 Forbidden, but specifically for use when authentication is
@@ -178,7 +179,7 @@ class ConflictException(HTTPException):
     def __init__(
         self,
         detail: Any = None,
-        headers: Optional[dict[str, str]] = None,
+        headers: Mapping[str, str] = EMPTY_HEADERS,
     ) -> None:
         """
         Indicates that the request could not be processed because of conflict in the
@@ -198,7 +199,7 @@ class ContentTooLargeException(HTTPException):
     def __init__(
         self,
         detail: Any = None,
-        headers: Optional[dict[str, str]] = None,
+        headers: Mapping[str, str] = EMPTY_HEADERS,
     ) -> None:
         """
         The request is larger than the server is willing or able to process.
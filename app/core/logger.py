@@ -1,18 +1,20 @@
 import atexit
+import json
 import logging
 import os
 import queue
+import random
 import sys
 import threading
 import time
-import uuid
 from contextvars import ContextVar
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Optional
 
 from loguru import logger
 
-from app.core.config import Environment, settings
+from app.core.config import LOG_LEVEL_NAMES, Environment, settings
+from app.core.types import OpenObservePayloadDict
 
 if TYPE_CHECKING:
     from types import FrameType
@@ -36,24 +38,14 @@ LOG_DIR.mkdir(exist_ok=True)
 LOG_FILE = LOG_DIR / "app.log"
 
 
-# ============================================
-# LOG LEVEL MAPPING
-# ============================================
-
-LOG_LEVELs = {
-    50: "CRITICAL",
-    40: "ERROR",
-    30: "WARNING",
-    20: "INFO",
-    10: "DEBUG",
-    0: "NOTSET",
-}
-
-
 # ============================================
 # OPENOBSERVE ASYNC HANDLER
 # ============================================
 
+# Compact encoder shared by all batches; ensure_ascii=False keeps non-ASCII
+# text as-is so the UTF-8 body is produced without escape expansion
+_batch_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
 
 class OpenObserveHandler:
     """
@@ -63,11 +55,21 @@ class OpenObserveHandler:
     - Background thread for HTTP requests (doesn't block FastAPI event loop)
     - Batching for efficiency (reduces HTTP calls)
     - Queue-based to avoid blocking main application
-    - Automatic retry with exponential backoff
+    - Automatic retry with jittered exponential backoff, bounded by a deadline
+      and cut short on shutdown
     - Graceful shutdown with pending log flush
     - Connection pooling for performance
+    - Load shedding with sampled drop reporting when the queue saturates
     """
 
+    # Queue capacity, and the fill level past which new logs are shed
+    # before their payload is even built
+    QUEUE_MAXSIZE = 1000
+    QUEUE_HIGH_WATERMARK = 950
+
+    # Report dropped logs once per this many drops instead of on every drop
+    DROP_REPORT_INTERVAL = 1000
+
     def __init__(
         self,
         url: str,
@@ -77,6 +79,7 @@ class OpenObserveHandler:
         batch_size: int = 10,
         flush_interval: float = 5.0,
         max_retries: int = 3,
+        retry_deadline: float = 5.0,
     ):
         self.url = url
         self.token = token
@@ -85,9 +88,15 @@ class OpenObserveHandler:
         self.batch_size = batch_size
         self.flush_interval = flush_interval
         self.max_retries = max_retries
+        self.retry_deadline = retry_deadline
+
+        # Request target is fixed for the handler's lifetime
+        self.endpoint = f"{url}/api/{org}/{stream}/_json"
+        self.headers = {"Authorization": f"Basic {token}", "Content-Type": "application/json"}
 
         # Queue for log messages (thread-safe)
-        self.log_queue: queue.Queue = queue.Queue(maxsize=1000)
+        self.log_queue: queue.Queue = queue.Queue(maxsize=self.QUEUE_MAXSIZE)
+        self._dropped = 0
 
         # Background thread
         self.worker_thread: Optional[threading.Thread] = None
@@ -133,7 +142,7 @@ class OpenObserveHandler:
 
     def _worker_loop(self):
         """Background worker that batches and sends logs"""
-        batch: list[dict[str, Any]] = []
+        batch: list[OpenObservePayloadDict] = []
         last_flush = time.time()
 
         while not self.shutdown_event.is_set():
@@ -163,7 +172,7 @@ class OpenObserveHandler:
         if batch:
             self._flush_batch(batch)
 
-    def _flush_batch(self, batch: list[dict[str, Any]]):
+    def _flush_batch(self, batch: list[OpenObservePayloadDict]):
         """Send batch of logs to OpenObserve with retry logic"""
         if not batch:
             return
@@ -172,26 +181,35 @@ class OpenObserveHandler:
         if client is None:
             return
 
-        endpoint = f"{self.url}/api/{self.org}/{self.stream}/_json"
-        headers = {"Authorization": f"Basic {self.token}", "Content-Type": "application/json"}
+        # Encode once as bytes and reuse across retries, rather than letting
+        # httpx re-serialize the batch on every attempt
+        body = _batch_encoder.encode(batch).encode()
+
+        deadline = time.monotonic() + self.retry_deadline
 
         for attempt in range(self.max_retries):
             try:
-                response = client.post(endpoint, json=batch, headers=headers)
+                response = client.post(self.endpoint, content=body, headers=self.headers)
                 response.raise_for_status()
                 return  # Success
 
             except Exception as e:
-                if attempt == self.max_retries - 1:
+                # Jittered exponential backoff, never sleeping past the deadline
+                delay = min(
+                    0.2 * 2**attempt + random.random() * 0.1,  # nosec B311 - jitter, not security
+                    deadline - time.monotonic(),
+                )
+                if attempt == self.max_retries - 1 or delay <= 0 or self.shutdown_event.is_set():
                     print(
-                        f"Failed to send {len(batch)} logs to OpenObserve after {self.max_retries} attempts: {e}",
+                        f"Failed to send {len(batch)} logs to OpenObserve after {attempt + 1} attempts: {e}",
                         file=sys.stderr,
                     )
-                else:
-                    # Exponential backoff
-                    time.sleep(2**attempt)
+                    return
+
+                # Unlike time.sleep(), shutdown() wakes this wait up immediately
+                self.shutdown_event.wait(delay)
 
-    def send_log(self, log_data: dict[str, Any]):
+    def send_log(self, log_data: OpenObservePayloadDict):
         """
         Add log to queue for async sending.
         Non-blocking call - returns immediately.
@@ -199,7 +217,24 @@ class OpenObserveHandler:
         try:
             self.log_queue.put_nowait(log_data)
         except queue.Full:
-            print("OpenObserve queue full, dropping log", file=sys.stderr)
+            self.drop_log()
+
+    def is_saturated(self) -> bool:
+        """Whether the queue is close enough to full that new logs should be shed"""
+        return self.log_queue.qsize() >= self.QUEUE_HIGH_WATERMARK
+
+    def drop_log(self):
+        """
+        Count a dropped log.
+        Only the first drop and every DROP_REPORT_INTERVAL-th one after it are
+        reported, so sustained backpressure doesn't flood (and block on) stderr.
+        """
+        self._dropped += 1
+        if self._dropped % self.DROP_REPORT_INTERVAL == 1:
+            print(
+                f"OpenObserve queue full, dropped {self._dropped} logs so far",
+                file=sys.stderr,
+            )
 
     def shutdown(self):
         """Gracefully shutdown the handler and flush pending logs"""
@@ -225,16 +260,28 @@ _openobserve_handler: Optional[OpenObserveHandler] = None
 
 
 # ============================================
-# CUSTOM FILTER FOR CORRELATION AND PROCESS ID
+# CUSTOM PATCHER AND FILTER FOR CORRELATION
 # ============================================
 
 
+def correlation_patcher(record: "Record") -> None:
+    """
+    Add correlation ID to log records.
+    This allows tracking requests across the application.
+
+    Registered as the global Loguru patcher so it runs once per record,
+    instead of once per sink as a filter would. The process ID is bound
+    once in setup_logger() through the core's default extras.
+
+    Args:
+        record (Record): Log record from Loguru.
+    """
+    record["extra"]["request_id"] = request_id_var.get() or os.urandom(4).hex()
+
+
 def correlation_filter(record: "Record") -> bool:
     """
-    Add correlation ID and process ID to log records.
-    This allows tracking requests across the application and
-    differentiating between different worker processes.
-    Removes OpenObserve HTTP logs to avoid redundancy.
+    Remove OpenObserve HTTP logs to avoid redundancy.
 
     Args:
         record (Record): Log record from Loguru.
@@ -248,9 +295,6 @@ def correlation_filter(record: "Record") -> bool:
         if settings.openobserve_url in message:
             return False
 
-    record["extra"]["request_id"] = request_id_var.get() or str(uuid.uuid4())[:8]
-    record["extra"]["process_id"] = os.getpid()
-
     return True
 
 
@@ -265,6 +309,14 @@ class InterceptHandler(logging.Handler):
     Used to replace Uvicorn's default loggers with our Loguru configuration.
     """
 
+    def __init__(self, level: int = logging.NOTSET):
+        super().__init__(level)
+        # Stack depth from emit() to the original logging call, found by walking
+        # the frames once and reused while it still points past the logging module
+        self._depth: Optional[int] = None
+        # Loguru level (name, or levelno when unknown to Loguru) per stdlib levelno
+        self._levels: dict[int, str | int] = {}
+
     def emit(self, record: logging.LogRecord):
         """
         Process a log record and redirect it to Loguru.
@@ -273,21 +325,40 @@ class InterceptHandler(logging.Handler):
         We extract the log level and message, then pass it to Loguru.
         """
         # Get corresponding Loguru level if it exists
-        level: str | int
+        level = self._levels.get(record.levelno)
+        if level is None:
+            try:
+                level = logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            self._levels[record.levelno] = level
+
+        # Find the caller from where the logging call originated
+        depth = self._depth
         try:
-            level = logger.level(record.levelname).name
+            if depth is not None and (
+                sys._getframe(depth - 1).f_code.co_filename != logging.__file__
+                or sys._getframe(depth).f_code.co_filename == logging.__file__
+            ):
+                depth = None
         except ValueError:
-            level = record.levelno
+            depth = None
 
-        # Find the caller from where the logging call originated
-        frame: Optional["FrameType"] = logging.currentframe()
-        depth = 2
-        while frame and frame.f_code.co_filename == logging.__file__:
-            frame = frame.f_back
-            depth += 1
+        if depth is None:
+            frame: Optional["FrameType"] = sys._getframe(1)
+            depth = 1
+            while frame and frame.f_code.co_filename == logging.__file__:
+                frame = frame.f_back
+                depth += 1
+            self._depth = depth
+
+        # Plain string messages without args need no formatting
+        message = record.msg
+        if record.args or not isinstance(message, str):
+            message = record.getMessage()
 
         # Log to Loguru with the appropriate level and context
-        logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+        logger.opt(depth=depth, exception=record.exc_info).log(level, message)
 
 
 # ============================================
@@ -300,7 +371,8 @@ def setup_logger():
     Configure Loguru logger for multi-worker FastAPI application.
 
     Features:
-    - Thread and process safe with enqueue=True
+    - Process safe file output with enqueue=True (the only enqueued sink, so
+      each record is pickled once rather than once per sink)
     - Single unified log file with process IDs for worker differentiation
     - 3 months retention, 10MB rotation
     - Compression for old logs (gzip)
@@ -315,29 +387,45 @@ def setup_logger():
     # Remove default handler to avoid duplicate logs
     logger.remove()
 
-    # Get log level based on environment
-    log_level = LOG_LEVELs[settings.log_level]
+    # Correlation fields are computed once per record, not once per sink
+    logger.configure(patcher=correlation_patcher, extra={"process_id": os.getpid()})
+
+    # Settings only accept levels listed in LOG_LEVEL_NAMES
+    log_level = LOG_LEVEL_NAMES[settings.log_level]
 
     # ============================================
     # CONSOLE OUTPUT: Simplified, colored format
     # ============================================
     # Purpose: Quick debugging and monitoring
     # Format: Timestamp | Level | PID | RequestID | Message
-    console_format = (
-        "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-        "<level>{level: <8}</level> | "
-        "<magenta>PID:{extra[process_id]}</magenta> | "
-        "<yellow>ReqID:{extra[request_id]}</yellow> | "
-        "<cyan>{name}:{function}:{line}</cyan> | "
-        "<level>{message}</level>"
-    )
+    # Colors only help a terminal; redirected output (containers, systemd)
+    # gets the same fields without color markup or ANSI escape codes
+    is_tty = sys.stdout.isatty()
+    if is_tty:
+        console_format = (
+            "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+            "<level>{level: <8}</level> | "
+            "<magenta>PID:{extra[process_id]}</magenta> | "
+            "<yellow>ReqID:{extra[request_id]}</yellow> | "
+            "<cyan>{name}:{function}:{line}</cyan> | "
+            "<level>{message}</level>"
+        )
+    else:
+        console_format = (
+            "{time:YYYY-MM-DD HH:mm:ss} | "
+            "{level: <8} | "
+            "PID:{extra[process_id]} | "
+            "ReqID:{extra[request_id]} | "
+            "{name}:{function}:{line} | "
+            "{message}"
+        )
 
     logger.add(
         sys.stdout,
         format=console_format,
         level=logging.DEBUG if settings.current_environment == Environment.DEV else logging.INFO,
-        colorize=True,
-        enqueue=True,  # Thread-safe queue-based logging
+        colorize=is_tty,
+        enqueue=False,  # Same process, Loguru already locks the sink
         filter=correlation_filter,
     )
 
@@ -384,6 +472,9 @@ def setup_logger():
             flush_interval=settings.openobserve_flush_interval,
         )
 
+        # Constant for the lifetime of the process, resolved once instead of per record
+        environment = settings.current_environment.value
+
         def openobserve_sink(message):
             """
             Non-blocking sink that queues logs for OpenObserve.
@@ -393,19 +484,26 @@ def setup_logger():
             if _openobserve_handler is None:
                 return
 
+            # Shed load before doing any payload work when the queue is saturated
+            if _openobserve_handler.is_saturated():
+                _openobserve_handler.drop_log()
+                return
+
             record: dict = message.record
+            extra = record["extra"]
 
-            # Prepare payload for OpenObserve
-            payload = {
+            # Prepare payload for OpenObserve; a single dict display with a
+            # fixed key set is built presized, without incremental resizes
+            payload: OpenObservePayloadDict = {
                 "timestamp": record["time"].isoformat(),
                 "level": record["level"].name,
                 "message": record["message"],
-                "process_id": record["extra"].get("process_id"),
-                "request_id": record["extra"].get("request_id"),
+                "process_id": extra.get("process_id"),
+                "request_id": extra.get("request_id"),
                 "module": record["name"],
                 "function": record["function"],
                 "line": record["line"],
-                "environment": settings.current_environment.value,
+                "environment": environment,
             }
 
             # Add exception info if present
@@ -418,7 +516,7 @@ def setup_logger():
         logger.add(
             openobserve_sink,
             level=log_level,
-            enqueue=True,  # Additional thread safety
+            enqueue=False,  # send_log() is already a non-blocking queue put
             filter=correlation_filter,
         )
 
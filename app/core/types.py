@@ -1,4 +1,7 @@
-from typing import TypedDict
+from typing import Literal, NotRequired, TypedDict
+
+# "sliding": exact rolling window (sorted set), "fixed": per-window counter (INCR)
+RateLimitAlgorithm = Literal["sliding", "fixed"]
 
 
 class RateLimitInfoDict(TypedDict):
@@ -8,3 +11,18 @@ class RateLimitInfoDict(TypedDict):
     remaining: int
     reset_time: int
     window: int
+
+
+class OpenObservePayloadDict(TypedDict):
+    """Single log entry as shipped to OpenObserve."""
+
+    timestamp: str
+    level: str
+    message: str
+    process_id: int | None
+    request_id: str | None
+    module: str | None
+    function: str
+    line: int
+    environment: str
+    exception: NotRequired[str]
@@ -1,13 +1,19 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.concurrency import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
 
 from app.api.routes import api_router
 from app.api.v1.router import api_v1_router
 from app.api.v2.router import api_v2_router
 from app.core.config import Environment, settings
+from app.core.db import engine
 from app.core.logger import configure_uvicorn_logging, setup_logger, shutdown_logger
+from app.core.utils import close_upload_session
 from app.middleware.csrf import CSRFMiddleware
 from app.middleware.logging import LoggingMiddleware
 from app.middleware.rate_limit import RateLimitHeaderMiddleware
@@ -20,17 +26,23 @@ from app.services.cache.token_blacklist import token_blacklist
 async def _check_dependencies():
     """Check essential dependencies before starting the app"""
 
-    # Check CacheManager health
-    cache_healthy = await cache_manager.health_check()
+    # Ping all Redis-backed services concurrently so each worker boot waits
+    # for one round trip instead of one per service
+    check_blacklist = settings.current_environment != Environment.LOCAL
+    health_checks = [cache_manager.health_check(), rate_limiter.health_check()]
+    if check_blacklist:
+        health_checks.append(token_blacklist.health_check())
 
+    cache_healthy, rate_limiter_healthy, *blacklist_result = await asyncio.gather(*health_checks)
+
+    # Check CacheManager health
     if not cache_healthy and settings.cache_enabled:
         logger.error("CacheManager health check failed. Exiting application.")
         raise RuntimeError("CacheManager is not healthy.")
     else:
         logger.success("CacheManager is healthy.")
 
-    rate_limiter_healthy = await rate_limiter.health_check()
-
+    # Check RateLimiter health
     if not rate_limiter_healthy and settings.rate_limit_enabled:
         logger.error("RateLimiter health check failed. Exiting application.")
         raise RuntimeError("RateLimiter is not healthy.")
@@ -38,15 +50,31 @@ async def _check_dependencies():
         logger.success("RateLimiter is healthy.")
 
     # Check TokenBlacklist health (only in non-local environments)
-    if settings.current_environment != Environment.LOCAL:
-        blacklist_healthy = await token_blacklist.health_check()
-
-        if not blacklist_healthy:
+    if check_blacklist:
+        if not blacklist_result[0]:
             logger.warning("TokenBlacklist health check failed. Token revocation may not work.")
         else:
             logger.success("TokenBlacklist is healthy.")
 
 
+async def _warm_up_database_pool():
+    """Open the database pool's base connections before serving traffic"""
+
+    async def _ping() -> None:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    pool = engine.pool
+    pool_size = pool.size() if isinstance(pool, QueuePool) else 1
+
+    try:
+        await asyncio.gather(*(_ping() for _ in range(pool_size)))
+    except Exception as e:
+        logger.warning(f"Database pool warm-up failed: {e}")
+    else:
+        logger.success(f"Database pool warmed up with {pool_size} connections.")
+
+
 async def _shutdown_dependencies():
     """Shutdown essential dependencies gracefully"""
 
@@ -59,6 +87,8 @@ async def _shutdown_dependencies():
     await token_blacklist.close()
     logger.success("TokenBlacklist connection closed.")
 
+    await close_upload_session()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -69,6 +99,8 @@ async def lifespan(app: FastAPI):
 
     logger.info("Initializing resources...")
     await _check_dependencies()
+    await _warm_up_database_pool()
+    token_blacklist.start_revocation_listener()
     logger.success("Resources initialized.")
 
     yield  # Application runs here
@@ -79,7 +111,10 @@ async def lifespan(app: FastAPI):
     logger.success("Resources cleaned up.")
 
 
-ALLOWED_ENVIRONMENTS = {Environment.LOCAL, Environment.DEV, Environment.STG}
+ALLOWED_ENVIRONMENTS = frozenset({Environment.LOCAL, Environment.DEV, Environment.STG})
+
+# Whether the versioned apps expose their docs endpoints, fixed at startup
+DOCS_ENABLED = settings.current_environment in ALLOWED_ENVIRONMENTS
 
 app = FastAPI(
     title=settings.app_title,
@@ -95,14 +130,13 @@ app = FastAPI(
 
 def _create_versioned_app(version: str) -> FastAPI:
     """Create a mounted FastAPI sub-app with version-specific docs endpoints."""
-    docs_enabled = settings.current_environment in ALLOWED_ENVIRONMENTS
     return FastAPI(
         title=f"{settings.app_title} {version.upper()}",
         version=settings.app_version,
         description=settings.app_description,
-        openapi_url="/openapi.json" if docs_enabled else None,
-        docs_url="/docs" if docs_enabled else None,
-        redoc_url="/redoc" if docs_enabled else None,
+        openapi_url="/openapi.json" if DOCS_ENABLED else None,
+        docs_url="/docs" if DOCS_ENABLED else None,
+        redoc_url="/redoc" if DOCS_ENABLED else None,
         generate_unique_id_function=lambda route: f"{route.tags[0]}-{route.name}",
     )
 
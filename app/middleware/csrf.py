@@ -13,6 +13,10 @@ CSRF_TOKEN_LENGTH = 32
 CSRF_COOKIE_NAME = "csrf_token"
 CSRF_HEADER_NAME = "X-CSRF-Token"
 
+# CSRF checks are skipped locally; the environment is fixed for the process
+# lifetime, so resolve it once instead of on every request
+IS_LOCAL_ENVIRONMENT = settings.current_environment == Environment.LOCAL
+
 # Safe HTTP methods that don't require CSRF protection
 SAFE_METHODS = {"GET", "HEAD", "OPTIONS", "TRACE"}
 
@@ -31,12 +35,49 @@ EXEMPT_PATHS = {
     "/v2/openapi.json",
 }
 
+# Path prefixes exempt from CSRF protection (swagger assets, etc.)
+EXEMPT_PREFIXES = (
+    "/v1/docs",
+    "/v1/redoc",
+    "/v1/openapi",
+    "/v2/docs",
+    "/v2/redoc",
+    "/v2/openapi",
+)
+
 
 def generate_csrf_token() -> str:
     """Generate a cryptographically secure CSRF token."""
     return secrets.token_urlsafe(CSRF_TOKEN_LENGTH)
 
 
+def get_cookie(request: Request, name: str) -> str | None:
+    """
+    Read a single cookie straight from the Cookie header.
+
+    Stops at the first matching pair instead of building the full
+    ``request.cookies`` dict, which Starlette re-parses for every
+    Request object created along the middleware chain.
+
+    Args:
+        request: FastAPI request object
+        name: Cookie name to look up
+
+    Returns:
+        The cookie value, or None if the cookie is not present
+    """
+    cookie_header = request.headers.get("cookie")
+    if not cookie_header or name not in cookie_header:
+        return None
+
+    for chunk in cookie_header.split(";"):
+        key, sep, value = chunk.partition("=")
+        if sep and key.strip() == name:
+            return value.strip()
+
+    return None
+
+
 class CSRFMiddleware(BaseHTTPMiddleware):
     """
     Middleware implementing header-based CSRF protection.
@@ -62,21 +103,13 @@ class CSRFMiddleware(BaseHTTPMiddleware):
             return True
 
         # Check if path starts with any exempt prefix (for swagger assets, etc.)
-        exempt_prefixes = (
-            "/v1/docs",
-            "/v1/redoc",
-            "/v1/openapi",
-            "/v2/docs",
-            "/v2/redoc",
-            "/v2/openapi",
-        )
-        return any(path.startswith(prefix) for prefix in exempt_prefixes)
+        return path.startswith(EXEMPT_PREFIXES)
 
     async def dispatch(
         self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
     ) -> Response:
         # Skip CSRF in local environment for easier development
-        if settings.current_environment == Environment.LOCAL:
+        if IS_LOCAL_ENVIRONMENT:
             response = await call_next(request)
             return response
 
@@ -93,7 +126,7 @@ class CSRFMiddleware(BaseHTTPMiddleware):
             return response
 
         # Validate CSRF token for state-changing requests
-        cookie_token = request.cookies.get(CSRF_COOKIE_NAME)
+        cookie_token = get_cookie(request, CSRF_COOKIE_NAME)
         header_token = request.headers.get(CSRF_HEADER_NAME)
 
         if not cookie_token or not header_token:
@@ -116,7 +149,7 @@ class CSRFMiddleware(BaseHTTPMiddleware):
 
     def _ensure_csrf_cookie(self, request: Request, response: Response) -> None:
         """Ensure CSRF cookie is set if not present."""
-        if CSRF_COOKIE_NAME not in request.cookies:
+        if get_cookie(request, CSRF_COOKIE_NAME) is None:
             csrf_token = generate_csrf_token()
 
             # Set secure cookie attributes
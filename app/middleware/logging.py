@@ -1,11 +1,21 @@
+import json
+import os
+import re
 import time
-import uuid
 from typing import Any, Callable
 
 from fastapi import Request, Response
 from loguru import logger
 from starlette.middleware.base import BaseHTTPMiddleware, _StreamingResponse
 
+from app.core.config import settings
+
+# Whether per-request TRACE lines can reach a sink. Sinks take their level from
+# settings.log_level at startup, so this is only True with LOG_LEVEL=5 (TRACE);
+# at any other level the messages (and the User-Agent lookup) are skipped instead
+# of being built and discarded
+TRACE_ENABLED = settings.log_level <= logger.level("TRACE").no
+
 # Sensitive fields that should be redacted from logs
 # Reference: https://cheatsheetseries.owasp.org/cheatsheets/Logging_Cheat_Sheet.html
 SENSITIVE_FIELDS = {
@@ -24,40 +34,79 @@ SENSITIVE_FIELDS = {
     "private_key",
 }
 
+# All sensitive fields compiled into one alternation, so a key is scanned for
+# every field in a single pass instead of one substring search per field
+_SENSITIVE_PATTERN = re.compile("|".join(re.escape(field) for field in sorted(SENSITIVE_FIELDS)))
 
-def sanitize_body(body: dict[str, Any] | Any) -> dict[str, Any] | Any:
-    """
-    Recursively sanitize sensitive fields from request body before logging.
 
-    Args:
-        body: The request body to sanitize
+def _is_sensitive(key: str) -> bool:
+    """Whether a body key names, or contains the name of, a sensitive field."""
+    key_lower = key.lower()
+    # Exact matches are the common hit and only need a set lookup
+    return key_lower in SENSITIVE_FIELDS or _SENSITIVE_PATTERN.search(key_lower) is not None
 
-    Returns:
-        Sanitized body with sensitive fields redacted
+
+def _contains_sensitive(body: dict[str, Any]) -> bool:
     """
-    if not isinstance(body, dict):
-        return body
+    Check whether sanitize_body would redact anything in the body.
 
+    Walks the same dicts sanitize_body visits with an explicit stack, instead
+    of recursion, and stops at the first sensitive key.
+    """
+    stack = [body]
+    while stack:
+        node = stack.pop()
+        for key, value in node.items():
+            if _is_sensitive(key):
+                return True
+            if isinstance(value, dict):
+                stack.append(value)
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, dict):
+                        stack.append(item)
+    return False
+
+
+def _redact(body: dict[str, Any]) -> dict[str, Any]:
+    """Copy the body with sensitive fields redacted at any depth."""
     sanitized: dict[str, Any] = {}
     for key, value in body.items():
-        key_lower = key.lower()
-        if any(sensitive in key_lower for sensitive in SENSITIVE_FIELDS):
+        if _is_sensitive(key):
             sanitized[key] = "***REDACTED***"
         elif isinstance(value, dict):
-            sanitized[key] = sanitize_body(value)
+            sanitized[key] = _redact(value)
         elif isinstance(value, list):
-            sanitized[key] = [
-                sanitize_body(item) if isinstance(item, dict) else item for item in value
-            ]
+            sanitized[key] = [_redact(item) if isinstance(item, dict) else item for item in value]
         else:
             sanitized[key] = value
     return sanitized
 
 
+def sanitize_body(body: dict[str, Any] | Any) -> dict[str, Any] | Any:
+    """
+    Recursively sanitize sensitive fields from request body before logging.
+
+    Bodies without any sensitive field are returned as-is, so only bodies
+    that actually need redaction are copied.
+
+    Args:
+        body: The request body to sanitize
+
+    Returns:
+        Sanitized body with sensitive fields redacted
+    """
+    if not isinstance(body, dict) or not _contains_sensitive(body):
+        return body
+
+    return _redact(body)
+
+
 class LoggingMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Generate request ID for tracing
-        request_id = str(uuid.uuid4())[:8]
+        # Generate request ID for tracing (8 hex chars, same as a truncated UUID4
+        # but without building and slicing the full 36-char string)
+        request_id = os.urandom(4).hex()
 
         # Add request ID to request state
         request.state.request_id = request_id
@@ -68,22 +117,24 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         client_ip = request.client.host if request.client else "unknown"
 
         # Log request with more details
-        logger.trace(
-            f"[{request_id}] {request.method} {request.url.path} - "
-            f"Client: {client_ip} - User-Agent: {request.headers.get('user-agent', 'unknown')}",
-            request_id=request_id,
-        )
+        if TRACE_ENABLED:
+            logger.trace(
+                f"[{request_id}] {request.method} {request.url.path} - "
+                f"Client: {client_ip} - User-Agent: {request.headers.get('user-agent', 'unknown')}",
+                request_id=request_id,
+            )
 
         try:
             response: _StreamingResponse = await call_next(request)
 
             # Log response
             process_time = time.time() - start_time
-            logger.trace(
-                f"[{request_id}] {request.method} {request.url.path} - "
-                f"Status: {response.status_code} - Time: {process_time:.3f}s",
-                request_id=request_id,
-            )
+            if TRACE_ENABLED:
+                logger.trace(
+                    f"[{request_id}] {request.method} {request.url.path} - "
+                    f"Status: {response.status_code} - Time: {process_time:.3f}s",
+                    request_id=request_id,
+                )
 
             # Add request ID to response headers
             response.headers["X-Request-ID"] = request_id
@@ -95,9 +146,12 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
             json_body: Any = ""
             try:
-                json_body = await request.json()
-                # Sanitize sensitive data before logging
-                json_body = sanitize_body(json_body)
+                # Decode the raw body directly; empty bodies (e.g. GET) skip the
+                # parse and the decode error it would raise
+                raw_body = await request.body()
+                if raw_body:
+                    # Sanitize sensitive data before logging
+                    json_body = sanitize_body(json.loads(raw_body))
             except Exception:
                 json_body = ""
 
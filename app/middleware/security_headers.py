@@ -1,7 +1,4 @@
-from typing import Callable
-
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.config import Environment, settings
 
@@ -37,8 +34,61 @@ DOCS_PATH_PREFIXES = (
     "/v2/redoc",
 )
 
+HSTS_ENVIRONMENTS = frozenset({Environment.STG, Environment.PRD})
+
+# Raw (lowercase name, value) byte pairs, appended straight onto the response's
+# header list so no per-request name normalization or string building is needed
+DEFAULT_CSP_HEADER = (b"content-security-policy", DEFAULT_CSP.encode("latin-1"))
+DOCS_CSP_HEADER = (b"content-security-policy", DOCS_CSP.encode("latin-1"))
+CACHE_CONTROL_HEADER = (b"cache-control", b"no-store, no-cache, must-revalidate")
+
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+def build_security_headers(environment: Environment) -> tuple[tuple[bytes, bytes], ...]:
+    """
+    Build the static security headers sent on every response.
+
+    Args:
+        environment: Environment the application runs in
+
+    Returns:
+        tuple[tuple[bytes, bytes], ...]: Raw header name/value pairs
+    """
+    headers = [
+        # Prevent MIME-type sniffing
+        (b"x-content-type-options", b"nosniff"),
+        # Prevent clickjacking - deny all framing
+        (b"x-frame-options", b"DENY"),
+        # Legacy XSS protection (for older browsers)
+        (b"x-xss-protection", b"1; mode=block"),
+        # Control referrer information leakage
+        (b"referrer-policy", b"strict-origin-when-cross-origin"),
+        # Disable unnecessary browser features
+        (
+            b"permissions-policy",
+            b"accelerometer=(), camera=(), geolocation=(), gyroscope=(), "
+            b"magnetometer=(), microphone=(), payment=(), usb=()",
+        ),
+    ]
+
+    # HSTS - Only in production environments with HTTPS
+    if environment in HSTS_ENVIRONMENTS:
+        # max-age=31536000 (1 year), includeSubDomains for all subdomains
+        headers.append(
+            (b"strict-transport-security", b"max-age=31536000; includeSubDomains; preload")
+        )
+
+    return tuple(headers)
+
+
+SECURITY_HEADERS = build_security_headers(settings.current_environment)
+
+MANAGED_HEADER_NAMES = frozenset(
+    {name for name, _ in SECURITY_HEADERS}
+    | {b"strict-transport-security", b"content-security-policy"}
+)
+
+
+class SecurityHeadersMiddleware:
     """
     Middleware to add security headers to all responses.
 
@@ -54,58 +104,65 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         - Referrer-Policy: Controls referrer information
         - Permissions-Policy: Controls browser features
 
+    Written as a plain ASGI middleware that only rewrites the
+    ``http.response.start`` message, so response bodies stream through
+    untouched.
+
     Reference: https://cheatsheetseries.owasp.org/cheatsheets/HTTP_Headers_Cheat_Sheet.html
     """
 
-    @staticmethod
-    def _get_request_path(request: Request) -> str:
-        """Extract request path safely for mocked requests in tests."""
-        url = getattr(request, "url", None)
-        if not url:
-            return ""
-        return getattr(url, "path", "") or ""
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
     @staticmethod
     def _is_docs_ui_path(path: str) -> bool:
         """Check whether a request targets versioned Swagger/ReDoc endpoints."""
-        return any(path.startswith(prefix) for prefix in DOCS_PATH_PREFIXES)
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        response: Response = await call_next(request)
-        request_path = self._get_request_path(request)
-
-        # Prevent MIME-type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
-
-        # Prevent clickjacking - deny all framing
-        response.headers["X-Frame-Options"] = "DENY"
+        return path.startswith(DOCS_PATH_PREFIXES)
 
-        # Legacy XSS protection (for older browsers)
-        response.headers["X-XSS-Protection"] = "1; mode=block"
+    @staticmethod
+    def _apply_security_headers(
+        headers: list[tuple[bytes, bytes]], csp_header: tuple[bytes, bytes]
+    ) -> list[tuple[bytes, bytes]]:
+        """
+        Merge the security headers into a response's raw header list.
+
+        Args:
+            headers: Raw header pairs produced by the wrapped application
+            csp_header: Content-Security-Policy pair for the request path
+
+        Returns:
+            list[tuple[bytes, bytes]]: Header pairs to send to the client
+        """
+        present = {name for name, _ in headers}
+
+        # Managed headers replace any value set upstream instead of duplicating it
+        if present.isdisjoint(MANAGED_HEADER_NAMES):
+            merged = list(headers)
+        else:
+            merged = [header for header in headers if header[0] not in MANAGED_HEADER_NAMES]
+
+        merged.extend(SECURITY_HEADERS)
+        merged.append(csp_header)
 
-        # Control referrer information leakage
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        # Prevent caching of sensitive responses (can be overridden per-endpoint)
+        if b"cache-control" not in present:
+            merged.append(CACHE_CONTROL_HEADER)
 
-        # Disable unnecessary browser features
-        response.headers["Permissions-Policy"] = (
-            "accelerometer=(), camera=(), geolocation=(), gyroscope=(), "
-            "magnetometer=(), microphone=(), payment=(), usb=()"
-        )
+        return merged
 
-        # HSTS - Only in production environments with HTTPS
-        if settings.current_environment in {Environment.STG, Environment.PRD}:
-            # max-age=31536000 (1 year), includeSubDomains for all subdomains
-            response.headers["Strict-Transport-Security"] = (
-                "max-age=31536000; includeSubDomains; preload"
-            )
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
         # Use a docs-friendly CSP only for Swagger/ReDoc routes.
-        response.headers["Content-Security-Policy"] = (
-            DOCS_CSP if self._is_docs_ui_path(request_path) else DEFAULT_CSP
-        )
+        csp_header = DOCS_CSP_HEADER if self._is_docs_ui_path(scope["path"]) else DEFAULT_CSP_HEADER
 
-        # Prevent caching of sensitive responses (can be overridden per-endpoint)
-        if "Cache-Control" not in response.headers:
-            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = self._apply_security_headers(
+                    message.get("headers", []), csp_header
+                )
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_security_headers)
@@ -1,8 +1,9 @@
-import re
 from datetime import datetime
+from functools import cache
+from string import ascii_uppercase
 from typing import Any, Optional
 
-from sqlalchemy import BigInteger, DateTime, func
+from sqlalchemy import BigInteger, DateTime, Identity, func
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -14,13 +15,29 @@ from sqlalchemy.orm import (
 from app.core.db import meta
 
 
+def camel_to_snake(name: str) -> str:
+    """
+    Convert a CamelCase class name to a snake_case table name.
+
+    Args:
+        name (str): The CamelCase name, e.g. ``UserProfile``.
+
+    Returns:
+        snake_name (str): The snake_case name, e.g. ``user_profile``.
+    """
+    return (
+        name[:1] + "".join(f"_{ch}" if ch in ascii_uppercase else ch for ch in name[1:])
+    ).lower()
+
+
 class Base(DeclarativeBase):
     """Base class for all database models"""
 
     __abstract__ = True
 
     metadata = meta
-    id: Mapped[int] = mapped_column(BigInteger(), autoincrement=True, primary_key=True, index=True)
+    # Identity column; each connection reserves a block of ids per sequence access
+    id: Mapped[int] = mapped_column(BigInteger(), Identity(start=1, cache=1000), primary_key=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
@@ -28,7 +45,18 @@ class Base(DeclarativeBase):
 
     @declared_attr.directive
     def __tablename__(cls) -> str:
-        return re.sub(r"(?<!^)(?=[A-Z])", "_", cls.__name__).lower()
+        return camel_to_snake(cls.__name__)
+
+    @classmethod
+    @cache
+    def _column_keys(cls) -> tuple[str, ...]:
+        """
+        Get the column attribute keys of the model, computed once per class.
+
+        Returns:
+            column_keys (tuple[str, ...]): The mapped column attribute keys.
+        """
+        return tuple(class_mapper(cls).c.keys())
 
     def to_dict(
         self,
@@ -47,12 +75,15 @@ class Base(DeclarativeBase):
         """
         exclude_keys = exclude_keys or set()
         serialized_data = {}
+        # Loaded column values live in the instance __dict__; only unloaded
+        # ones need to go through the attribute machinery
+        loaded_values = self.__dict__
 
-        for key in class_mapper(self.__class__).c.keys():
+        for key in self._column_keys():
             if key in exclude_keys:
                 continue
 
-            value = getattr(self, key)
+            value = loaded_values[key] if key in loaded_values else getattr(self, key)
 
             if exclude_none and value is None:
                 continue
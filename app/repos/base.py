@@ -1,17 +1,110 @@
+import dataclasses
 import uuid
-from typing import Any, Generic, Sequence, Type, TypeVar
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, AsyncIterator, Generic, Sequence, Type, TypeVar, cast
 
 from pydantic import BaseModel
-from sqlalchemy import delete, insert, select, text, update
+from sqlalchemy import (
+    Integer,
+    Select,
+    Table,
+    bindparam,
+    column,
+    delete,
+    insert,
+    select,
+    text,
+    update,
+    values,
+)
 from sqlalchemy.engine import Result
 from sqlalchemy.exc import MultipleResultsFound
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, class_mapper
+from sqlalchemy.sql.dml import ReturningDelete
 
 from app.models.base import Base
 
+if TYPE_CHECKING:
+    from _typeshed import DataclassInstance
+
 Model = TypeVar("Model", bound=Base)
-CreateSchema = TypeVar("CreateSchema", bound=BaseModel)
-UpdateSchema = TypeVar("UpdateSchema", bound=BaseModel)
+# Write schemas are pydantic models, or plain dataclasses for internal DTOs
+CreateSchema = TypeVar("CreateSchema", bound="BaseModel | DataclassInstance")
+UpdateSchema = TypeVar("UpdateSchema", bound="BaseModel | DataclassInstance")
+
+
+# Column attributes resolved by BaseRepository._get_column, per (model, column name)
+_column_cache: dict[tuple[type[Base], str], InstrumentedAttribute[Any]] = {}
+
+# Statements looked up by a single id column, per (model, column name). The id
+# is bound at execution time through the "obj_id" parameter.
+_select_by_id_cache: dict[tuple[type[Base], str], Select[Any]] = {}
+_delete_by_id_cache: dict[tuple[type[Base], str], ReturningDelete[Any]] = {}
+
+# Value types that model_dump returns unchanged in python mode
+_PLAIN_VALUE_TYPES = frozenset(
+    {str, int, float, bool, bytes, type(None), uuid.UUID, Decimal, datetime, date, time}
+)
+
+# Whether a schema class dumps to exactly its instance __dict__ when every value
+# is plain, i.e. it has no computed fields, custom serializers or extra fields
+_plain_schema_cache: dict[type[BaseModel], bool] = {}
+
+# Field names of dataclass write schemas, per dataclass
+_dataclass_fields_cache: dict[type, tuple[str, ...]] = {}
+
+
+def dump_schema(schema: "BaseModel | DataclassInstance", exclude_none: bool) -> dict[str, Any]:
+    """
+    Dump a schema to column values, reading its fields directly when possible.
+
+    Flat schemas (the common create/update case) are read from the instance
+    ``__dict__``, skipping the serializer walk. Anything model_dump would
+    transform, such as nested models, falls back to ``model_dump``. Dataclass
+    schemas are read field by field; their values are used as-is.
+
+    Args:
+        schema (BaseModel | DataclassInstance): The schema to dump.
+        exclude_none (bool): Whether to exclude None values.
+
+    Returns:
+        values (dict[str, Any]): The field values keyed by field name.
+    """
+    if not isinstance(schema, BaseModel):
+        field_names = _dataclass_fields_cache.get(type(schema))
+        if field_names is None:
+            field_names = tuple(field.name for field in dataclasses.fields(schema))
+            _dataclass_fields_cache[type(schema)] = field_names
+
+        if exclude_none:
+            return {
+                name: value for name in field_names if (value := getattr(schema, name)) is not None
+            }
+        return {name: getattr(schema, name) for name in field_names}
+
+    schema_cls = type(schema)
+    is_plain_schema = _plain_schema_cache.get(schema_cls)
+    if is_plain_schema is None:
+        decorators = schema_cls.__pydantic_decorators__
+        is_plain_schema = not (
+            schema_cls.model_computed_fields
+            or decorators.field_serializers
+            or decorators.model_serializers
+            or schema_cls.model_config.get("extra") == "allow"
+        )
+        _plain_schema_cache[schema_cls] = is_plain_schema
+
+    fields = schema.__dict__
+    if not is_plain_schema or not all(
+        type(value) in _PLAIN_VALUE_TYPES for value in fields.values()
+    ):
+        return schema.model_dump(exclude_none=exclude_none)
+
+    if exclude_none:
+        return {key: value for key, value in fields.items() if value is not None}
+    return dict(fields)
 
 
 class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
@@ -30,31 +123,102 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
         self.session = session
         self.model = model
 
-    def _validate_column_exists(self, column_name: str) -> None:
+    def _get_column(self, column_name: str) -> InstrumentedAttribute[Any]:
         """
-        Validate that a column exists on the model.
+        Get a column attribute of the model, validating it on first use.
+
+        Resolved attributes are cached per (model, column name), so repeated
+        lookups on the request path skip the validation.
 
         Args:
-            column_name (str): The name of the column to validate.
+            column_name (str): The name of the column to get.
+
+        Returns:
+            column (InstrumentedAttribute[Any]): The model's column attribute.
 
         Raises:
             ValueError: If the column doesn't exist on the model.
         """
-        if not hasattr(self.model, column_name):
+        cache_key = (self.model, column_name)
+        column = _column_cache.get(cache_key)
+        if column is not None:
+            return column
+
+        try:
+            column = getattr(self.model, column_name)
+        except AttributeError:
             raise ValueError(
                 f"Column '{column_name}' does not exist on model {self.model.__name__}"
-            )
+            ) from None
 
         # Additional check for SQLAlchemy column attributes
-        try:
-            getattr(self.model, column_name)
-        except AttributeError:
+        if not isinstance(column, InstrumentedAttribute):
             raise ValueError(
                 f"Column '{column_name}' is not a valid SQLAlchemy column on model {self.model.__name__}"
             )
 
+        _column_cache[cache_key] = column
+        return column
+
+    def _select_by_id_stmt(self, column_name: str) -> Select[Any]:
+        """
+        Get the cached SELECT matching one value of an id column.
+
+        Args:
+            column_name (str): The name of the id column.
+
+        Returns:
+            stmt (Select[Any]): Statement with an ``obj_id`` bind parameter.
+
+        Raises:
+            ValueError: If the column doesn't exist on the model.
+        """
+        cache_key = (self.model, column_name)
+        stmt = _select_by_id_cache.get(cache_key)
+        if stmt is None:
+            id_column = self._get_column(column_name)
+            stmt = select(self.model).where(id_column == bindparam("obj_id"))
+            _select_by_id_cache[cache_key] = stmt
+
+        return stmt
+
+    def _delete_by_id_stmt(self, column_name: str) -> ReturningDelete[Any]:
+        """
+        Get the cached DELETE matching one value of an id column.
+
+        Args:
+            column_name (str): The name of the id column.
+
+        Returns:
+            stmt (ReturningDelete[Any]): Statement with an ``obj_id`` bind parameter,
+                returning the deleted ids.
+
+        Raises:
+            ValueError: If the column doesn't exist on the model.
+        """
+        cache_key = (self.model, column_name)
+        stmt = _delete_by_id_cache.get(cache_key)
+        if stmt is None:
+            id_column = self._get_column(column_name)
+            stmt = delete(self.model).where(id_column == bindparam("obj_id")).returning(id_column)
+            _delete_by_id_cache[cache_key] = stmt
+
+        return stmt
+
+    def _validate_column_exists(self, column_name: str) -> None:
+        """
+        Validate that a column exists on the model.
+
+        Args:
+            column_name (str): The name of the column to validate.
+
+        Raises:
+            ValueError: If the column doesn't exist on the model.
+        """
+        self._get_column(column_name)
+
     async def create_one(
-        self, schema: CreateSchema, exclude_none: bool = True, auto_commit: bool = True
+        self, schema: CreateSchema, exclude_none: bool = True, auto_commit: bool = False
     ) -> Model:
         """
         Create a new object in the database.
@@ -62,8 +226,8 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
         Args:
             schema (CreateSchema): The data to create the object.
             exclude_none (bool): Whether to exclude None values from the creation.
-            auto_commit (bool): Whether to commit the transaction. Pass False when
-                deps layer coordinates multi-step transactions.
+            auto_commit (bool): Whether to commit the transaction. Defaults to False
+                so the deps layer can commit a multi-step unit of work once.
 
         Returns:
             created_object (Model): The created object.
@@ -71,11 +235,7 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
         Raises:
             Exception: If the object creation fails.
         """
-        stmt = (
-            insert(self.model)
-            .values(**schema.model_dump(exclude_none=exclude_none))
-            .returning(self.model)
-        )
+        stmt = insert(self.model).values(**dump_schema(schema, exclude_none)).returning(self.model)
         result = await self.session.execute(stmt)
         if auto_commit:
             await self.session.commit()
@@ -85,7 +245,7 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
         self,
         schemas: Sequence[CreateSchema],
         exclude_none: bool = True,
-        auto_commit: bool = True,
+        auto_commit: bool = False,
     ) -> Sequence[Model]:
         """
         Create multiple objects in the database.
@@ -93,8 +253,8 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
         Args:
             schemas (Sequence[CreateSchema]): The list of data to create objects.
             exclude_none (bool): Whether to exclude None values from the creation.
-            auto_commit (bool): Whether to commit the transaction. Pass False when
-                deps layer coordinates multi-step transactions.
+            auto_commit (bool): Whether to commit the transaction. Defaults to False
+                so the deps layer can commit a multi-step unit of work once.
 
         Returns:
             created_objects (Sequence[Model]): The Sequence of created objects.
@@ -105,7 +265,7 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
         if not schemas:
             return []
 
-        values = [schema.model_dump(exclude_none=exclude_none) for schema in schemas]
+        values = [dump_schema(schema, exclude_none) for schema in schemas]
         stmt = insert(self.model).values(values).returning(self.model)
         result = await self.session.execute(stmt)
         if auto_commit:
@@ -113,6 +273,99 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
 
         return result.scalars().all()
 
+    async def create_bulk_ids(
+        self,
+        schemas: Sequence[CreateSchema],
+        exclude_none: bool = True,
+        auto_commit: bool = False,
+        id_column_name: str = "id",
+    ) -> Sequence[Any]:
+        """
+        Create multiple objects in the database, returning only their IDs.
+
+        Unlike ``create_bulk``, the INSERT only returns the ID column, so wide
+        rows are not sent back over the wire. Callers that later need the full
+        objects can load them in one query with ``get_multi_by_ids``.
+
+        Args:
+            schemas (Sequence[CreateSchema]): The list of data to create objects.
+            exclude_none (bool): Whether to exclude None values from the creation.
+            auto_commit (bool): Whether to commit the transaction. Defaults to False
+                so the deps layer can commit a multi-step unit of work once.
+            id_column_name (str): The name of the ID column in the model.
+
+        Returns:
+            created_ids (Sequence[Any]): The IDs of the created objects.
+
+        Raises:
+            ValueError: If the id_column_name doesn't exist on the model.
+        """
+        if not schemas:
+            return []
+
+        id_column = self._get_column(id_column_name)
+        values = [dump_schema(schema, exclude_none) for schema in schemas]
+        stmt = insert(self.model).values(values).returning(id_column)
+        result = await self.session.execute(stmt)
+        if auto_commit:
+            await self.session.commit()
+
+        return result.scalars().all()
+
+    async def create_bulk_copy(
+        self,
+        schemas: Sequence[CreateSchema],
+        exclude_none: bool = True,
+        auto_commit: bool = False,
+    ) -> int:
+        """
+        Create many objects in the database using PostgreSQL COPY.
+
+        COPY skips the per-row parse/plan work of a multi-row INSERT, which makes
+        it several times faster for large loads (thousands of rows). It does not
+        return the created rows; use ``create_bulk`` when they are needed.
+
+        Columns missing from a schema dump are written as NULL, so column
+        server defaults only apply to columns no schema sets at all.
+
+        Args:
+            schemas (Sequence[CreateSchema]): The list of data to create objects.
+            exclude_none (bool): Whether to exclude None values from the creation.
+            auto_commit (bool): Whether to commit the transaction. Defaults to False
+                so the deps layer can commit a multi-step unit of work once.
+
+        Returns:
+            created_count (int): The number of rows copied into the table.
+
+        Raises:
+            Exception: If the bulk copy fails.
+        """
+        if not schemas:
+            return 0
+
+        values = [dump_schema(schema, exclude_none) for schema in schemas]
+        # Union of keys in first-seen order, mapped from attribute keys to column names
+        keys = list(dict.fromkeys(key for row in values for key in row))
+        model_columns = class_mapper(self.model).columns
+        records = [tuple(row.get(key) for key in keys) for row in values]
+
+        # COPY runs on the session's own connection, inside its open transaction
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        asyncpg_connection = cast(Any, raw_connection.driver_connection)
+        table = cast(Table, self.model.__table__)
+        status = await asyncpg_connection.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=[model_columns[key].name for key in keys],
+            schema_name=table.schema,
+        )
+        if auto_commit:
+            await self.session.commit()
+
+        # asyncpg returns the command status, e.g. "COPY 1000"
+        return int(status.rsplit(" ", 1)[-1])
+
     async def get_by_id(
         self,
         obj_id: str | int | uuid.UUID,
@@ -126,16 +379,16 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
             id_column_name (str): The name of the ID column in the model.
 
         Returns:
-            Model | None: The retrieved object or None if not found.
+            Model | None: The retrieved object or None if not found. If the
+                column is not unique, the first matching row is returned.
 
         Raises:
             ValueError: If the id_column_name doesn't exist on the model.
         """
-        self._validate_column_exists(id_column_name)
-        stmt = select(self.model).where(getattr(self.model, id_column_name) == obj_id)
-        result = await self.session.execute(stmt)
+        stmt = self._select_by_id_stmt(id_column_name)
+        obj: Model | None = await self.session.scalar(stmt, {"obj_id": obj_id})
 
-        return result.scalar_one_or_none()
+        return obj
 
     async def get_multi_by_ids(
         self,
@@ -156,16 +409,80 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
         Returns:
             retrieved_objects (Sequence[Model]): A Sequence of retrieved objects.
         """
-        self._validate_column_exists(id_column_name)
         stmt = (
             select(self.model)
-            .where(getattr(self.model, id_column_name).in_(obj_ids))
+            .where(self._get_column(id_column_name).in_(obj_ids))
             .offset(skip)
             .limit(limit)
         )
-        result = await self.session.execute(stmt)
 
-        return result.scalars().all()
+        return (await self.session.scalars(stmt)).all()
+
+    async def iter_multi_by_ids(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        id_column_name: str = "id",
+        obj_ids: Sequence[str | int | uuid.UUID] = [],
+        yield_per: int = 100,
+    ) -> AsyncIterator[Model]:
+        """
+        Stream multiple objects from the database through a server-side cursor.
+
+        Unlike ``get_multi_by_ids``, rows are fetched ``yield_per`` at a time
+        and yielded as they arrive instead of being collected into a list,
+        so large pages can be piped to a streaming response.
+
+        Args:
+            skip (int): The number of records to skip.
+            limit (int): The maximum number of records to retrieve.
+            id_column_name (str): The name of the ID column in the model.
+            obj_ids (Sequence[str | int | uuid.UUID]): The IDs of the objects to retrieve
+            yield_per (int): The number of rows fetched from the cursor per batch.
+
+        Yields:
+            retrieved_object (Model): Each retrieved object.
+        """
+        stmt = (
+            select(self.model)
+            .where(self._get_column(id_column_name).in_(obj_ids))
+            .offset(skip)
+            .limit(limit)
+            .execution_options(yield_per=yield_per)
+        )
+        result = await self.session.stream_scalars(stmt)
+
+        async for obj in result:
+            yield obj
+
+    async def existing_ids(
+        self,
+        obj_ids: Sequence[str | int | uuid.UUID],
+        id_column_name: str = "id",
+    ) -> set[Any]:
+        """
+        Get which of the given IDs exist, without loading the objects.
+
+        Only the ID column is selected, so existence checks skip loading
+        full ORM objects.
+
+        Args:
+            obj_ids (Sequence[str | int | uuid.UUID]): The IDs to check.
+            id_column_name (str): The name of the ID column in the model.
+
+        Returns:
+            existing (set[Any]): The subset of ``obj_ids`` present in the table.
+
+        Raises:
+            ValueError: If the id_column_name doesn't exist on the model.
+        """
+        id_column = self._get_column(id_column_name)
+        if not obj_ids:
+            return set()
+
+        stmt = select(id_column).where(id_column.in_(obj_ids))
+
+        return set((await self.session.scalars(stmt)).all())
 
     async def update_by_id(
         self,
@@ -173,7 +490,7 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
         schema: UpdateSchema,
         id_column_name: str = "id",
         exclude_none: bool = True,
-        auto_commit: bool = True,
+        auto_commit: bool = False,
     ) -> Model | None:
         """
         Update an object by its ID.
@@ -183,8 +500,8 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
             schema (UpdateSchema): The data to update the object.
             id_column_name (str): The name of the ID column in the model.
             exclude_none (bool): Whether to exclude None values from the update.
-            auto_commit (bool): Whether to commit the transaction. Pass False when
-                deps layer coordinates multi-step transactions.
+            auto_commit (bool): Whether to commit the transaction. Defaults to False
+                so the deps layer can commit a multi-step unit of work once.
 
         Returns:
             updated_object (Model | None): The updated object or None if not found.
@@ -192,7 +509,7 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
         Raises:
             ValueError: If the id_column_name doesn't exist on the model.
         """
-        self._validate_column_exists(id_column_name)
+        id_column = self._get_column(id_column_name)
         existing = await self.get_by_id(obj_id, id_column_name)
 
         if not existing:
@@ -200,8 +517,8 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
 
         stmt = (
             update(self.model)
-            .where(getattr(self.model, id_column_name) == obj_id)
-            .values(**schema.model_dump(exclude_none=exclude_none))
+            .where(id_column == obj_id)
+            .values(**dump_schema(schema, exclude_none))
             .returning(self.model)
         )
         result = await self.session.execute(stmt)
@@ -215,13 +532,17 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
         updates: Sequence[tuple[str | int | uuid.UUID, UpdateSchema]],
         id_column_name: str = "id",
         exclude_none: bool = True,
-        auto_commit: bool = True,
+        auto_commit: bool = False,
         *,
         allow_multiple: bool = False,
     ) -> list[Model]:
         """
         Update multiple objects by identifier values.
 
+        All tuples that update the same set of columns are applied by a single
+        ``UPDATE ... FROM (VALUES ...)`` statement. Repeated identifiers are
+        merged, with later tuples overriding earlier ones per column.
+
         By default each update tuple is expected to match at most one row. If a
         tuple matches multiple rows (for example when ``id_column_name`` refers
         to a non-unique column), the in-flight transaction is rolled back and
@@ -232,8 +553,8 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
             updates (Sequence[tuple[str | int | uuid.UUID, UpdateSchema]]): List of tuples containing (identifier_value, update_data).
             id_column_name (str): The name of the identifier column in the model.
             exclude_none (bool): Whether to exclude None values from the update.
-            auto_commit (bool): Whether to commit the transaction. Pass False when
-                deps layer coordinates multi-step transactions.
+            auto_commit (bool): Whether to commit the transaction. Defaults to False
+                so the deps layer can commit a multi-step unit of work once.
             allow_multiple (bool): When False (default), enforce a single-row
                 match per update tuple and raise ``MultipleResultsFound`` if a
                 tuple updates more than one row. When True, allow a single
@@ -251,39 +572,52 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
         if not updates:
             return []
 
-        self._validate_column_exists(id_column_name)
-        updated_objects: list[Model] = []
+        id_column = self._get_column(id_column_name)
+        model_columns = class_mapper(self.model).columns
 
+        # Merge repeated identifiers so the last value for each column wins, as
+        # it would when applying the updates one after another
+        merged_updates: dict[str | int | uuid.UUID, dict[str, Any]] = {}
         for obj_id, update_schema in updates:
+            merged_updates.setdefault(obj_id, {}).update(dump_schema(update_schema, exclude_none))
+
+        # One UPDATE ... FROM (VALUES ...) per distinct set of updated columns
+        # (usually just one), instead of one statement per identifier
+        groups: dict[tuple[str, ...], list[tuple[int, str | int | uuid.UUID, dict[str, Any]]]] = {}
+        for index, (obj_id, row) in enumerate(merged_updates.items()):
+            groups.setdefault(tuple(row), []).append((index, obj_id, row))
+
+        rows_by_index: dict[int, list[Model]] = {}
+        for keys, group in groups.items():
+            update_values = values(
+                column("_bulk_index", Integer()),
+                column("_bulk_id", id_column.type),
+                *(column(key, model_columns[key].type) for key in keys),
+                name="bulk_update_values",
+            ).data([(index, obj_id, *(row[key] for key in keys)) for index, obj_id, row in group])
             stmt = (
                 update(self.model)
-                .where(getattr(self.model, id_column_name) == obj_id)
-                .values(**update_schema.model_dump(exclude_none=exclude_none))
-                .returning(self.model)
+                .where(id_column == update_values.c._bulk_id)
+                .values({key: update_values.c[key] for key in keys})
+                .returning(self.model, update_values.c._bulk_index)
             )
             result = await self.session.execute(stmt)
+            for updated_row, index in result.tuples():
+                rows_by_index.setdefault(index, []).append(updated_row)
 
-            if allow_multiple:
-                updated_rows = result.scalars().all()
-                if not updated_rows:
-                    continue
-                updated_objects.extend(updated_rows)
-                continue
+        updated_objects: list[Model] = []
+        for index, obj_id in enumerate(merged_updates):
+            updated_rows = rows_by_index.get(index, [])
 
-            try:
-                updated_row = result.scalar_one_or_none()
-            except MultipleResultsFound:
+            if len(updated_rows) > 1 and not allow_multiple:
                 await self.session.rollback()
                 raise MultipleResultsFound(
                     f"update_bulk matched multiple rows for "
                     f"{self.model.__name__}.{id_column_name} == {obj_id!r}; "
                     "pass allow_multiple=True to permit multi-row updates."
-                ) from None
+                )
 
-            if updated_row is None:
-                continue
-
-            updated_objects.append(updated_row)
+            updated_objects.extend(updated_rows)
 
         if auto_commit:
             await self.session.commit()
@@ -293,7 +627,7 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
         self,
         obj_id: str | int | uuid.UUID,
         id_column_name: str = "id",
-        auto_commit: bool = True,
+        auto_commit: bool = False,
         *,
         allow_multiple: bool = False,
     ) -> bool:
@@ -309,8 +643,8 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
         Args:
             obj_id (str | int | uuid.UUID): The ID of the object to delete.
             id_column_name (str): The name of the ID column in the model.
-            auto_commit (bool): Whether to commit the transaction. Pass False when
-                deps layer coordinates multi-step transactions.
+            auto_commit (bool): Whether to commit the transaction. Defaults to False
+                so the deps layer can commit a multi-step unit of work once.
             allow_multiple (bool): When False (default), enforce a single-row
                 match and raise ``MultipleResultsFound`` if the identifier
                 deletes more than one row. When True, allow a single call to
@@ -325,10 +659,8 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
                 identifier matches more than one row. The session is rolled
                 back before raising, regardless of ``auto_commit``.
         """
-        self._validate_column_exists(id_column_name)
-        id_column = getattr(self.model, id_column_name)
-        stmt = delete(self.model).where(id_column == obj_id).returning(id_column)
-        result = await self.session.execute(stmt)
+        stmt = self._delete_by_id_stmt(id_column_name)
+        result = await self.session.execute(stmt, {"obj_id": obj_id})
         deleted_count = len(result.scalars().all())
 
         if deleted_count > 1 and not allow_multiple:
@@ -348,7 +680,7 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
         self,
         obj_ids: Sequence[str | int | uuid.UUID],
         id_column_name: str = "id",
-        auto_commit: bool = True,
+        auto_commit: bool = False,
     ) -> int:
         """
         Delete multiple objects by their IDs.
@@ -356,8 +688,8 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
         Args:
             obj_ids (Sequence[str | int | uuid.UUID]): The IDs of the objects to delete.
             id_column_name (str): The name of the ID column in the model.
-            auto_commit (bool): Whether to commit the transaction. Pass False when
-                deps layer coordinates multi-step transactions.
+            auto_commit (bool): Whether to commit the transaction. Defaults to False
+                so the deps layer can commit a multi-step unit of work once.
 
         Returns:
             deleted_count (int): The number of physical rows deleted. When
@@ -370,8 +702,7 @@ class BaseRepository(Generic[Model, CreateSchema, UpdateSchema]):
         if not obj_ids:
             return 0
 
-        self._validate_column_exists(id_column_name)
-        id_column = getattr(self.model, id_column_name)
+        id_column = self._get_column(id_column_name)
         stmt = delete(self.model).where(id_column.in_(obj_ids)).returning(id_column)
         result = await self.session.execute(stmt)
         deleted_count = len(result.scalars().all())
@@ -1,12 +1,26 @@
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
 from app.repos import BaseRepository
+from app.repos.base import dump_schema
 from app.schemas import UserCreate, UserUpdate
 
+_username_match = User.username == bindparam("identifier")
+
 
 class UserRepo(BaseRepository[User, UserCreate, UserUpdate]):
+    # Built once so every lookup reuses the same statement and its cached compilation
+    _GET_BY_USERNAME_STMT = select(User).where(User.username == bindparam("username"))
+    _GET_BY_EMAIL_STMT = select(User).where(User.email == bindparam("email"))
+    _GET_BY_IDENTIFIER_STMT = (
+        select(User)
+        .where(_username_match | (User.email == bindparam("identifier")))
+        .order_by(_username_match.desc())
+        .limit(1)
+    )
+
     def __init__(self, session: AsyncSession):
         """User repository for database operations"""
         super().__init__(session, User)
@@ -21,10 +35,11 @@ class UserRepo(BaseRepository[User, UserCreate, UserUpdate]):
         Returns:
             User | None: The user object if found, else None.
         """
-        query = select(self.model).where(self.model.username == username)
-        result = await self.session.execute(query)
+        user: User | None = await self.session.scalar(
+            self._GET_BY_USERNAME_STMT, {"username": username}
+        )
 
-        return result.scalar_one_or_none()
+        return user
 
     async def get_by_email(self, email: str) -> User | None:
         """
@@ -36,7 +51,56 @@ class UserRepo(BaseRepository[User, UserCreate, UserUpdate]):
         Returns:
             User | None: The user object if found, else None.
         """
-        query = select(self.model).where(self.model.email == email)
-        result = await self.session.execute(query)
+        user: User | None = await self.session.scalar(self._GET_BY_EMAIL_STMT, {"email": email})
+
+        return user
+
+    async def get_by_identifier(self, identifier: str) -> User | None:
+        """
+        Get a user by username or email in a single query
+
+        An exact username match wins if the identifier happens to match one
+        user's username and another user's email.
+
+        Args:
+            identifier (str): The username or email of the user.
+
+        Returns:
+            User | None: The user object if found, else None.
+        """
+        user: User | None = await self.session.scalar(
+            self._GET_BY_IDENTIFIER_STMT, {"identifier": identifier}
+        )
+
+        return user
+
+    async def create_if_absent(
+        self, schema: UserCreate, exclude_none: bool = True, auto_commit: bool = False
+    ) -> User | None:
+        """
+        Create a user unless the username or email is already taken
+
+        The uniqueness check happens inside the INSERT (``ON CONFLICT DO
+        NOTHING``), so there is no separate lookup round trip and no window
+        for a concurrent signup to slip in between the check and the insert.
+
+        Args:
+            schema (UserCreate): The data to create the user.
+            exclude_none (bool): Whether to exclude None values from the creation.
+            auto_commit (bool): Whether to commit the transaction. Defaults to False
+                so the deps layer can commit a multi-step unit of work once.
+
+        Returns:
+            User | None: The created user, or None if the username or email exists.
+        """
+        stmt = (
+            pg_insert(self.model)
+            .values(**dump_schema(schema, exclude_none))
+            .on_conflict_do_nothing()
+            .returning(self.model)
+        )
+        user: User | None = await self.session.scalar(stmt)
+        if auto_commit:
+            await self.session.commit()
 
-        return result.scalar_one_or_none()
+        return user
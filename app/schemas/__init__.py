@@ -1,43 +1,66 @@
-from .base import BaseSchema, BaseTimestampSchema
-from .health_check import HealthCheckResponse
-from .user import UserResponse, UserCreate, UserUpdate, UserLogin, UserSignup
-from .token import Token, TokenPayload, TokenData, LogoutResponse
-from .back_blaze_bucket import (
-    ApplicationData,
-    FileDownloadLink,
-    UploadedFileInfo,
-)
-from .firebase import (
-    FirebaseTokenData,
-    FirebaseSignInResponse,
-    FirebaseSignUpResponse,
-)
-from .google_bucket import (
-    ServiceAccount,
-    BucketFile,
-    BucketFolder,
-)
-
-__all__ = [
-    "BaseSchema",
-    "BaseTimestampSchema",
-    "HealthCheckResponse",
-    "UserCreate",
-    "UserUpdate",
-    "UserLogin",
-    "UserSignup",
-    "UserResponse",
-    "Token",
-    "TokenPayload",
-    "TokenData",
-    "LogoutResponse",
-    "ApplicationData",
-    "FileDownloadLink",
-    "UploadedFileInfo",
-    "FirebaseTokenData",
-    "FirebaseSignInResponse",
-    "FirebaseSignUpResponse",
-    "ServiceAccount",
-    "BucketFile",
-    "BucketFolder",
-]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import BaseSchema, BaseTimestampSchema
+    from .health_check import HealthCheckResponse
+    from .user import UserResponse, UserCreate, UserUpdate, UserLogin, UserSignup
+    from .token import Token, TokenPayload, TokenData, LogoutResponse
+    from .back_blaze_bucket import (
+        ApplicationData,
+        FileDownloadLink,
+        UploadedFileInfo,
+    )
+    from .firebase import (
+        FirebaseTokenData,
+        FirebaseSignInResponse,
+        FirebaseSignUpResponse,
+    )
+    from .google_bucket import (
+        ServiceAccount,
+        BucketFile,
+        BucketFolder,
+    )
+
+# Submodule defining each exported schema. Submodules are imported on first
+# attribute access (PEP 562), so importing one schema does not build them all.
+_SCHEMA_MODULES = {
+    "BaseSchema": "base",
+    "BaseTimestampSchema": "base",
+    "HealthCheckResponse": "health_check",
+    "UserCreate": "user",
+    "UserUpdate": "user",
+    "UserLogin": "user",
+    "UserSignup": "user",
+    "UserResponse": "user",
+    "Token": "token",
+    "TokenPayload": "token",
+    "TokenData": "token",
+    "LogoutResponse": "token",
+    "ApplicationData": "back_blaze_bucket",
+    "FileDownloadLink": "back_blaze_bucket",
+    "UploadedFileInfo": "back_blaze_bucket",
+    "FirebaseTokenData": "firebase",
+    "FirebaseSignInResponse": "firebase",
+    "FirebaseSignUpResponse": "firebase",
+    "ServiceAccount": "google_bucket",
+    "BucketFile": "google_bucket",
+    "BucketFolder": "google_bucket",
+}
+
+__all__ = tuple(_SCHEMA_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _SCHEMA_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -1,6 +1,43 @@
+import re
 from datetime import datetime
+from typing import Annotated, Any, TypedDict
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import AfterValidator, BaseModel, ConfigDict, TypeAdapter, WithJsonSchema
+
+_EMAIL_SHAPE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def _check_email_shape(value: str) -> str:
+    """
+    Check that a value looks like an email address.
+
+    Args:
+        value: The email address to check
+
+    Returns:
+        str: The unchanged value
+
+    Raises:
+        ValueError: If the value is not shaped like an email address
+    """
+    if _EMAIL_SHAPE.fullmatch(value) is None:
+        raise ValueError("value is not a valid email address")
+
+    return value
+
+
+# Shape-only email check for addresses that were already validated with EmailStr
+# where they entered the app (signup), or that come from a trusted provider.
+# Skips email-validator's normalization and deliverability checks.
+TrustedEmail = Annotated[
+    str,
+    AfterValidator(_check_email_shape),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+# Per-schema serializers over a TypedDict mirror of the schema's fields,
+# built on first use by BaseSchema.dump_trusted_json
+_trusted_json_adapters: dict[type["BaseSchema"], TypeAdapter[Any]] = {}
 
 
 class BaseSchema(BaseModel):
@@ -10,8 +47,35 @@ class BaseSchema(BaseModel):
         from_attributes=True,
         arbitrary_types_allowed=True,
         extra="forbid",
+        # Pass nested schema instances through as-is instead of re-validating them
+        revalidate_instances="never",
     )
 
+    @classmethod
+    def dump_trusted_json(cls, obj: Any) -> bytes:
+        """
+        Serialize attributes of already-validated data straight to the schema's JSON.
+
+        Reads the schema's fields off ``obj`` into a dict and serializes it with
+        a cached serializer for a TypedDict mirror of the schema, so no model
+        instance is built. The output matches ``model_validate(obj).model_dump_json()``
+        for schemas without computed fields, aliases or custom serializers.
+
+        Args:
+            obj: Object exposing every field of the schema as an attribute
+
+        Returns:
+            bytes: The JSON document
+        """
+        adapter = _trusted_json_adapters.get(cls)
+        if adapter is None:
+            fields = {name: field.annotation for name, field in cls.model_fields.items()}
+            mirror = TypedDict(f"{cls.__name__}Json", fields)  # type: ignore[misc]
+            adapter = TypeAdapter(mirror)
+            _trusted_json_adapters[cls] = adapter
+
+        return adapter.dump_json({name: getattr(obj, name) for name in cls.model_fields})
+
 
 class BaseTimestampSchema(BaseSchema):
     """Base schema with timestamp fields"""
@@ -20,6 +84,7 @@ class BaseTimestampSchema(BaseSchema):
         from_attributes=True,
         arbitrary_types_allowed=True,
         extra="forbid",
+        revalidate_instances="never",
     )
     created_at: datetime
     updated_at: datetime | None = None
@@ -1,9 +1,14 @@
-from pydantic import ConfigDict, EmailStr, Field
+from typing import TypedDict
+
+from pydantic import ConfigDict, Field
 
 from app.schemas import BaseSchema
+from app.schemas.base import TrustedEmail
+
 
+class FirebaseTokenData(TypedDict):
+    """Decoded Firebase token claims passed between trusted modules."""
 
-class FirebaseTokenData(BaseSchema):
     user_id: str
     email: str
     name: str | None
@@ -39,7 +44,7 @@ class DecodedFirebaseTokenResponse(BaseSchema):
     sub: str = Field(description="Subject of the token")
     iat: int = Field(description="Issued at time")
     exp: int = Field(description="Expiration time")
-    email: EmailStr = Field(description="User email")
+    email: TrustedEmail = Field(description="User email")
     email_verified: bool = Field(description="Email verification status")
     firebase: dict = Field(description="Firebase specific claims")
     uid: str = Field(description="User ID")
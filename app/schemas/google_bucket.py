@@ -1,12 +1,15 @@
-import base64
+import binascii
 from datetime import datetime
+from typing import Any, TypedDict
 
-from pydantic import HttpUrl, field_validator
+from pydantic import HttpUrl, TypeAdapter, model_validator
 
 from .base import BaseSchema
 
 
-class ServiceAccount(BaseSchema):
+class ServiceAccount(TypedDict):
+    """GCS service account credentials passed between trusted modules."""
+
     private_key: str
     private_key_id: str
     project_id: str
@@ -14,6 +17,10 @@ class ServiceAccount(BaseSchema):
     client_id: str
 
 
+# Built once; validates service accounts only where they enter the app
+SERVICE_ACCOUNT_ADAPTER = TypeAdapter(ServiceAccount)
+
+
 class BucketFile(BaseSchema):
     id: str
     basename: str
@@ -30,17 +37,38 @@ class BucketFile(BaseSchema):
     creation_date: datetime
     modification_date: datetime
 
-    @field_validator("md5_hash")
-    def decode_md5_hash(cls, value: str) -> str:
-        decoded_bytes = base64.b64decode(value)
+    @model_validator(mode="before")
+    @classmethod
+    def decode_hashes(cls, data: Any) -> Any:
+        """
+        Decode the base64 MD5 hash to hex and the base64 CRC32C checksum to an int.
+
+        Both fields are decoded in one validator with binascii directly, skipping
+        the per-field validator dispatch and base64 module wrappers.
+
+        Args:
+            data: Raw input for the model
+
+        Returns:
+            Any: The input with both hashes decoded
+        """
+        if not isinstance(data, dict):
+            return data
 
-        return decoded_bytes.hex()
+        md5_hash = data.get("md5_hash")
+        crc32c_checksum = data.get("crc32c_checksum")
+        if not isinstance(md5_hash, str) and not isinstance(crc32c_checksum, str):
+            return data
 
-    @field_validator("crc32c_checksum", mode="before")
-    def decode_crc32c_checksum(cls, value: str) -> int:
-        decoded_bytes = base64.b64decode(value)
+        data = dict(data)
+        if isinstance(md5_hash, str):
+            data["md5_hash"] = binascii.a2b_base64(md5_hash).hex()
+        if isinstance(crc32c_checksum, str):
+            data["crc32c_checksum"] = int.from_bytes(
+                binascii.a2b_base64(crc32c_checksum), byteorder="big"
+            )
 
-        return int.from_bytes(decoded_bytes, byteorder="big")
+        return data
 
 
 class BucketFolder(BaseSchema):
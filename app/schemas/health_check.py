@@ -1,7 +1,11 @@
+from pydantic import ConfigDict
+
 from app.schemas.base import BaseSchema
 
 
 class HealthCheckResponse(BaseSchema):
     """Schema for health check response"""
 
+    model_config = ConfigDict(frozen=True)
+
     status: str
@@ -1,6 +1,6 @@
 import uuid
 
-from pydantic import field_validator
+from pydantic import ConfigDict, field_validator
 
 from app.schemas import BaseSchema
 
@@ -8,6 +8,8 @@ from app.schemas import BaseSchema
 class Token(BaseSchema):
     """Token response schema"""
 
+    model_config = ConfigDict(frozen=True)
+
     access_token: str
     token_type: str = "Bearer"
     refresh_token: str | None = None
@@ -19,6 +21,8 @@ class Token(BaseSchema):
 class TokenData(BaseSchema):
     """Token data schema parsed from JWT payload"""
 
+    model_config = ConfigDict(frozen=True)
+
     user_id: int | str | uuid.UUID
     issued_at: int | None = None
     expires_at: int | None = None
@@ -35,6 +39,8 @@ class TokenData(BaseSchema):
 class TokenPayload(BaseSchema):
     """Token payload for refresh token"""
 
+    model_config = ConfigDict(frozen=True)
+
     refresh_token: str
 
 
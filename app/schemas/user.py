@@ -1,51 +1,146 @@
-import re
+from dataclasses import dataclass
+from string import ascii_letters, ascii_lowercase, ascii_uppercase, digits
 from typing import Annotated
 
 from pydantic import EmailStr, Field, SecretStr, field_validator
 
 from app.core.constants import FieldSizes
 from app.schemas import BaseSchema, BaseTimestampSchema
+from app.schemas.base import TrustedEmail
 
-# Bandit flags this as a hardcoded password (B105); it's a validation regex, not a credential.
-USER_PASSWORD_REGEX = r"^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[@$!%*?&])[A-Za-z\d@$!%*?&]{8,}$"  # nosec B105
+USER_PASSWORD_SPECIAL_CHARACTERS = "@$!%*?&"
 USER_PASSWORD_DESCRIPTION = (
     "Password must be at least 8 characters long and include at least one uppercase letter, "
     + "one lowercase letter, one number, and one special character from @$!%*?&."
 )
-USER_USERNAME_REGEX = r"^(?=.*\d)[A-Za-z0-9_]{3,50}$"
 USER_USERNAME_DESCRIPTION = (
     "Username must be 3 to 50 characters long, contain only letters, "
     + "numbers, or underscores, and include at least one number."
 )
 
+# Character classes for the signup checks. An ASCII value is translated byte by
+# byte to its class in one C-level pass, then required classes are looked up
+_INVALID = 0
+_LOWERCASE = 1
+_UPPERCASE = 2
+_DIGIT = 3
+_SPECIAL = 4
+_UNDERSCORE = 5
+
+
+def _build_class_table(classes: dict[str, int]) -> bytes:
+    """
+    Build a bytes.translate table mapping each byte to its character class.
+
+    Args:
+        classes (dict[str, int]): Characters mapped to their class; any other byte is invalid.
+
+    Returns:
+        table (bytes): The 256-entry translation table.
+    """
+    table = bytearray([_INVALID]) * 256
+    for characters, char_class in classes.items():
+        for character in characters:
+            table[ord(character)] = char_class
+
+    return bytes(table)
+
+
+_PASSWORD_CLASSES = _build_class_table(
+    {
+        ascii_lowercase: _LOWERCASE,
+        ascii_uppercase: _UPPERCASE,
+        digits: _DIGIT,
+        USER_PASSWORD_SPECIAL_CHARACTERS: _SPECIAL,
+    }
+)
+_USERNAME_CLASSES = _build_class_table(
+    {ascii_letters: _LOWERCASE, digits: _DIGIT, "_": _UNDERSCORE}
+)
+
+
+def _classify(value: str, table: bytes) -> bytes | None:
+    """Translate a value to its character classes, or None if it is not ASCII."""
+    try:
+        return value.encode("ascii").translate(table)
+    except UnicodeEncodeError:
+        return None
+
+
+def is_valid_password(value: str) -> bool:
+    """
+    Check that a password has 8+ characters from the allowed set, including a
+    lowercase letter, an uppercase letter, a digit and a special character.
+
+    Args:
+        value (str): The plaintext password.
+
+    Returns:
+        bool: True if the password meets the complexity requirements.
+    """
+    classes = _classify(value, _PASSWORD_CLASSES)
+    return (
+        classes is not None
+        and len(classes) >= 8
+        and _INVALID not in classes
+        and _LOWERCASE in classes
+        and _UPPERCASE in classes
+        and _DIGIT in classes
+        and _SPECIAL in classes
+    )
+
+
+def is_valid_username(value: str) -> bool:
+    """
+    Check that a username has 3 to 50 letters, digits or underscores,
+    including at least one digit.
+
+    Args:
+        value (str): The username.
+
+    Returns:
+        bool: True if the username is valid.
+    """
+    classes = _classify(value, _USERNAME_CLASSES)
+    return (
+        classes is not None
+        and 3 <= len(classes) <= 50
+        and _INVALID not in classes
+        and _DIGIT in classes
+    )
+
 
 class UserBase(BaseSchema):
     """Base user schema"""
 
     username: str
-    email: EmailStr
+    email: TrustedEmail
     hashed_password: str
     first_name: str
     last_name: str
 
 
-class UserCreate(BaseSchema):
-    """User creation schema"""
+# UserCreate and UserUpdate only carry already-validated data from the service
+# layer to the repository, so they are plain dataclasses rather than schemas
+@dataclass(slots=True, frozen=True)
+class UserCreate:
+    """User creation data"""
 
     username: str
-    email: EmailStr
+    email: str
     hashed_password: str
     first_name: str
     last_name: str
 
 
-class UserUpdate(BaseSchema):
-    """User update schema"""
+@dataclass(slots=True, frozen=True)
+class UserUpdate:
+    """User update data; fields left as None are not updated"""
 
     first_name: str | None = None
     last_name: str | None = None
     username: str | None = None
-    email: EmailStr | None = None
+    email: str | None = None
     password: str | None = None
 
 
@@ -91,7 +186,7 @@ class UserSignup(BaseSchema):
     @field_validator("username")
     def validate_username(cls, value: str) -> str:
         """Validate username to ensure it contains no spaces."""
-        if re.match(USER_USERNAME_REGEX, value) is None:
+        if not is_valid_username(value):
             raise ValueError(USER_USERNAME_DESCRIPTION)
 
         return value
@@ -99,7 +194,7 @@ class UserSignup(BaseSchema):
     @field_validator("password")
     def validate_password(cls, value: SecretStr) -> SecretStr:
         """Validate password to ensure it meets complexity requirements."""
-        if re.match(USER_PASSWORD_REGEX, value.get_secret_value()) is None:
+        if not is_valid_password(value.get_secret_value()):
             raise ValueError(USER_PASSWORD_DESCRIPTION)
 
         return value
@@ -116,6 +211,6 @@ class UserResponse(BaseTimestampSchema):
 
     id: int
     username: str
-    email: EmailStr
+    email: TrustedEmail
     first_name: str
     last_name: str
@@ -1,3 +1,5 @@
+import asyncio
+import functools
 import secrets
 import string
 import uuid
@@ -9,22 +11,47 @@ from jose.exceptions import ExpiredSignatureError, JWTClaimsError, JWTError
 from pwdlib import PasswordHash
 
 from app.core.config import settings
+from app.core.utils import parse_user_id
 from app.models.user import User
 from app.repos.user import UserRepo
 from app.schemas import TokenData, UserCreate
 from app.services.cache.token_blacklist import token_blacklist
+from app.services.cache.user_cache import user_cache
 from app.services.exceptions.auth import (
     DuplicateResourceError,
     ResourceNotFoundError,
     ValidationError,
 )
 from app.services.types.auth import (
+    JWTDecodeStatus,
     JWTPayloadDict,
     LogoutRevokePayloadDict,
     TokenPairDict,
     TokenWithJtiDict,
 )
 
+_DEFAULT_PASSWORD_HASH = PasswordHash.recommended()
+
+
+@functools.cache
+def _dummy_hash(password_hash: PasswordHash) -> str:
+    """
+    Hash a dummy password once per hasher for timing attack prevention.
+
+    Computed on first use instead of per AuthService instance, so neither
+    import nor per-request service construction pays for a password hash.
+
+    Args:
+        password_hash: The hasher to produce the dummy hash with.
+
+    Returns:
+        str: The dummy password hash.
+
+    Reference:
+        https://cheatsheetseries.owasp.org/cheatsheets/Authentication_Cheat_Sheet.html
+    """
+    return password_hash.hash("dummy_password_for_timing_attack_prevention")
+
 
 class AuthService:
     """
@@ -42,13 +69,9 @@ class AuthService:
         password_hash: PasswordHash | None = None,
     ):
         self.user_repo = user_repo
-        self._password_hash = password_hash or PasswordHash.recommended()
-
-        # Pre-computed dummy hash for timing attack prevention
-        # Reference: https://cheatsheetseries.owasp.org/cheatsheets/Authentication_Cheat_Sheet.html
-        self._dummy_hash = dummy_hash or self._password_hash.hash(
-            "dummy_password_for_timing_attack_prevention"
-        )
+        self._password_hash = password_hash or _DEFAULT_PASSWORD_HASH
+        # Dummy hash for timing attack prevention, computed lazily by _get_dummy_hash
+        self._dummy_hash = dummy_hash
 
     @staticmethod
     def generate_random_password(length: int = 12) -> str:
@@ -135,6 +158,39 @@ class AuthService:
 
         return TokenWithJtiDict(token=encoded_jwt, jti=jti)
 
+    @staticmethod
+    def decode_jwt(token: str) -> tuple[JWTDecodeStatus, JWTPayloadDict | None]:
+        """
+        Decode a JWT without raising, reporting the outcome as a status tag.
+
+        Tokens that are not three dot-separated segments are rejected before
+        reaching the JWT library, so garbage tokens cost no exception at all.
+
+        Args:
+            token: JWT token string to decode.
+
+        Returns:
+            tuple[JWTDecodeStatus, JWTPayloadDict | None]: ``("ok", payload)`` on
+                success, otherwise the failure status and None.
+        """
+        if token.count(".") != 2:
+            return "invalid", None
+
+        try:
+            payload = jwt.decode(
+                token=token,
+                key=settings.secret_key,
+                algorithms=settings.jwt_algorithm,
+            )
+        except ExpiredSignatureError:
+            return "expired", None
+        except JWTClaimsError:
+            return "claims", None
+        except JWTError:
+            return "invalid", None
+
+        return "ok", cast(JWTPayloadDict, payload)
+
     @staticmethod
     def _decode_jwt_payload(
         token: str,
@@ -157,19 +213,16 @@ class AuthService:
         Raises:
             ValidationError: If the token is expired, invalid, or has invalid claims.
         """
-        try:
-            payload = jwt.decode(
-                token=token,
-                key=settings.secret_key,
-                algorithms=settings.jwt_algorithm,
-            )
-            return cast(JWTPayloadDict, payload)
-        except ExpiredSignatureError:
-            raise ValidationError(expired_error_message)
-        except JWTClaimsError:
-            raise ValidationError(claims_error_message or invalid_error_message)
-        except JWTError:
-            raise ValidationError(invalid_error_message)
+        status, payload = AuthService.decode_jwt(token)
+        match status:
+            case "ok" if payload is not None:
+                return payload
+            case "expired":
+                raise ValidationError(expired_error_message)
+            case "claims":
+                raise ValidationError(claims_error_message or invalid_error_message)
+            case _:
+                raise ValidationError(invalid_error_message)
 
     @staticmethod
     def _parse_user_id(user_id: str | int | uuid.UUID) -> str | int | uuid.UUID:
@@ -182,20 +235,19 @@ class AuthService:
         Returns:
             user_id (str | int | uuid.UUID): Parsed user ID
         """
-        if isinstance(user_id, uuid.UUID):
-            return user_id
+        return parse_user_id(user_id)
 
-        try:
-            return uuid.UUID(str(user_id))
-        except ValueError:
-            pass
+    def _get_dummy_hash(self) -> str:
+        """
+        Get the dummy hash verified against when a user doesn't exist.
 
-        try:
-            return int(user_id)
-        except ValueError, TypeError:
-            pass
+        Returns:
+            str: The injected dummy hash, or the cached one for this service's hasher.
+        """
+        if self._dummy_hash is None:
+            self._dummy_hash = _dummy_hash(self._password_hash)
 
-        return user_id
+        return self._dummy_hash
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
@@ -265,22 +317,18 @@ class AuthService:
             TokenPairDict with access and refresh tokens.
 
         Raises:
-            DuplicateResourceError: If a user with the email already exists.
+            DuplicateResourceError: If a user with the email or username already exists.
 
         Reference:
             https://cheatsheetseries.owasp.org/cheatsheets/Authentication_Cheat_Sheet.html
         """
-        existing = await self.user_repo.get_by_email(email=signup_data.email)
-        if existing:
+        user = await self.user_repo.create_if_absent(schema=signup_data)
+        if user is None:
             # Generic message to prevent user enumeration
             raise DuplicateResourceError(
                 "Unable to complete registration. Please check your input and try again."
             )
 
-        user = await self.user_repo.create_one(
-            schema=signup_data,
-        )
-
         access_token_data = self.create_access_token(subject=str(user.id))
         refresh_token_data = self.create_refresh_token(subject=str(user.id))
 
@@ -291,13 +339,13 @@ class AuthService:
 
     async def authenticate_user(self, username: str, password: str) -> TokenPairDict:
         """
-        Authenticate user by username and password, return token pair.
+        Authenticate user by username or email and password, return token pair.
 
         Implements timing attack prevention by always performing password hash
         comparison even when user is not found.
 
         Args:
-            username: User's username.
+            username: User's username or email.
             password: User's password (plaintext).
 
         Returns:
@@ -309,12 +357,17 @@ class AuthService:
         Reference:
             https://cheatsheetseries.owasp.org/cheatsheets/Authentication_Cheat_Sheet.html
         """
-        user = await self.user_repo.get_by_username(username=username)
+        user = await self.user_repo.get_by_identifier(identifier=username)
 
         # Always perform password verification to prevent timing attacks
         # Use dummy hash if user doesn't exist to ensure constant-time response
-        hash_to_verify = user.hashed_password if user else self._dummy_hash
-        password_valid = self.verify_password(password, hash_to_verify)
+        if user:
+            hash_to_verify = user.hashed_password
+        else:
+            # The first miss computes the dummy hash, so keep that off the event loop too
+            hash_to_verify = await asyncio.to_thread(self._get_dummy_hash)
+        # Hash verification is CPU-bound, so keep it off the event loop
+        password_valid = await asyncio.to_thread(self.verify_password, password, hash_to_verify)
 
         if not user or not password_valid:
             raise ValidationError("Incorrect username or password")
@@ -369,26 +422,31 @@ class AuthService:
         if token_type != "access":  # nosec B105
             raise ValidationError("Token has invalid claims")
 
-        if jti and await token_blacklist.is_revoked(jti):
-            raise ValidationError("Token has been revoked")
-
-        try:
-            token_data = TokenData(
-                user_id=self._parse_user_id(user_id),
-                issued_at=issued_at,
-                expires_at=expires_at,
-            )
-        except TypeError, ValueError, JWTClaimsError:
-            raise ValidationError("Token has invalid claims")
+        # jwt.decode already rejected a non-string sub, and parse_user_id does not raise
+        parsed_user_id = self._parse_user_id(user_id)
 
-        # Check if all user tokens were revoked (e.g., password change)
-        revocation_time = await token_blacklist.get_user_revocation_time(str(token_data.user_id))
-        if revocation_time and issued_at and issued_at < revocation_time:
+        # One round trip covers both the token's own revocation and a revoke-all marker
+        # (e.g., password change) issued after the token
+        revoked, revocation_time = await token_blacklist.get_revocation_state(
+            jti, str(parsed_user_id)
+        )
+        if revoked or (revocation_time and issued_at and issued_at < revocation_time):
             raise ValidationError("Token has been revoked")
 
-        user = await self.user_repo.get_by_id(token_data.user_id)
+        # jwt.decode already type-checked sub, exp and iat, so skip re-validating them
+        token_data = TokenData.model_construct(
+            user_id=parsed_user_id,
+            issued_at=issued_at,
+            expires_at=expires_at,
+        )
+
+        # Served from the in-process cache when possible to skip a DB round trip
+        user = user_cache.get(token_data.user_id)
         if user is None:
-            raise ResourceNotFoundError("User not found")
+            user = await self.user_repo.get_by_id(token_data.user_id)
+            if user is None:
+                raise ResourceNotFoundError("User not found")
+            user_cache.set(token_data.user_id, user)
 
         return user
 
@@ -102,11 +102,11 @@ class BackBlaze:
         except NonExistentBucket as ex:
             error_msg = f"Bucket '{bucket_name}' does not exist"
             logger.exception(error_msg)
-            raise B2BucketNotFoundError(error_msg, ex) from ex
+            raise B2BucketNotFoundError(error_msg) from ex
         except Exception as ex:
             error_msg = f"Failed to select bucket '{bucket_name}'"
             logger.exception(error_msg)
-            raise B2BucketNotSelectedError(error_msg, ex) from ex
+            raise B2BucketNotSelectedError(error_msg) from ex
 
     async def list_buckets(self) -> list[Bucket]:
         """
@@ -127,7 +127,7 @@ class BackBlaze:
         except Exception as ex:
             error_msg = "Failed to list buckets"
             logger.exception(error_msg)
-            raise B2FileOperationError(error_msg, ex) from ex
+            raise B2FileOperationError(error_msg) from ex
 
     async def create_bucket(
         self, bucket_name: str, bucket_type: B2BucketTypeEnum | None = None
@@ -163,7 +163,7 @@ class BackBlaze:
         except Exception as ex:
             error_msg = f"Failed to create bucket '{bucket_name}'"
             logger.exception(error_msg)
-            raise B2FileOperationError(error_msg, ex) from ex
+            raise B2FileOperationError(error_msg) from ex
 
     async def delete_selected_bucket(self) -> Self:
         """
@@ -195,11 +195,11 @@ class BackBlaze:
         except NonExistentBucket as ex:
             error_msg = f"Bucket '{bucket_name}' does not exist"
             logger.exception(error_msg)
-            raise B2BucketNotFoundError(error_msg, ex) from ex
+            raise B2BucketNotFoundError(error_msg) from ex
         except Exception as ex:
             error_msg = f"Failed to delete bucket '{bucket_name}'"
             logger.exception(error_msg)
-            raise B2BucketOperationError(error_msg, ex) from ex
+            raise B2BucketOperationError(error_msg) from ex
 
     async def update_selected_bucket(
         self,
@@ -239,7 +239,7 @@ class BackBlaze:
         except Exception as ex:
             error_msg = f"Failed to update bucket '{self._bucket.name}'"
             logger.exception(error_msg)
-            raise B2BucketOperationError(error_msg, ex) from ex
+            raise B2BucketOperationError(error_msg) from ex
 
     async def upload_file(
         self,
@@ -295,7 +295,7 @@ class BackBlaze:
             self._cleanup_failed_upload(local_file_path)
             error_msg = f"Failed to upload file '{local_file_path}'"
             logger.exception(error_msg)
-            raise B2FileOperationError(error_msg, ex) from ex
+            raise B2FileOperationError(error_msg) from ex
 
     async def get_download_url_by_name(self, file_name: str) -> FileDownloadLink:
         """
@@ -331,7 +331,7 @@ class BackBlaze:
         except Exception as ex:
             error_msg = f"Failed to get download URL for file '{file_name}'"
             logger.exception(error_msg)
-            raise B2FileOperationError(error_msg, ex) from ex
+            raise B2FileOperationError(error_msg) from ex
 
     async def get_download_url_by_file_id(self, file_id: str) -> FileDownloadLink:
         """
@@ -359,7 +359,7 @@ class BackBlaze:
         except Exception as ex:
             error_msg = f"Failed to get download URL for file ID '{file_id}'"
             logger.exception(error_msg)
-            raise B2FileOperationError(error_msg, ex) from ex
+            raise B2FileOperationError(error_msg) from ex
 
     async def delete_file(self, file_id: str, file_name: str) -> FileIdAndName:
         """
@@ -394,7 +394,7 @@ class BackBlaze:
         except Exception as ex:
             error_msg = f"Failed to delete file '{file_name}' (ID: {file_id})"
             logger.exception(error_msg)
-            raise B2FileOperationError(error_msg, ex) from ex
+            raise B2FileOperationError(error_msg) from ex
 
     async def get_temporary_download_link(
         self,
@@ -442,7 +442,7 @@ class BackBlaze:
         except Exception as ex:
             error_msg = f"Failed to get temporary download link for file ID '{file_id}'"
             logger.exception(error_msg)
-            raise B2FileOperationError(error_msg, ex) from ex
+            raise B2FileOperationError(error_msg) from ex
 
     async def get_file_details(self, file_id: str) -> FileVersion:
         """
@@ -466,7 +466,7 @@ class BackBlaze:
         except Exception as ex:
             error_msg = f"Failed to get file details for ID '{file_id}'"
             logger.exception(error_msg)
-            raise B2FileOperationError(error_msg, ex) from ex
+            raise B2FileOperationError(error_msg) from ex
 
     async def _authorize(self) -> None:
         """Authorize with BackBlaze B2 service (async)."""
@@ -481,7 +481,7 @@ class BackBlaze:
             logger.info("Successfully authorized BackBlaze account")
         except Exception as ex:
             logger.exception("Failed to authorize BackBlaze account")
-            raise B2AuthorizationError("Failed to authorize BackBlaze account", ex) from ex
+            raise B2AuthorizationError("Failed to authorize BackBlaze account") from ex
 
     @staticmethod
     def _validate_file_path(file_path: str) -> None:
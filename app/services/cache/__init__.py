@@ -3,5 +3,13 @@ from .decorators import cache_result
 from .manager import cache_manager
 from .rate_limiter import rate_limiter
 from .token_blacklist import token_blacklist
+from .user_cache import user_cache
 
-__all__ = ["BaseRedisClient", "cache_result", "cache_manager", "rate_limiter", "token_blacklist"]
+__all__ = [
+    "BaseRedisClient",
+    "cache_result",
+    "cache_manager",
+    "rate_limiter",
+    "token_blacklist",
+    "user_cache",
+]
@@ -1,12 +1,14 @@
 from abc import ABC
 
 from loguru import logger
-from redis.asyncio import ConnectionPool, Redis
+from redis.asyncio import BlockingConnectionPool, ConnectionPool, Redis
 
 from app.core.config import Environment, settings
 
 # Global shared Redis connection pool
 _redis_pool: ConnectionPool | None = None
+# Global Redis client on top of the shared pool, used by every BaseRedisClient
+_shared_redis: Redis | None = None
 
 
 def get_redis_pool() -> ConnectionPool:
@@ -23,14 +25,19 @@ def get_redis_pool() -> ConnectionPool:
     global _redis_pool
 
     if _redis_pool is None:
-        _redis_pool = ConnectionPool.from_url(
+        # A blocking pool makes callers wait for a free connection (up to
+        # redis_pool_wait_timeout) instead of opening more than max_connections
+        _redis_pool = BlockingConnectionPool.from_url(
             settings.redis_url.human_repr(),
             encoding="utf-8",
             decode_responses=False,
             max_connections=settings.redis_max_pool_connections,
+            timeout=settings.redis_pool_wait_timeout,
             retry_on_timeout=True,
             socket_connect_timeout=settings.redis_socket_connect_timeout,
             socket_timeout=settings.redis_socket_timeout,
+            health_check_interval=settings.redis_health_check_interval,
+            protocol=settings.redis_protocol,
         )
         logger.info(
             f"Redis connection pool created with max_connections={settings.redis_max_pool_connections}"
@@ -38,6 +45,24 @@ def get_redis_pool() -> ConnectionPool:
     return _redis_pool
 
 
+def get_redis_client() -> Redis:
+    """
+    Get or create the Redis client shared by all Redis-based services.
+
+    Returns:
+        Redis: Shared Redis client bound to the shared connection pool
+
+    Note:
+        The client does not own the pool, so closing it leaves the pool usable
+        by the other services.
+    """
+    global _shared_redis
+
+    if _shared_redis is None:
+        _shared_redis = Redis(connection_pool=get_redis_pool())
+    return _shared_redis
+
+
 class BaseRedisClient(ABC):
     """
     Abstract base class for Redis clients with shared connection handling.
@@ -79,10 +104,9 @@ class BaseRedisClient(ABC):
     def _initialize_redis(self) -> None:
         """Initialize Redis connection using shared connection pool"""
         try:
-            pool = get_redis_pool()
-            self._redis_client = Redis(connection_pool=pool)
+            self._redis_client = get_redis_client()
             logger.debug(
-                f"Redis client initialized for {self.__class__.__name__} using shared pool"
+                f"Redis client initialized for {self.__class__.__name__} using shared client"
             )
         except Exception as e:
             logger.error(f"Failed to initialize Redis for {self.__class__.__name__}: {e}")
@@ -104,9 +128,10 @@ class BaseRedisClient(ABC):
 
     async def close(self) -> None:
         """Close Redis connection gracefully"""
-        if self.redis_client:
+        redis_client = self.redis_client
+        if redis_client:
             try:
-                await self.redis_client.close()
+                await redis_client.close()
                 logger.info(f"Redis connection closed for {self.__class__.__name__}")
             except Exception as e:
                 logger.error(f"Error closing Redis connection for {self.__class__.__name__}: {e}")
@@ -1,21 +1,86 @@
+import asyncio
+import inspect
 from functools import wraps
+from hashlib import blake2b
 from typing import Any, Callable
 
 from app.core.config import settings
 
+# Recomputations in flight in this process, keyed by cache key
+_inflight: dict[str, asyncio.Task[Any]] = {}
 
-def cache_result(expire: int = settings.cache_ttl_default, key_prefix: str = "") -> Callable:
-    """Decorator to cache function results"""
+
+def _make_cache_key(
+    key_prefix: str,
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+    key_builder: Callable[..., str] | None = None,
+) -> str:
+    """
+    Build a cache key for a call of a decorated function.
+
+    The key is identical in every worker only when each argument has a value-based
+    repr (numbers, strings, UUIDs, tuples of those, ...). An argument with the
+    default ``<Obj at 0x...>`` repr, such as an AsyncSession, makes the key differ
+    per process; pass a key_builder for such functions.
+
+    Args:
+        key_prefix: Prefix passed to cache_result
+        func: The decorated function
+        args: Positional arguments of the call, without a bound self or cls
+        kwargs: Keyword arguments of the call
+        key_builder: Builds the argument part of the key from args and kwargs
+
+    Returns:
+        str: Cache key
+    """
+    if key_builder is not None:
+        args_key = key_builder(*args, **kwargs)
+    else:
+        # Builtin hash() is salted per process, so it cannot be shared through Redis
+        args_key = blake2b(
+            (repr(args) + repr(sorted(kwargs.items()))).encode(), digest_size=16
+        ).hexdigest()
+    return f"{key_prefix}:{func.__module__}.{func.__qualname__}:{args_key}"
+
+
+def cache_result(
+    expire: int = settings.cache_ttl_default,
+    key_prefix: str = "",
+    key_builder: Callable[..., str] | None = None,
+) -> Callable:
+    """
+    Decorator to cache function results
+
+    Concurrent misses for the same key in one process share a single call of the
+    wrapped function instead of each recomputing it.
+
+    The bound ``self``/``cls`` of a decorated method is left out of the key, so all
+    instances share entries. Other arguments must have a value-based repr for the
+    key to be shared across workers; otherwise pass key_builder.
+
+    Args:
+        expire: Expiration time in seconds
+        key_prefix: Prefix for the generated cache keys
+        key_builder: Called with the call's arguments (without self/cls) and returns
+            the argument part of the key, e.g. ``lambda session, user_id: str(user_id)``
+
+    Returns:
+        Callable: Decorator for async functions
+    """
 
     def decorator(func: Callable) -> Callable:
+        # Decided once per function: whether the first positional argument is self/cls
+        params = list(inspect.signature(func).parameters)
+        skip_first = bool(params) and params[0] in ("self", "cls")
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             from app.services.cache import cache_manager
 
-            # Generate cache key
-            cache_key = (
-                f"{key_prefix}:{func.__name__}:{hash(str(args) + str(sorted(kwargs.items())))}"
-            )
+            key_args = args[1:] if skip_first else args
+            cache_key = _make_cache_key(key_prefix, func, key_args, kwargs, key_builder)
 
             # Try to get from cache
             cached_result = await cache_manager.get(cache_key)
@@ -23,12 +88,19 @@ def cache_result(expire: int = settings.cache_ttl_default, key_prefix: str = "")
             if cached_result is not None:
                 return cached_result
 
-            # Execute function
-            result = await func(*args, **kwargs)
+            async def compute() -> Any:
+                result = await func(*args, **kwargs)
+                await cache_manager.set(cache_key, result, expire)
+                return result
+
+            task = _inflight.get(cache_key)
+            if task is None:
+                task = asyncio.ensure_future(compute())
+                _inflight[cache_key] = task
+                task.add_done_callback(lambda _: _inflight.pop(cache_key, None))
 
-            # Cache result
-            await cache_manager.set(cache_key, result, expire)
-            return result
+            # Shielded so a cancelled caller does not cancel the call others are awaiting
+            return await asyncio.shield(task)
 
         return wrapper
 
@@ -1,19 +1,104 @@
 # Justification for the nosec markers below: see the comment on pickle.loads() further down.
 import pickle  # nosec B403
+from collections.abc import Iterable, Mapping
 from typing import Any, Optional
 
+import msgpack
 from loguru import logger
 
 from app.core.config import settings
 from app.services.cache import BaseRedisClient
 
+# Keys fetched per SCAN call and removed per UNLINK call in delete_pattern()
+_SCAN_BATCH_SIZE = 500
+
+# Format tag written as the first byte of every cached blob. Blobs written
+# before the tag existed are plain pickles, which always start with b"\x80".
+_PACK_PICKLE = b"\x00"
+_PACK_MSGPACK = b"\x01"
+_PACK_BYTES = b"\x02"
+_PACK_STR = b"\x03"
+_LEGACY_PICKLE = b"\x80"
+
+
+def _msgpack_default(value: Any) -> Any:
+    """
+    Reject types msgpack cannot round-trip so set() falls back to pickle.
+
+    Args:
+        value (Any): Object msgpack has no native encoding for
+
+    Raises:
+        TypeError: Always
+    """
+    raise TypeError(f"{type(value).__name__} is not msgpack serializable")
+
+
+def _serialize(value: Any) -> bytes:
+    """
+    Encode a value for Redis, tagged with its format byte.
+
+    str and bytes are stored raw; other values use msgpack with strict types
+    (so tuples, sets, enums and models keep their type via the pickle fallback).
+
+    Args:
+        value (Any): Value to cache
+
+    Returns:
+        bytes: Tagged payload
+    """
+    if type(value) is bytes:
+        return _PACK_BYTES + value
+    if type(value) is str:
+        return _PACK_STR + value.encode()
+    try:
+        packed: bytes = msgpack.packb(
+            value,
+            use_bin_type=True,
+            strict_types=True,
+            default=_msgpack_default,
+        )
+        return _PACK_MSGPACK + packed
+    except TypeError, ValueError, OverflowError:
+        return _PACK_PICKLE + pickle.dumps(value)
+
+
+def _deserialize(data: bytes) -> Any:
+    """
+    Decode a payload written by _serialize() or a legacy untagged pickle.
+
+    Args:
+        data (bytes): Raw Redis value
+
+    Returns:
+        Any: Decoded value
+    """
+    tag = data[:1]
+    # Accepted risk: only this service ever writes to these keys (via set()
+    # below), and Redis is treated as trusted internal infra, not attacker-
+    # reachable storage. Revisit if that trust boundary ever changes (e.g.
+    # Redis shared with untrusted services) by dropping the pickle fallback.
+    if tag == _LEGACY_PICKLE:
+        return pickle.loads(data)  # nosec B301
+    body = memoryview(data)[1:]
+    if tag == _PACK_MSGPACK:
+        return msgpack.unpackb(body, raw=False, strict_map_key=False)
+    if tag == _PACK_STR:
+        return str(body, "utf-8")
+    if tag == _PACK_BYTES:
+        return bytes(body)
+    if tag == _PACK_PICKLE:
+        return pickle.loads(body)  # nosec B301
+    raise ValueError(f"Unknown cache payload tag {tag!r}")
+
 
 class CacheManager(BaseRedisClient):
     """
-    Cache manager for general-purpose data caching with pickle serialization.
+    Cache manager for general-purpose data caching with msgpack serialization.
 
     Inherits Redis connection handling from BaseRedisClient and provides
-    high-level caching operations for any Python object using pickle.
+    high-level caching operations for any Python object. Plain data is stored
+    as msgpack; values msgpack cannot round-trip fall back to pickle.
     """
 
     async def get(self, key: str) -> Optional[Any]:
@@ -26,18 +111,15 @@ class CacheManager(BaseRedisClient):
         Returns:
             Optional[Any]: Cached value or None if not found
         """
-        if not self.redis_client:
+        redis_client = self.redis_client
+        if not redis_client:
             logger.warning("Redis client not initialized in CacheManager")
             return None
 
         try:
-            data = await self.redis_client.get(key)
+            data = await redis_client.get(key)
             if data:
-                # Accepted risk: only this service ever writes to these keys (via set()
-                # below), and Redis is treated as trusted internal infra, not attacker-
-                # reachable storage. Revisit if that trust boundary ever changes (e.g.
-                # Redis shared with untrusted services) by switching to JSON.
-                return pickle.loads(data)  # nosec B301
+                return _deserialize(data)
             return None
         except Exception:
             logger.exception(f"Cache get failed for key {key}")
@@ -55,14 +137,15 @@ class CacheManager(BaseRedisClient):
         Returns:
             bool: True if set successfully, False otherwise
         """
-        if not self.redis_client:
+        redis_client = self.redis_client
+        if not redis_client:
             logger.warning("Redis client not initialized in CacheManager")
             return False
 
         try:
-            serialized = pickle.dumps(value)
+            serialized = _serialize(value)
             expire = expire or settings.cache_ttl_default
-            return bool(await self.redis_client.set(key, serialized, ex=expire))
+            return bool(await redis_client.set(key, serialized, ex=expire))
         except Exception:
             logger.exception(f"Cache set failed for key {key}")
             return False
@@ -77,35 +160,128 @@ class CacheManager(BaseRedisClient):
         Returns:
             bool: True if deleted successfully, False otherwise
         """
-        if not self.redis_client:
+        redis_client = self.redis_client
+        if not redis_client:
             logger.warning("Redis client not initialized in CacheManager")
             return False
 
         try:
-            return bool(await self.redis_client.delete(key) > 0)
+            return bool(await redis_client.delete(key) > 0)
         except Exception:
             logger.exception(f"Cache delete failed for key {key}")
             return False
 
+    async def mget(self, keys: Iterable[str]) -> list[Any | None]:
+        """
+        Get several cached values in one round trip
+
+        Args:
+            keys (Iterable[str]): Cache keys
+
+        Returns:
+            list[Any | None]: Cached values in key order, None for missing keys.
+                All None if the lookup fails.
+        """
+        keys = list(keys)
+        if not keys:
+            return []
+
+        redis_client = self.redis_client
+        if not redis_client:
+            logger.warning("Redis client not initialized in CacheManager")
+            return [None] * len(keys)
+
+        try:
+            values = await redis_client.mget(keys)
+            return [_deserialize(data) if data else None for data in values]
+        except Exception:
+            logger.exception(f"Cache mget failed for {len(keys)} keys")
+            return [None] * len(keys)
+
+    async def mset(self, mapping: Mapping[str, Any], expire: int | None = None) -> bool:
+        """
+        Set several cached values with expiration in one round trip
+
+        Args:
+            mapping (Mapping[str, Any]): Cache keys and the values to cache
+            expire (int | None): Expiration time in seconds. If None, uses default TTL.
+
+        Returns:
+            bool: True if every key was set, False otherwise
+        """
+        if not mapping:
+            return True
+
+        redis_client = self.redis_client
+        if not redis_client:
+            logger.warning("Redis client not initialized in CacheManager")
+            return False
+
+        try:
+            expire = expire or settings.cache_ttl_default
+            pipe = redis_client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                pipe.set(key, _serialize(value), ex=expire)
+            return all(await pipe.execute())
+        except Exception:
+            logger.exception(f"Cache mset failed for {len(mapping)} keys")
+            return False
+
+    async def mdelete(self, keys: Iterable[str]) -> int:
+        """
+        Delete several cached keys in one round trip
+
+        Args:
+            keys (Iterable[str]): Cache keys
+
+        Returns:
+            int: Number of keys deleted
+        """
+        keys = list(keys)
+        if not keys:
+            return 0
+
+        redis_client = self.redis_client
+        if not redis_client:
+            logger.warning("Redis client not initialized in CacheManager")
+            return 0
+
+        try:
+            return int(await redis_client.delete(*keys))
+        except Exception:
+            logger.exception(f"Cache mdelete failed for {len(keys)} keys")
+            return 0
+
     async def delete_pattern(self, pattern: str) -> int:
         """
         Delete keys matching pattern
 
+        Walks the keyspace with SCAN instead of the blocking KEYS command and
+        removes matches in batches with UNLINK, which frees memory off the
+        Redis main thread.
+
         Args:
             pattern (str): Pattern to match keys
 
         Returns:
             int: Number of keys deleted
         """
-        if not self.redis_client:
+        redis_client = self.redis_client
+        if not redis_client:
             logger.warning("Redis client not initialized in CacheManager")
             return 0
 
         try:
-            keys = await self.redis_client.keys(pattern)
-            if keys:
-                return int(await self.redis_client.delete(*keys))
-            return 0
+            deleted = 0
+            batch: list[bytes] = []
+            async for key in redis_client.scan_iter(match=pattern, count=_SCAN_BATCH_SIZE):
+                batch.append(key)
+                if len(batch) >= _SCAN_BATCH_SIZE:
+                    deleted += await redis_client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                deleted += await redis_client.unlink(*batch)
+            return deleted
         except Exception:
             logger.exception(f"Cache delete pattern failed for pattern {pattern}")
             return 0
@@ -120,12 +296,13 @@ class CacheManager(BaseRedisClient):
         Returns:
             bool: True if key exists, False otherwise
         """
-        if not self.redis_client:
+        redis_client = self.redis_client
+        if not redis_client:
             logger.warning("Redis client not initialized in CacheManager")
             return False
 
         try:
-            return bool(await self.redis_client.exists(key) > 0)
+            return bool(await redis_client.exists(key) > 0)
         except Exception:
             logger.exception(f"Cache exists check failed for key {key}")
             return False
@@ -1,15 +1,22 @@
 import hashlib
+import itertools
 import time
 
 from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import NoScriptError
 
 from app.core.config import settings
 from app.core.exceptions.rate_limiter import (
     RateLimitConfigurationError,
 )
-from app.core.types import RateLimitInfoDict
+from app.core.types import RateLimitAlgorithm, RateLimitInfoDict
 from app.services.cache import BaseRedisClient
 
+# Per-process sequence that keeps sorted set members unique when two requests for
+# the same key land in the same microsecond
+_next_request_seq = itertools.count().__next__
+
 
 class RateLimiter(BaseRedisClient):
     """
@@ -24,6 +31,8 @@ class RateLimiter(BaseRedisClient):
     3. Counts remaining requests in the window
     4. Allows or denies based on the limit
 
+    Steps 1-3 run as a single Lua script (EVALSHA), so each check costs one round trip.
+
     Example:
         ```python
         # Check rate limit
@@ -39,8 +48,89 @@ class RateLimiter(BaseRedisClient):
         ```
     """
 
+    # Trim, add, count and expire, run atomically server-side in a single round trip.
+    # KEYS[1]: rate limit key; ARGV: window start, now, member, window seconds.
+    _SLIDING_WINDOW_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[3])
+local count = redis.call('ZCARD', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return count
+"""
+    _SLIDING_WINDOW_SHA = hashlib.sha1(
+        _SLIDING_WINDOW_SCRIPT.encode(), usedforsecurity=False
+    ).hexdigest()
+
+    async def _record_request(
+        self, redis_client: Redis, key: str, window_start: int, now: int, member: str, window: int
+    ) -> int:
+        """
+        Record a request in the sliding window and count the requests inside it.
+
+        Args:
+            redis_client: Connected Redis client
+            key: Redis key for rate limiting
+            window_start: Scores at or below this are dropped (microseconds)
+            now: Score of the current request (microseconds)
+            member: Unique sorted set member for the current request
+            window: Key expiration in seconds
+
+        Returns:
+            int: Number of requests in the window, including the current one
+        """
+        args = (window_start, now, member, window)
+        try:
+            count = await redis_client.evalsha(  # type: ignore[misc]
+                self._SLIDING_WINDOW_SHA, 1, key, *args
+            )
+        except NoScriptError:
+            # Script cache is empty (restart or SCRIPT FLUSH); EVAL runs and reloads it
+            count = await redis_client.eval(  # type: ignore[misc]
+                self._SLIDING_WINDOW_SCRIPT, 1, key, *args
+            )
+        return int(count)
+
+    def _fixed_window_bucket(self, key: str, window: int) -> tuple[str, int]:
+        """
+        Get the counter key of the current fixed window.
+
+        Args:
+            key: Redis key for rate limiting
+            window: Window length in seconds
+
+        Returns:
+            tuple[str, int]: Counter key of the current window, and the Unix time it ends
+        """
+        bucket = int(time.time()) // window
+        return f"{key}:{bucket}", (bucket + 1) * window
+
+    async def _count_fixed_window(
+        self, redis_client: Redis, key: str, window: int
+    ) -> tuple[int, int]:
+        """
+        Count a request in the current fixed window.
+
+        Args:
+            redis_client: Connected Redis client
+            key: Redis key for rate limiting
+            window: Window length in seconds
+
+        Returns:
+            tuple[int, int]: Requests in the window including the current one, and the
+                Unix time the window ends
+        """
+        bucket_key, reset_time = self._fixed_window_bucket(key, window)
+
+        pipe = redis_client.pipeline(transaction=False)
+        # Only the first request of a window creates the counter and sets its expiry
+        pipe.set(bucket_key, 0, ex=window, nx=True)
+        pipe.incr(bucket_key)
+        _, count = await pipe.execute()
+
+        return int(count), reset_time
+
     async def check_rate_limit(
-        self, key: str, limit: int, window: int = 60
+        self, key: str, limit: int, window: int = 60, algorithm: RateLimitAlgorithm = "sliding"
     ) -> tuple[bool, RateLimitInfoDict]:
         """
         Check if rate limit is exceeded for a given key.
@@ -49,6 +139,9 @@ class RateLimiter(BaseRedisClient):
             key: Redis key for rate limiting (e.g., "ratelimit:auth:192.168.1.1")
             limit: Maximum number of requests allowed in the time window
             window: Time window in seconds (default: 60)
+            algorithm: "sliding" (default) counts requests in the last `window` seconds
+                exactly; "fixed" counts per calendar window with a single counter, which
+                is cheaper but allows up to 2x `limit` across a window boundary
 
         Returns:
             tuple[bool, RateLimitInfo]: (is_allowed, rate_limit_info)
@@ -74,7 +167,8 @@ class RateLimiter(BaseRedisClient):
             )
 
         # Check if Redis client is available
-        if not self.redis_client:
+        redis_client = self.redis_client
+        if not redis_client:
             logger.warning(
                 f"Redis client not initialized in RateLimiter, allowing request for key {key}"
             )
@@ -83,36 +177,25 @@ class RateLimiter(BaseRedisClient):
             )
 
         try:
-            now = int(time.time() * 1000000)  # Current time in microseconds
-            window_start = now - (window * 1000000)  # Window start time in microseconds
-
-            # Create pipeline for atomic operations
-            pipe = self.redis_client.pipeline()
-
-            # 1. Remove requests older than the window
-            pipe.zremrangebyscore(key, 0, window_start)
-
-            # 2. Add current request with unique timestamp-based member
-            # Format: "{timestamp}:{hash}" to ensure uniqueness
-            member = (
-                f"{now}:{hashlib.md5(str(now).encode(), usedforsecurity=False).hexdigest()[:8]}"
-            )
-            pipe.zadd(key, {member: now})
-
-            # 3. Count requests in current window (AFTER adding current request)
-            pipe.zcard(key)
-
-            # 4. Set expiration on key to auto-cleanup
-            pipe.expire(key, window)
-
-            # Execute pipeline
-            results = await pipe.execute()
-            request_count = results[2]  # ZCARD result (index 2 now, after ZADD)
+            if algorithm == "fixed":
+                request_count, reset_time = await self._count_fixed_window(
+                    redis_client, key, window
+                )
+            else:
+                now = time.time_ns() // 1000  # Current time in microseconds
+                window_start = now - window * 1_000_000  # Window start time in microseconds
+
+                # Add current request with unique timestamp-based member
+                # Format: "{timestamp}:{sequence}" to ensure uniqueness
+                member = f"{now}:{_next_request_seq()}"
+                request_count = await self._record_request(
+                    redis_client, key, window_start, now, member, window
+                )
+                reset_time = now // 1_000_000 + window
 
             # Calculate rate limit info
             # request_count already includes the current request
             remaining = max(0, limit - request_count)
-            reset_time = now + window
             is_allowed = request_count <= limit  # Changed from < to <=
 
             rate_limit_info = RateLimitInfoDict(
@@ -131,7 +214,9 @@ class RateLimiter(BaseRedisClient):
                 window=window,
             )
 
-    async def get_limit_info(self, key: str, limit: int, window: int = 60) -> RateLimitInfoDict:
+    async def get_limit_info(
+        self, key: str, limit: int, window: int = 60, algorithm: RateLimitAlgorithm = "sliding"
+    ) -> RateLimitInfoDict:
         """
         Get current rate limit information without modifying counters.
 
@@ -139,6 +224,7 @@ class RateLimiter(BaseRedisClient):
             key: Redis key for rate limiting
             limit: Maximum number of requests allowed
             window: Time window in seconds (default: 60)
+            algorithm: Algorithm the key is checked with, see check_rate_limit()
 
         Returns:
             RateLimitInfo: Current rate limit status
@@ -147,7 +233,8 @@ class RateLimiter(BaseRedisClient):
             This method only reads the current state, it does NOT increment counters.
             Use check_rate_limit() for actual rate limiting with counter increment.
         """
-        if not settings.rate_limit_enabled or not self.redis_client:
+        redis_client = self.redis_client
+        if not settings.rate_limit_enabled or not redis_client:
             return RateLimitInfoDict(
                 limit=limit,
                 remaining=limit,
@@ -156,18 +243,28 @@ class RateLimiter(BaseRedisClient):
             )
 
         try:
-            now = int(time.time())
-            window_start = now - window
+            if algorithm == "fixed":
+                bucket_key, reset_time = self._fixed_window_bucket(key, window)
+                request_count = int(await redis_client.get(bucket_key) or 0)
+                return RateLimitInfoDict(
+                    limit=limit,
+                    remaining=max(0, limit - request_count),
+                    reset_time=reset_time,
+                    window=window,
+                )
+
+            now = time.time_ns() // 1000  # Current time in microseconds
+            window_start = now - window * 1_000_000
 
             # Count requests in current window without modifying
-            pipe = self.redis_client.pipeline()
+            pipe = redis_client.pipeline()
             pipe.zremrangebyscore(key, 0, window_start)  # Clean old entries
             pipe.zcard(key)
             results = await pipe.execute()
 
             request_count = results[1]
             remaining = max(0, limit - request_count)
-            reset_time = now + window
+            reset_time = now // 1_000_000 + window
 
             return RateLimitInfoDict(
                 limit=limit, remaining=remaining, reset_time=reset_time, window=window
@@ -179,12 +276,16 @@ class RateLimiter(BaseRedisClient):
                 limit=limit, remaining=limit, reset_time=int(time.time()) + window, window=window
             )
 
-    async def reset_limit(self, key: str) -> bool:
+    async def reset_limit(
+        self, key: str, window: int = 60, algorithm: RateLimitAlgorithm = "sliding"
+    ) -> bool:
         """
         Reset rate limit for a specific key.
 
         Args:
             key: Redis key to reset
+            window: Time window in seconds (default: 60), used by the fixed window
+            algorithm: Algorithm the key is checked with, see check_rate_limit()
 
         Returns:
             bool: True if key was deleted, False otherwise
@@ -192,12 +293,16 @@ class RateLimiter(BaseRedisClient):
         Note:
             This is useful for testing or manual intervention (e.g., unblocking a user).
         """
-        if not settings.rate_limit_enabled or not self.redis_client:
+        redis_client = self.redis_client
+        if not settings.rate_limit_enabled or not redis_client:
             logger.debug(f"Skipping rate limit reset for key {key} (disabled or no Redis)")
             return True
 
         try:
-            deleted = await self.redis_client.delete(key)
+            redis_key = key
+            if algorithm == "fixed":
+                redis_key, _ = self._fixed_window_bucket(key, window)
+            deleted = await redis_client.delete(redis_key)
             if deleted:
                 logger.info(f"Rate limit reset for key {key}")
             return bool(deleted > 0)
@@ -1,7 +1,85 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Generic, TypeVar
+
 from loguru import logger
 
 from app.core.config import Environment, settings
 from app.services.cache import BaseRedisClient
+from app.services.cache.user_cache import user_cache
+
+V = TypeVar("V")
+
+
+class _LocalTTLCache(Generic[V]):
+    """Per-worker LRU whose entries expire after a TTL."""
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        """
+        Args:
+            max_size: Maximum number of entries; the least recently used is evicted.
+            ttl_seconds: Default seconds an entry stays valid. Zero or less disables caching.
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: str) -> V | None:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            V | None: The cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: V, ttl_seconds: float | None = None) -> None:
+        """
+        Cache a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl_seconds: Seconds the entry stays valid, math.inf for no expiry.
+                Defaults to the cache's TTL.
+        """
+        if self.ttl_seconds <= 0:
+            return
+
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Drop a cached value.
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        self._entries.clear()
 
 
 class TokenBlacklist(BaseRedisClient):
@@ -15,11 +93,117 @@ class TokenBlacklist(BaseRedisClient):
     Redis-based token revocation for JWT tokens.
     Stores revoked token JTIs (JWT IDs) with TTL matching token expiration.
 
+    Lookups are cached per worker: a revoked JTI is cached until evicted (its Redis
+    key only expires once the token itself has), a non-revoked JTI and each user's
+    revoke-all marker for ``token_revocation_cache_ttl`` seconds. Revocations are
+    published on REVOCATION_CHANNEL and USER_REVOCATION_CHANNEL so every worker
+    drops its stale entry at once.
+
     Reference: https://cheatsheetseries.owasp.org/cheatsheets/JSON_Web_Token_for_Java_Cheat_Sheet.html
     """
 
-    # Key prefix for blacklisted tokens
-    KEY_PREFIX = "token:blacklist:"
+    # Key prefix for blacklisted tokens, followed by a 16-byte digest of the JTI
+    KEY_PREFIX = b"tb:"
+    # Key prefix used before JTIs were hashed. Such keys expire with their tokens,
+    # so checking them can be dropped once the longest token lifetime has passed.
+    LEGACY_KEY_PREFIX = "token:blacklist:"
+    # Pub/sub channel carrying the JTI of every newly revoked token
+    REVOCATION_CHANNEL = "token:revoked"
+    # Pub/sub channel carrying the user ID of every revoke-all
+    USER_REVOCATION_CHANNEL = "token:user_revoked"
+
+    def __init__(self) -> None:
+        super().__init__()
+        max_size = settings.token_revocation_cache_max_size
+        ttl = settings.token_revocation_cache_ttl
+        self._jti_cache: _LocalTTLCache[bool] = _LocalTTLCache(max_size, ttl)
+        # User ID -> revoke-all Unix timestamp, 0 when the user has none
+        self._user_revocation_cache: _LocalTTLCache[int] = _LocalTTLCache(max_size, ttl)
+        self._listener_task: asyncio.Task[None] | None = None
+
+    def _blacklist_key(self, jti: str) -> bytes:
+        """
+        Build the blacklist key of a token.
+
+        Args:
+            jti: The JWT ID (jti claim) of the token
+
+        Returns:
+            bytes: KEY_PREFIX followed by a 16-byte BLAKE2b digest of the JTI
+        """
+        return self.KEY_PREFIX + blake2b(jti.encode(), digest_size=16).digest()
+
+    def _get_cached_revocation(self, jti: str) -> bool | None:
+        """
+        Get the cached revocation state of a token.
+
+        Args:
+            jti: The JWT ID (jti claim) to look up
+
+        Returns:
+            bool | None: Cached revocation state, or None if missing or expired
+        """
+        return self._jti_cache.get(jti)
+
+    def _cache_revocation(self, jti: str, revoked: bool) -> None:
+        """
+        Cache the revocation state of a token.
+
+        Args:
+            jti: The JWT ID (jti claim) to cache
+            revoked: Whether the token is revoked
+        """
+        self._jti_cache.set(jti, revoked, ttl_seconds=math.inf if revoked else None)
+
+    def clear_revocation_cache(self) -> None:
+        """Drop every cached revocation state."""
+        self._jti_cache.clear()
+        self._user_revocation_cache.clear()
+
+    def start_revocation_listener(self) -> None:
+        """
+        Start listening for revocations published by other workers.
+
+        The listener holds one pooled Redis connection for the worker's lifetime and is
+        stopped by close(). Does nothing in LOCAL or without a Redis client.
+        """
+        if not self.redis_client or self._listener_task is not None:
+            return
+
+        self._listener_task = asyncio.create_task(self._listen_for_revocations())
+
+    async def _listen_for_revocations(self) -> None:
+        """Apply revocations published by other workers, reconnecting on errors."""
+        user_channel = self.USER_REVOCATION_CHANNEL.encode()
+        while self.redis_client:
+            try:
+                async with self.redis_client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(self.REVOCATION_CHANNEL, self.USER_REVOCATION_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["channel"] == user_channel:
+                            user_id = message["data"].decode()
+                            self._user_revocation_cache.invalidate(user_id)
+                            user_cache.invalidate(user_id)
+                        else:
+                            self._cache_revocation(message["data"].decode(), revoked=True)
+            except Exception:
+                logger.exception("Token revocation listener failed, resubscribing")
+                # Revocations published while disconnected were missed
+                self.clear_revocation_cache()
+                user_cache.clear()
+                await asyncio.sleep(1)
+
+    async def close(self) -> None:
+        """Stop the revocation listener and close the Redis connection."""
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+        await super().close()
 
     async def revoke_token(self, jti: str, ttl_seconds: int) -> bool:
         """
@@ -37,20 +221,27 @@ class TokenBlacklist(BaseRedisClient):
             logger.debug(f"Token blacklist skipped in LOCAL environment: {jti}")
             return True
 
-        if not self.redis_client:
+        redis_client = self.redis_client
+        if not redis_client:
             logger.warning("Redis client not initialized in TokenBlacklist")
             return False
 
         try:
-            key = f"{self.KEY_PREFIX}{jti}"
-            # Store with expiration matching token TTL
-            await self.redis_client.setex(key, ttl_seconds, "revoked")
+            # Store with expiration matching token TTL; the key's presence is the signal
+            await redis_client.set(self._blacklist_key(jti), b"", ex=ttl_seconds)
+            self._cache_revocation(jti, revoked=True)
             logger.info(f"Token revoked: {jti[:8]}... (TTL: {ttl_seconds}s)")
-            return True
         except Exception:
             logger.exception(f"Failed to revoke token {jti[:8]}...")
             return False
 
+        try:
+            await redis_client.publish(self.REVOCATION_CHANNEL, jti)
+        except Exception:
+            # Other workers still see the revocation once their cached entry expires
+            logger.warning(f"Failed to publish revocation of token {jti[:8]}...")
+        return True
+
     async def is_revoked(self, jti: str) -> bool:
         """
         Check if a token has been revoked.
@@ -65,20 +256,31 @@ class TokenBlacklist(BaseRedisClient):
         if settings.current_environment == Environment.LOCAL:
             return False
 
-        if not self.redis_client:
+        redis_client = self.redis_client
+        if not redis_client:
             logger.warning("Redis client not initialized in TokenBlacklist")
             # Fail open - if Redis is unavailable, don't block requests
             # In high-security environments, you may want to fail closed instead
             return False
 
+        cached = self._get_cached_revocation(jti)
+        if cached is not None:
+            return cached
+
         try:
-            key = f"{self.KEY_PREFIX}{jti}"
-            return bool(await self.redis_client.exists(key) > 0)
+            revoked = bool(
+                await redis_client.exists(
+                    self._blacklist_key(jti), f"{self.LEGACY_KEY_PREFIX}{jti}"
+                )
+            )
         except Exception:
             logger.exception(f"Failed to check token revocation {jti[:8]}...")
             # Fail open on error
             return False
 
+        self._cache_revocation(jti, revoked)
+        return revoked
+
     async def revoke_all_user_tokens(self, user_id: str, ttl_seconds: int) -> bool:
         """
         Revoke all tokens for a specific user (for password change, account compromise, etc.)
@@ -93,25 +295,36 @@ class TokenBlacklist(BaseRedisClient):
         Returns:
             bool: True if successfully stored, False otherwise
         """
+        # Drop this worker's cached copy right away; other workers drop theirs when
+        # the revocation is published below
+        user_cache.invalidate(user_id)
+
         if settings.current_environment == Environment.LOCAL:
             return True
 
-        if not self.redis_client:
+        redis_client = self.redis_client
+        if not redis_client:
             logger.warning("Redis client not initialized in TokenBlacklist")
             return False
 
         try:
-            import time
-
             key = f"token:revoke_all:{user_id}"
+            revoked_at = int(time.time())
             # Store the timestamp when all tokens were revoked
-            await self.redis_client.setex(key, ttl_seconds, str(int(time.time())))
+            await redis_client.setex(key, ttl_seconds, str(revoked_at))
+            self._user_revocation_cache.set(user_id, revoked_at)
             logger.info(f"All tokens revoked for user: {user_id}")
-            return True
         except Exception:
             logger.exception(f"Failed to revoke all tokens for user {user_id}")
             return False
 
+        try:
+            await redis_client.publish(self.USER_REVOCATION_CHANNEL, user_id)
+        except Exception:
+            # Other workers still see the marker once their cached entry expires
+            logger.warning(f"Failed to publish revocation of all tokens for user {user_id}")
+        return True
+
     async def get_user_revocation_time(self, user_id: str) -> int | None:
         """
         Get the timestamp when all tokens were revoked for a user.
@@ -125,19 +338,79 @@ class TokenBlacklist(BaseRedisClient):
         if settings.current_environment == Environment.LOCAL:
             return None
 
-        if not self.redis_client:
+        redis_client = self.redis_client
+        if not redis_client:
             return None
 
+        cached = self._user_revocation_cache.get(user_id)
+        if cached is not None:
+            return cached or None
+
         try:
             key = f"token:revoke_all:{user_id}"
-            value = await self.redis_client.get(key)
-            if value:
-                return int(value)
-            return None
+            value = await redis_client.get(key)
         except Exception:
             logger.exception(f"Failed to get revocation time for user {user_id}")
             return None
 
+        revoked_at = int(value) if value else 0
+        self._user_revocation_cache.set(user_id, revoked_at)
+        return revoked_at or None
+
+    async def get_revocation_state(self, jti: str | None, user_id: str) -> tuple[bool, int | None]:
+        """
+        Check a token's own revocation and its user's revoke-all marker together.
+
+        Combines is_revoked() and get_user_revocation_time() into one pipelined round
+        trip, and skips whichever lookup is already cached in this worker.
+
+        Args:
+            jti: The JWT ID (jti claim) to check, if the token has one
+            user_id: The user ID whose revoke-all marker to read
+
+        Returns:
+            tuple[bool, int | None]: Whether the token is revoked, and the Unix timestamp
+                all of the user's tokens were revoked at (None if never)
+        """
+        if settings.current_environment == Environment.LOCAL:
+            return False, None
+
+        redis_client = self.redis_client
+        if not redis_client:
+            logger.warning("Redis client not initialized in TokenBlacklist")
+            # Fail open, as in is_revoked()
+            return False, None
+
+        revoked = self._get_cached_revocation(jti) if jti else False
+        if revoked:
+            return True, None
+
+        revoked_at = self._user_revocation_cache.get(user_id)
+        if revoked is not None and revoked_at is not None:
+            return False, revoked_at or None
+
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            if jti and revoked is None:
+                pipe.exists(self._blacklist_key(jti), f"{self.LEGACY_KEY_PREFIX}{jti}")
+            if revoked_at is None:
+                pipe.get(f"token:revoke_all:{user_id}")
+            results = iter(await pipe.execute())
+        except Exception:
+            logger.exception(f"Failed to check token revocation for user {user_id}")
+            # Fail open on error
+            return False, None
+
+        if jti and revoked is None:
+            revoked = bool(next(results))
+            self._cache_revocation(jti, revoked)
+        if revoked_at is None:
+            value = next(results)
+            revoked_at = int(value) if value else 0
+            self._user_revocation_cache.set(user_id, revoked_at)
+
+        return bool(revoked), revoked_at or None
+
 
 # Global token blacklist instance
 token_blacklist = TokenBlacklist()
@@ -0,0 +1,98 @@
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.models.user import User
+
+
+class UserCache:
+    """
+    In-process TTL/LRU cache of authenticated users keyed by user ID.
+
+    Saves the primary-key lookup that token validation would otherwise run on
+    every authenticated request. Entries are snapshots of the user's column
+    values, and every get() builds a new detached User from them, so concurrent
+    requests never share an instance: changing one, or passing it to
+    ``session.add``/``merge``, does not affect the cache or other requests.
+
+    The cache is per worker. A revoke-all drops the entry in the worker that ran
+    it, and TokenBlacklist's revocation listener drops it in every other worker;
+    any other change to a user is picked up once the TTL elapses. Token revocation
+    itself is still checked in Redis before the cache is consulted.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        """
+        Args:
+            max_size: Maximum number of cached users; the least recently used is evicted.
+            ttl_seconds: Seconds an entry stays valid. Zero or less disables caching.
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def get(self, user_id: str | int | uuid.UUID) -> User | None:
+        """
+        Get a cached user.
+
+        Args:
+            user_id: The user ID to look up
+
+        Returns:
+            User | None: A new detached copy of the cached user, or None if missing or expired
+        """
+        key = str(user_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, values = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        user = User(**values)
+        # Detached with its identity, so a session treats it as the existing row
+        make_transient_to_detached(user)
+        return user
+
+    def set(self, user_id: str | int | uuid.UUID, user: User) -> None:
+        """
+        Cache a snapshot of a user's column values until the TTL elapses.
+
+        Args:
+            user_id: The user ID to cache the user under
+            user: The user to cache; later changes to it are not reflected in the cache
+        """
+        if self.ttl_seconds <= 0 or self.max_size <= 0:
+            return
+
+        key = str(user_id)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, user.to_dict())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: str | int | uuid.UUID) -> None:
+        """
+        Drop a user from the cache.
+
+        Args:
+            user_id: The user ID to drop
+        """
+        self._entries.pop(str(user_id), None)
+
+    def clear(self) -> None:
+        """Drop every cached user."""
+        self._entries.clear()
+
+
+user_cache = UserCache(
+    max_size=settings.user_cache_max_size,
+    ttl_seconds=settings.user_cache_ttl,
+)
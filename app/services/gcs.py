@@ -21,6 +21,7 @@ from app.schemas import (
     BucketFolder,
     ServiceAccount,
 )
+from app.schemas.google_bucket import SERVICE_ACCOUNT_ADAPTER
 
 
 @dataclass(init=False)
@@ -54,17 +55,19 @@ class GCS:
 
         Raises:
             NotImplementedError: If the provided service_account_info type is not supported.
+            ValidationError: If a service account dict is missing required fields.
         """
         if isinstance(service_account_info, (str, Path)):
             self.__service_account_info = str(service_account_info)
-        elif isinstance(service_account_info, ServiceAccount):
+        elif isinstance(service_account_info, dict):
+            account = SERVICE_ACCOUNT_ADAPTER.validate_python(service_account_info)
             self.__service_account_info = {
                 "type": "service_account",
-                "project_id": service_account_info.project_id,
-                "private_key_id": service_account_info.private_key_id,
-                "private_key": service_account_info.private_key,
-                "client_email": service_account_info.client_email,
-                "client_id": service_account_info.client_id,
+                "project_id": account["project_id"],
+                "private_key_id": account["private_key_id"],
+                "private_key": account["private_key"],
+                "client_email": account["client_email"],
+                "client_id": account["client_id"],
                 "auth_uri": "https://accounts.google.com/o/oauth2/auth",
                 "token_uri": "https://oauth2.googleapis.com/token",  # nosec B105
                 "auth_provider_x509_cert_url": "https://www.googleapis.com/oauth2/v1/certs",
@@ -1,3 +1,5 @@
+from dataclasses import asdict
+
 from celery import Task
 from faker import Faker
 from loguru import logger
@@ -42,7 +44,7 @@ def seed_fake_users_task(self: Task, count: int = 100) -> int:
         logger.info(f"appended user: {user_new.username}")
 
     with session_factory() as session:
-        values = [schema.model_dump(exclude_none=True) for schema in all_users]
+        values = [asdict(schema) for schema in all_users]
         stmt = insert(User).values(values)
         session.execute(stmt)
         session.commit()
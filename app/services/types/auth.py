@@ -1,4 +1,7 @@
-from typing import TypedDict
+from typing import Literal, TypedDict
+
+# Outcome of a non-raising JWT decode
+JWTDecodeStatus = Literal["ok", "expired", "claims", "invalid"]
 
 
 class TokenPairDict(TypedDict):
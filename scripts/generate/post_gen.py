@@ -221,8 +221,8 @@ def remove_apple_pay() -> None:
     config_path = Path("app/core/config.py")
     content = config_path.read_text(encoding="utf-8")
     content = content.replace(
-        "from app.core.credentials import ApplePayStoreCredentials, FirebaseServiceAccount",
-        "from app.core.credentials import FirebaseServiceAccount",
+        "from app.core.credentials import ApplePayStoreCredentials, FirebaseServiceAccount, read_key_file",
+        "from app.core.credentials import FirebaseServiceAccount, read_key_file",
     )
     config_path.write_text(content, encoding="utf-8")
     strip_marked_block(config_path, *APPLE_PAY_SETTINGS_MARKERS)
@@ -1,15 +1,25 @@
+import threading
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from fastapi.security import OAuth2PasswordRequestForm
 from jose import jwt
 from jose.exceptions import JWTClaimsError, JWTError
-
-from app.api.v1.deps.auth import generate_refresh_token, get_current_user
+from pydantic import SecretStr
+
+from app.api.v1.deps.auth import (
+    generate_access_token,
+    generate_refresh_token,
+    get_current_user,
+    login_user_for_access_token,
+)
 from app.core.config import settings
 from app.core.exceptions.http_exceptions import UnauthorizedException
 from app.models.user import User
-from app.schemas import TokenPayload
+from app.schemas import TokenData, TokenPayload, UserSignup
+from app.services.auth_service import AuthService
+from app.services.exceptions.auth import ValidationError as ServiceValidationError
 
 
 @pytest.mark.anyio
@@ -38,7 +48,7 @@ class TestGetCurrentUserEdgeCases:
             mock_decode.side_effect = JWTClaimsError("Invalid claims")
 
             with pytest.raises(UnauthorizedException, match="Token has invalid claims"):
-                await get_current_user("invalid_token", db_session)
+                await get_current_user("header.payload.signature", db_session)
 
     async def test_jwt_error(self, db_session):
         """Test that general JWTError is caught and handled."""
@@ -62,6 +72,15 @@ class TestGetCurrentUserEdgeCases:
         with pytest.raises(UnauthorizedException, match="Could not validate credentials"):
             await get_current_user(token_without_sub, db_session)
 
+    async def test_token_data_built_without_validation(self, db_session, user: User):
+        """Test that decoded claims are not re-validated through TokenData."""
+        token = AuthService.create_access_token(subject=user.id)["token"]
+
+        with patch.object(TokenData, "__init__", side_effect=AssertionError("validated")):
+            current_user = await get_current_user(token, db_session)
+
+        assert current_user.id == user.id
+
     async def test_missing_exp(self, db_session, user: User):
         """Test that missing 'exp' in token raises exception."""
         # Create token without 'exp' claim
@@ -94,8 +113,7 @@ class TestGetCurrentUserEdgeCases:
         )
 
         with patch("app.services.auth_service.token_blacklist") as mock_blacklist:
-            mock_blacklist.is_revoked = AsyncMock(return_value=False)
-            mock_blacklist.get_user_revocation_time = AsyncMock(return_value=None)
+            mock_blacklist.get_revocation_state = AsyncMock(return_value=(False, None))
 
             with pytest.raises(UnauthorizedException, match="User not found"):
                 await get_current_user(valid_token, db_session)
@@ -133,6 +151,49 @@ class TestGetCurrentUserEdgeCases:
             await get_current_user(wrong_key_token, db_session)
 
 
+@pytest.mark.anyio
+class TestDecodeJwt:
+    """Test the non-raising JWT decoder."""
+
+    async def test_valid_token(self, user: User):
+        """Test a valid token decodes with an ok status."""
+        token = AuthService.create_access_token(subject=user.id)["token"]
+
+        status, payload = AuthService.decode_jwt(token)
+
+        assert status == "ok"
+        assert payload is not None
+        assert payload["sub"] == str(user.id)
+
+    async def test_expired_token(self):
+        """Test an expired token reports the expired status."""
+        token = AuthService.create_access_token(subject=1, expires_delta=timedelta(seconds=-10))[
+            "token"
+        ]
+
+        assert AuthService.decode_jwt(token) == ("expired", None)
+
+    async def test_claims_error(self):
+        """Test a claims error reports the claims status."""
+        with patch("app.services.auth_service.jwt.decode") as mock_decode:
+            mock_decode.side_effect = JWTClaimsError("Invalid claims")
+
+            assert AuthService.decode_jwt("header.payload.signature") == ("claims", None)
+
+    async def test_wrong_signature(self):
+        """Test a token signed with another key reports the invalid status."""
+        token = jwt.encode({"sub": "1"}, "wrong-secret-key", algorithm=settings.jwt_algorithm)
+
+        assert AuthService.decode_jwt(token) == ("invalid", None)
+
+    async def test_malformed_token_skips_jwt_library(self):
+        """Test a token without three segments is rejected without decoding."""
+        with patch("app.services.auth_service.jwt.decode") as mock_decode:
+            assert AuthService.decode_jwt("not-a-jwt") == ("invalid", None)
+
+            mock_decode.assert_not_called()
+
+
 @pytest.mark.anyio
 class TestGenerateRefreshToken:
     """Test generate_refresh_token function."""
@@ -251,3 +312,89 @@ class TestGenerateRefreshToken:
         assert result["access_token"] != original_refresh
         assert result["refresh_token"] != original_refresh
         assert result["access_token"] != result["refresh_token"]
+
+
+@pytest.mark.anyio
+class TestPasswordHashingOffEventLoop:
+    """Test that password hashing and verification run in worker threads."""
+
+    async def test_login_verifies_password_in_worker_thread(
+        self, db_session, user: User, default_password: str
+    ):
+        """Test that login verifies the password outside the event loop thread."""
+        loop_thread = threading.get_ident()
+        verify_threads = []
+        original_verify = AuthService.verify_password
+
+        def track_verify(service, plain_password, hashed_password):
+            verify_threads.append(threading.get_ident())
+            return original_verify(service, plain_password, hashed_password)
+
+        form = OAuth2PasswordRequestForm(username=user.username, password=default_password)
+
+        with patch.object(AuthService, "verify_password", track_verify):
+            tokens = await login_user_for_access_token(form, db_session)
+
+        assert tokens["access_token"]
+        assert verify_threads and loop_thread not in verify_threads
+
+    async def test_signup_hashes_password_in_worker_thread(self, db_session, faker):
+        """Test that signup hashes the password outside the event loop thread."""
+        loop_thread = threading.get_ident()
+        hash_threads = []
+        original_hash = AuthService.get_password_hash
+
+        def track_hash(service, password):
+            hash_threads.append(threading.get_ident())
+            return original_hash(service, password)
+
+        signup = UserSignup(
+            username="worker_thread_user1",
+            email=faker.safe_email(),
+            password=SecretStr("P@ssword123"),
+        )
+
+        with patch.object(AuthService, "get_password_hash", track_hash):
+            tokens = await generate_access_token(signup, db_session)
+
+        assert tokens["access_token"]
+        assert hash_threads and loop_thread not in hash_threads
+
+
+class TestDummyHash:
+    """Test the lazily computed timing-attack dummy hash."""
+
+    def test_service_construction_does_not_hash(self):
+        """Test that creating an AuthService computes no password hash."""
+        with patch("app.services.auth_service._dummy_hash") as mock_dummy_hash:
+            AuthService(user_repo=AsyncMock())
+
+            mock_dummy_hash.assert_not_called()
+
+    def test_dummy_hash_shared_between_services(self):
+        """Test that services sharing a hasher reuse one dummy hash."""
+        first = AuthService(user_repo=AsyncMock())._get_dummy_hash()
+        second = AuthService(user_repo=AsyncMock())._get_dummy_hash()
+
+        assert first == second
+
+    def test_injected_dummy_hash_is_used(self):
+        """Test that an injected dummy hash takes precedence."""
+        service = AuthService(user_repo=AsyncMock(), dummy_hash="injected")
+
+        assert service._get_dummy_hash() == "injected"
+
+    @pytest.mark.anyio
+    async def test_unknown_user_verifies_against_dummy_hash(self):
+        """Test that login for an unknown user still runs a password verification."""
+        user_repo = AsyncMock()
+        user_repo.get_by_identifier.return_value = None
+        service = AuthService(user_repo=user_repo)
+
+        with (
+            patch.object(AuthService, "verify_password", return_value=False) as mock_verify,
+            pytest.raises(ServiceValidationError),
+        ):
+            await service.authenticate_user("missing-user", "password")
+
+        mock_verify.assert_called_once_with("password", service._get_dummy_hash())
@@ -157,6 +157,7 @@ class TestRateLimitAPI:
                     key="ratelimit:api:192.168.1.1",
                     limit=settings.rate_limit_default,
                     window=settings.rate_limit_window,
+                    algorithm="fixed",
                 )
 
     async def test_blocks_request_over_limit(self):
@@ -232,6 +233,7 @@ class TestRateLimitPublic:
                     key="ratelimit:public:192.168.1.1",
                     limit=settings.rate_limit_lenient,
                     window=settings.rate_limit_window,
+                    algorithm="fixed",
                 )
 
     async def test_blocks_request_over_limit(self):
@@ -37,8 +37,7 @@ class TestAccessTokenTypeValidation:
         )
 
         with patch("app.services.auth_service.token_blacklist") as mock_blacklist:
-            mock_blacklist.is_revoked = AsyncMock(return_value=False)
-            mock_blacklist.get_user_revocation_time = AsyncMock(return_value=None)
+            mock_blacklist.get_revocation_state = AsyncMock(return_value=(False, None))
 
             with pytest.raises(UnauthorizedException) as exc_info:
                 await get_current_user(token=refresh_token, db=db_session)
@@ -66,8 +65,7 @@ class TestAccessTokenTypeValidation:
         )
 
         with patch("app.services.auth_service.token_blacklist") as mock_blacklist:
-            mock_blacklist.is_revoked = AsyncMock(return_value=False)
-            mock_blacklist.get_user_revocation_time = AsyncMock(return_value=None)
+            mock_blacklist.get_revocation_state = AsyncMock(return_value=(False, None))
 
             with pytest.raises(UnauthorizedException) as exc_info:
                 await get_current_user(token=token_no_type, db=db_session)
@@ -96,8 +94,7 @@ class TestAccessTokenTypeValidation:
         )
 
         with patch("app.services.auth_service.token_blacklist") as mock_blacklist:
-            mock_blacklist.is_revoked = AsyncMock(return_value=False)
-            mock_blacklist.get_user_revocation_time = AsyncMock(return_value=None)
+            mock_blacklist.get_revocation_state = AsyncMock(return_value=(False, None))
 
             with pytest.raises(UnauthorizedException) as exc_info:
                 await get_current_user(token=token_invalid_type, db=db_session)
@@ -231,10 +228,9 @@ class TestTokenBlacklistIntegration:
             algorithm=settings.jwt_algorithm,
         )
 
-        # Mock token_blacklist to return True for is_revoked
+        # Mock token_blacklist to report the token as revoked
         with patch("app.services.auth_service.token_blacklist") as mock_blacklist:
-            mock_blacklist.is_revoked = AsyncMock(return_value=True)
-            mock_blacklist.get_user_revocation_time = AsyncMock(return_value=None)
+            mock_blacklist.get_revocation_state = AsyncMock(return_value=(True, None))
 
             with pytest.raises(UnauthorizedException) as exc_info:
                 await get_current_user(token=access_token, db=db_session)
@@ -242,8 +238,8 @@ class TestTokenBlacklistIntegration:
             assert exc_info.value.status_code == 401
             assert "revoked" in str(exc_info.value.detail).lower()
 
-            # Verify is_revoked was called with correct jti
-            mock_blacklist.is_revoked.assert_called_once_with(jti)
+            # Verify the revocation lookup used the token's jti and user
+            mock_blacklist.get_revocation_state.assert_called_once_with(jti, str(user.id))
 
     @pytest.mark.anyio
     async def test_token_issued_before_user_revocation(
@@ -270,9 +266,8 @@ class TestTokenBlacklistIntegration:
 
         # Mock token_blacklist
         with patch("app.services.auth_service.token_blacklist") as mock_blacklist:
-            mock_blacklist.is_revoked = AsyncMock(return_value=False)
             # Return a revocation time that's after token's iat
-            mock_blacklist.get_user_revocation_time = AsyncMock(return_value=revocation_time)
+            mock_blacklist.get_revocation_state = AsyncMock(return_value=(False, revocation_time))
 
             with pytest.raises(UnauthorizedException) as exc_info:
                 await get_current_user(token=access_token, db=db_session)
@@ -305,9 +300,8 @@ class TestTokenBlacklistIntegration:
 
         # Mock token_blacklist
         with patch("app.services.auth_service.token_blacklist") as mock_blacklist:
-            mock_blacklist.is_revoked = AsyncMock(return_value=False)
             # Return a revocation time that's before token's iat
-            mock_blacklist.get_user_revocation_time = AsyncMock(return_value=revocation_time)
+            mock_blacklist.get_revocation_state = AsyncMock(return_value=(False, revocation_time))
 
             # Should succeed
             current_user = await get_current_user(token=access_token, db=db_session)
@@ -47,6 +47,30 @@ class TestLogin:
         assert "exp" in payload
         assert "iat" in payload
 
+    @pytest.mark.anyio
+    async def test_login_with_email(
+        self,
+        client: AsyncClient,
+        user: User,
+        default_password: str,
+    ):
+        """Test login accepts the user's email in place of the username"""
+        response = await client.post(
+            "/v1/auth/login",
+            data={
+                "username": user.email,
+                "password": default_password,
+            },
+        )
+
+        assert response.status_code == 200
+        payload = jwt.decode(
+            response.json()["access_token"],
+            settings.secret_key,
+            algorithms=settings.jwt_algorithm,
+        )
+        assert payload["sub"] == str(user.id)
+
     @pytest.mark.anyio
     async def test_login_wrong_password(
         self,
@@ -168,6 +192,33 @@ class TestSignup:
             == "Unable to complete registration. Please check your input and try again."
         )
 
+    @pytest.mark.anyio
+    async def test_signup_duplicate_username(
+        self,
+        client: AsyncClient,
+    ):
+        """Test signup fails when username already exists"""
+        first_credentials = generate_user_credentials()
+        second_credentials = generate_user_credentials()
+        first_response = await client.post("/v1/auth/signup", data=first_credentials)
+        assert first_response.status_code == 201
+
+        response = await client.post(
+            "/v1/auth/signup",
+            data={
+                "username": first_credentials["username"],
+                "email": second_credentials["email"],
+                "password": second_credentials["password"],
+            },
+        )
+
+        assert response.status_code == 400
+        data = response.json()
+        assert (
+            data["detail"]
+            == "Unable to complete registration. Please check your input and try again."
+        )
+
     @pytest.mark.anyio
     async def test_signup_invalid_username_format(
         self,
@@ -850,8 +901,7 @@ class TestGetCurrentUser:
         )
 
         with patch("app.services.auth_service.token_blacklist") as mock_blacklist:
-            mock_blacklist.is_revoked = AsyncMock(return_value=False)
-            mock_blacklist.get_user_revocation_time = AsyncMock(return_value=None)
+            mock_blacklist.get_revocation_state = AsyncMock(return_value=(False, None))
 
             with pytest.raises(UnauthorizedException) as exc_info:
                 await get_current_user(token=token, db=db_session)
@@ -1006,7 +1056,6 @@ class TestAuthenticatedEndpoints:
 
         with patch("app.services.auth_service.token_blacklist") as mock_blacklist:
             mock_blacklist.is_revoked = AsyncMock(return_value=False)
-            mock_blacklist.get_user_revocation_time = AsyncMock(return_value=None)
 
             refresh_response = await client.post(
                 "/v1/auth/refresh-token",
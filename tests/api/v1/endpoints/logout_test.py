@@ -37,8 +37,7 @@ class TestLogoutEndpoint:
 
         # Mock the token blacklist (auth_service for auth validation + endpoint for revoke)
         with patch("app.services.auth_service.token_blacklist") as mock_auth_blacklist:
-            mock_auth_blacklist.is_revoked = AsyncMock(return_value=False)
-            mock_auth_blacklist.get_user_revocation_time = AsyncMock(return_value=None)
+            mock_auth_blacklist.get_revocation_state = AsyncMock(return_value=(False, None))
             with patch("app.api.v1.endpoints.auth.token_blacklist") as mock_blacklist:
                 mock_blacklist.revoke_token = AsyncMock(return_value=True)
 
@@ -129,8 +128,7 @@ class TestLogoutEndpoint:
 
         # Mock both get_current_user (to pass auth) and token_blacklist
         with patch("app.services.auth_service.token_blacklist") as mock_blacklist_deps:
-            mock_blacklist_deps.is_revoked = AsyncMock(return_value=False)
-            mock_blacklist_deps.get_user_revocation_time = AsyncMock(return_value=None)
+            mock_blacklist_deps.get_revocation_state = AsyncMock(return_value=(False, None))
 
             response = await client.post(
                 "/v1/auth/logout",
@@ -221,8 +219,7 @@ class TestLogoutEndpoint:
 
         # Mock token_blacklist to raise an exception
         with patch("app.services.auth_service.token_blacklist") as mock_auth_blacklist:
-            mock_auth_blacklist.is_revoked = AsyncMock(return_value=False)
-            mock_auth_blacklist.get_user_revocation_time = AsyncMock(return_value=None)
+            mock_auth_blacklist.get_revocation_state = AsyncMock(return_value=(False, None))
             with patch("app.api.v1.endpoints.auth.token_blacklist") as mock_blacklist:
                 mock_blacklist.revoke_token = AsyncMock(side_effect=Exception("Database error"))
 
@@ -261,8 +258,7 @@ class TestTokenRevocationIntegration:
 
         # Mock token_blacklist for logout (auth_service for auth + endpoint for revoke)
         with patch("app.services.auth_service.token_blacklist") as mock_auth_blacklist:
-            mock_auth_blacklist.is_revoked = AsyncMock(return_value=False)
-            mock_auth_blacklist.get_user_revocation_time = AsyncMock(return_value=None)
+            mock_auth_blacklist.get_revocation_state = AsyncMock(return_value=(False, None))
             with patch("app.api.v1.endpoints.auth.token_blacklist") as mock_blacklist:
                 mock_blacklist.revoke_token = AsyncMock(return_value=True)
 
@@ -273,10 +269,9 @@ class TestTokenRevocationIntegration:
                 )
                 assert logout_response.status_code == 200
 
-        # Mock token_blacklist to return True for is_revoked (token is blacklisted)
+        # Mock token_blacklist to report the token as revoked
         with patch("app.services.auth_service.token_blacklist") as mock_blacklist:
-            mock_blacklist.is_revoked = AsyncMock(return_value=True)
-            mock_blacklist.get_user_revocation_time = AsyncMock(return_value=None)
+            mock_blacklist.get_revocation_state = AsyncMock(return_value=(True, None))
 
             # Try to use the revoked token
             response = await client.get(
@@ -310,10 +305,9 @@ class TestTokenRevocationIntegration:
 
         # Mock token_blacklist to return a revocation time in the future of token's iat
         with patch("app.services.auth_service.token_blacklist") as mock_blacklist:
-            mock_blacklist.is_revoked = AsyncMock(return_value=False)
             # Set revocation time to now (after token was issued)
-            mock_blacklist.get_user_revocation_time = AsyncMock(
-                return_value=int(datetime.now(UTC).timestamp()) + 1
+            mock_blacklist.get_revocation_state = AsyncMock(
+                return_value=(False, int(datetime.now(UTC).timestamp()) + 1)
             )
 
             # Try to use the token
@@ -0,0 +1,95 @@
+"""Tests for the current-user endpoint."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+
+from app.models import User
+from app.repos import UserRepo
+from app.schemas import UserResponse
+
+
+class TestReadUserMe:
+    """Test suite for GET /v1/users/me endpoint."""
+
+    @pytest.mark.anyio
+    async def test_returns_current_user(
+        self,
+        client: AsyncClient,
+        user: User,
+        default_password: str,
+    ):
+        """Test the endpoint returns the authenticated user's public fields."""
+        login_response = await client.post(
+            "/v1/auth/login",
+            data={
+                "username": user.username,
+                "password": default_password,
+            },
+        )
+        access_token = login_response.json()["access_token"]
+
+        with patch("app.services.auth_service.token_blacklist") as mock_blacklist:
+            mock_blacklist.get_revocation_state = AsyncMock(return_value=(False, None))
+
+            response = await client.get(
+                "/v1/users/me",
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+
+        data = response.json()
+        assert data == UserResponse.model_validate(user).model_dump(mode="json")
+        assert "hashed_password" not in data
+
+    @pytest.mark.anyio
+    async def test_repeat_requests_reuse_cached_user(
+        self,
+        client: AsyncClient,
+        user: User,
+        default_password: str,
+    ):
+        """Test the user is loaded from the database once across requests."""
+        login_response = await client.post(
+            "/v1/auth/login",
+            data={
+                "username": user.username,
+                "password": default_password,
+            },
+        )
+        headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+        with (
+            patch("app.services.auth_service.token_blacklist") as mock_blacklist,
+            patch.object(UserRepo, "get_by_id", autospec=True, return_value=user) as mock_get,
+        ):
+            mock_blacklist.get_revocation_state = AsyncMock(return_value=(False, None))
+
+            first = await client.get("/v1/users/me", headers=headers)
+            second = await client.get("/v1/users/me", headers=headers)
+
+        assert first.status_code == 200
+        assert second.json() == first.json()
+        mock_get.assert_called_once()
+
+
+class TestDumpTrustedJson:
+    """Test serializing response schemas straight from database rows."""
+
+    @pytest.mark.anyio
+    async def test_serializes_model_attributes(self, user: User):
+        """Test that dump_trusted_json matches the validated schema's JSON."""
+        expected = UserResponse.model_validate(user).model_dump_json().encode()
+
+        assert UserResponse.dump_trusted_json(user) == expected
+
+    @pytest.mark.anyio
+    async def test_skips_validation(self, user: User):
+        """Test that dump_trusted_json does not run field validation."""
+        with patch.object(UserResponse, "model_validate") as mock_validate:
+            UserResponse.dump_trusted_json(user)
+
+            mock_validate.assert_not_called()
@@ -17,6 +17,7 @@ from app.core.db import get_session
 from app.main import app, v1_app, v2_app
 from app.models import Base, User
 from app.schemas import Token, UserCreate
+from app.services.cache.user_cache import user_cache
 
 DEFAULT_PASSWORD = "P@ssword123"
 _PASSWORD_HASH = PasswordHash.recommended()
@@ -33,6 +34,14 @@ def anyio_backend():
     return "asyncio"
 
 
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    """Keep cached users from leaking between tests."""
+    user_cache.clear()
+    yield
+    user_cache.clear()
+
+
 @pytest.fixture
 async def test_app() -> AsyncGenerator[FastAPI, None]:
     """Create a FastAPI test application with an async database session."""
@@ -118,7 +127,8 @@ async def user(db_session: AsyncSession, faker: Faker, pre_hashed_password: str)
         first_name=faker.first_name(),
         last_name=faker.last_name(),
     )
-    user_db = await repos.UserRepo(db_session).create_one(user_data)
+    # Commit so requests served on other sessions can see the user
+    user_db = await repos.UserRepo(db_session).create_one(user_data, auto_commit=True)
     return user_db
 
 
@@ -136,7 +146,8 @@ async def other_user(
         first_name=faker.first_name(),
         last_name=faker.last_name(),
     )
-    user_db = await repos.UserRepo(db_session).create_one(user_data)
+    # Commit so requests served on other sessions can see the user
+    user_db = await repos.UserRepo(db_session).create_one(user_data, auto_commit=True)
     return user_db
 
 
@@ -0,0 +1,24 @@
+import logging
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings
+
+
+class TestSettingsLogLevel:
+    """Tests for log_level validation."""
+
+    @pytest.mark.parametrize(
+        "level",
+        [5, logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL],
+    )
+    def test_accepts_loguru_levels(self, level: int):
+        """Test TRACE and the stdlib levels, which loguru names, are accepted."""
+        assert Settings(log_level=level).log_level == level
+
+    @pytest.mark.parametrize("level", [logging.NOTSET, 1, 25, 60])
+    def test_rejects_other_levels(self, level: int):
+        """Test other levels fail when settings load instead of in setup_logger."""
+        with pytest.raises(ValidationError, match="log_level"):
+            Settings(log_level=level)
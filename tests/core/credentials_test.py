@@ -0,0 +1,92 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.core.credentials import FirebaseServiceAccount, _read_key_file_cached, read_key_file
+
+
+@pytest.fixture(autouse=True)
+def clear_key_file_cache():
+    """Start every test with an empty key file cache."""
+    _read_key_file_cached.cache_clear()
+    yield
+    _read_key_file_cached.cache_clear()
+
+
+class TestReadKeyFile:
+    """Test cached private key file reads."""
+
+    def test_reads_file_content(self, tmp_path: Path):
+        """Test the key file content is returned."""
+        key_file = tmp_path / "key.pem"
+        key_file.write_text("private-key")
+
+        assert read_key_file(key_file) == "private-key"
+
+    def test_missing_file_returns_none(self, tmp_path: Path):
+        """Test a path that doesn't exist returns None."""
+        assert read_key_file(tmp_path / "missing.pem") is None
+
+    def test_directory_returns_none(self, tmp_path: Path):
+        """Test a directory path returns None."""
+        assert read_key_file(tmp_path) is None
+
+    def test_unchanged_file_is_read_once(self, tmp_path: Path):
+        """Test repeated reads of an unchanged file reuse the cached content."""
+        key_file = tmp_path / "key.pem"
+        key_file.write_text("private-key")
+
+        with patch.object(
+            Path, "read_text", autospec=True, return_value="private-key"
+        ) as mock_read:
+            read_key_file(key_file)
+            read_key_file(key_file)
+
+            mock_read.assert_called_once()
+
+    def test_modified_file_is_read_again(self, tmp_path: Path):
+        """Test a change to the file's modification time invalidates the cache."""
+        key_file = tmp_path / "key.pem"
+        key_file.write_text("old-key")
+        assert read_key_file(key_file) == "old-key"
+
+        key_file.write_text("new-key")
+        stat_result = key_file.stat()
+        os.utime(key_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+
+        assert read_key_file(key_file) == "new-key"
+
+
+class TestFirebaseServiceAccountKeyPath:
+    """Test FirebaseServiceAccount loading its key from a file."""
+
+    def test_private_key_read_from_path(self, tmp_path: Path):
+        """Test the private key is replaced by the key file's content."""
+        key_file = tmp_path / "firebase.pem"
+        key_file.write_text("file-key")
+
+        account = FirebaseServiceAccount(
+            project_id="project",
+            private_key_id="key-id",
+            private_key="inline-key",
+            private_key_path=key_file,
+            client_email="firebase@example.com",
+            client_id="client",
+        )
+
+        assert account.private_key == "file-key"
+
+    def test_missing_key_path_keeps_inline_key(self, tmp_path: Path):
+        """Test the inline private key is kept when the key file doesn't exist."""
+        account = FirebaseServiceAccount(
+            project_id="project",
+            private_key_id="key-id",
+            private_key="inline-key",
+            private_key_path=tmp_path / "missing.pem",
+            client_email="firebase@example.com",
+            client_id="client",
+        )
+
+        assert account.private_key == "inline-key"
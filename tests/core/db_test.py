@@ -36,6 +36,21 @@ class TestDatabaseEngine:
         # This is set in the engine URL or create_async_engine params
         assert engine is not None
 
+    def test_engine_batches_executemany_inserts(self):
+        """Test that bulk inserts use the insertmanyvalues batching path."""
+        assert engine.dialect.use_insertmanyvalues
+        assert engine.dialect.insertmanyvalues_page_size == settings.db_insertmanyvalues_page_size
+
+    def test_engine_pool_reuses_most_recent_connection(self):
+        """Test that the pool hands out connections in LIFO order."""
+        assert engine.pool._pool.use_lifo
+
+    def test_engine_pool_sized_from_settings(self):
+        """Test that pool size, overflow and recycle come from settings."""
+        assert engine.pool.size() == settings.db_pool_size
+        assert engine.pool._max_overflow == settings.db_max_overflow
+        assert engine.pool._recycle == settings.db_pool_recycle
+
 
 class TestMetadata:
     """Test SQLAlchemy metadata configuration."""
@@ -124,7 +139,7 @@ class TestGetSession:
                 pass
 
     async def test_no_commit_on_success(self):
-        """Test that session does NOT commit — repos own commits via auto_commit."""
+        """Test that session does NOT commit — the deps layer commits explicitly."""
         session_generator = get_session()
         session = await anext(session_generator)
 
@@ -138,7 +153,7 @@ class TestGetSession:
                     except StopAsyncIteration:
                         pass
 
-                    # Commit should NOT be called — repos handle commits
+                    # Commit should NOT be called — the deps layer handles commits
                     mock_commit.assert_not_called()
                     # Rollback should not be called on success
                     mock_rollback.assert_not_called()
@@ -0,0 +1,32 @@
+import pytest
+
+from app.core.exceptions.base import AppException
+from app.core.exceptions.domain import ValidationError
+
+
+class TestAppException:
+    """Test the AppException base class."""
+
+    def test_str_is_message(self):
+        """Test str() renders just the message."""
+        exception = AppException("Something failed")
+
+        assert exception.message == "Something failed"
+        assert str(exception) == "Something failed"
+
+    def test_default_message(self):
+        """Test subclasses keep their default message."""
+        assert str(ValidationError()) == "Validation failed"
+
+    def test_underlying_error_is_chained_as_cause(self):
+        """Test the original error travels as __cause__ via raise ... from."""
+        original = ValueError("bad value")
+
+        with pytest.raises(AppException) as exc_info:
+            try:
+                raise original
+            except ValueError as ex:
+                raise AppException("Wrapped failure") from ex
+
+        assert exc_info.value.__cause__ is original
+        assert str(exc_info.value) == "Wrapped failure"
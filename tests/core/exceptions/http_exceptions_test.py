@@ -1,5 +1,7 @@
+import pytest
 from starlette import status
 
+from app.core.exceptions.base import EMPTY_HEADERS
 from app.core.exceptions.http_exceptions import (
     BadRequestException,
     ConflictException,
@@ -24,7 +26,7 @@ class TestHTTPExceptions:
 
         assert exception.status_code == status.HTTP_501_NOT_IMPLEMENTED
         assert exception.detail == detail
-        assert exception.headers is None
+        assert exception.headers is EMPTY_HEADERS
 
     def test_not_implemented_exception_with_headers(self):
         """Test NotImplementedException with custom headers."""
@@ -43,7 +45,7 @@ class TestHTTPExceptions:
 
         assert exception.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
         assert exception.detail == detail
-        assert exception.headers is None
+        assert exception.headers is EMPTY_HEADERS
 
     def test_service_unavailable_exception_with_headers(self):
         """Test ServiceUnavailableException with custom headers."""
@@ -62,7 +64,7 @@ class TestHTTPExceptions:
 
         assert exception.status_code == status.HTTP_409_CONFLICT
         assert exception.detail == detail
-        assert exception.headers is None
+        assert exception.headers is EMPTY_HEADERS
 
     def test_conflict_exception_with_headers(self):
         """Test ConflictException with custom headers."""
@@ -81,7 +83,7 @@ class TestHTTPExceptions:
 
         assert exception.status_code == status.HTTP_413_CONTENT_TOO_LARGE
         assert exception.detail == detail
-        assert exception.headers is None
+        assert exception.headers is EMPTY_HEADERS
 
     def test_content_too_large_exception_with_headers(self):
         """Test ContentTooLargeException with custom headers."""
@@ -142,7 +144,7 @@ class TestHTTPExceptions:
 
         assert exception.status_code == status.HTTP_400_BAD_REQUEST
         assert exception.detail == "Bad Request"
-        assert exception.headers is None
+        assert exception.headers is EMPTY_HEADERS
 
     def test_forbidden_exception_default(self):
         """Test ForbiddenException with defaults."""
@@ -150,7 +152,7 @@ class TestHTTPExceptions:
 
         assert exception.status_code == status.HTTP_403_FORBIDDEN
         assert exception.detail == "Forbidden"
-        assert exception.headers is None
+        assert exception.headers is EMPTY_HEADERS
 
     def test_internal_server_error_exception_default(self):
         """Test InternalServerErrorException with defaults."""
@@ -158,7 +160,7 @@ class TestHTTPExceptions:
 
         assert exception.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         assert exception.detail == "Internal Server Error"
-        assert exception.headers is None
+        assert exception.headers is EMPTY_HEADERS
 
     def test_not_found_exception_default(self):
         """Test NotFoundException with defaults."""
@@ -166,7 +168,7 @@ class TestHTTPExceptions:
 
         assert exception.status_code == status.HTTP_404_NOT_FOUND
         assert exception.detail == "Not Found"
-        assert exception.headers is None
+        assert exception.headers is EMPTY_HEADERS
 
     def test_not_implemented_exception_default(self):
         """Test NotImplementedException with defaults."""
@@ -174,7 +176,7 @@ class TestHTTPExceptions:
 
         assert exception.status_code == status.HTTP_501_NOT_IMPLEMENTED
         assert exception.detail == "Not Implemented"
-        assert exception.headers is None
+        assert exception.headers is EMPTY_HEADERS
 
     def test_service_unavailable_exception_default(self):
         """Test ServiceUnavailableException with defaults."""
@@ -182,7 +184,7 @@ class TestHTTPExceptions:
 
         assert exception.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
         assert exception.detail == "Service Unavailable"
-        assert exception.headers is None
+        assert exception.headers is EMPTY_HEADERS
 
     def test_too_many_requests_exception_default(self):
         """Test TooManyRequestsException with defaults."""
@@ -190,7 +192,7 @@ class TestHTTPExceptions:
 
         assert exception.status_code == status.HTTP_429_TOO_MANY_REQUESTS
         assert exception.detail == "Too Many Requests"
-        assert exception.headers is None
+        assert exception.headers is EMPTY_HEADERS
 
     def test_unauthorized_exception_default(self):
         """Test UnauthorizedException with defaults."""
@@ -198,7 +200,7 @@ class TestHTTPExceptions:
 
         assert exception.status_code == status.HTTP_401_UNAUTHORIZED
         assert exception.detail == "Unauthorized"
-        assert exception.headers is None
+        assert exception.headers is EMPTY_HEADERS
 
     def test_conflict_exception_default(self):
         """Test ConflictException with defaults."""
@@ -206,7 +208,7 @@ class TestHTTPExceptions:
 
         assert exception.status_code == status.HTTP_409_CONFLICT
         assert exception.detail == "Conflict"
-        assert exception.headers is None
+        assert exception.headers is EMPTY_HEADERS
 
     def test_content_too_large_exception_default(self):
         """Test ContentTooLargeException with defaults."""
@@ -214,7 +216,7 @@ class TestHTTPExceptions:
 
         assert exception.status_code == status.HTTP_413_CONTENT_TOO_LARGE
         assert exception.detail == "Content Too Large"
-        assert exception.headers is None
+        assert exception.headers is EMPTY_HEADERS
 
     def test_exception_with_numeric_detail(self):
         """Test exceptions with numeric detail."""
@@ -237,3 +239,13 @@ class TestHTTPExceptions:
         assert exception.headers is original_headers
         assert exception.headers is not None
         assert exception.headers["X-Custom"] == "original"
+
+    def test_default_headers_are_shared_and_read_only(self):
+        """Test exceptions without headers share one read-only empty mapping."""
+        first = BadRequestException(detail="first")
+        second = NotFoundException(detail="second")
+
+        assert first.headers is second.headers is EMPTY_HEADERS
+        assert len(EMPTY_HEADERS) == 0
+        with pytest.raises(TypeError):
+            EMPTY_HEADERS["X-Custom"] = "value"  # type: ignore[index]
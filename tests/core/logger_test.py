@@ -1,5 +1,6 @@
 """Tests for the logger module."""
 
+import json
 import logging
 import os
 import queue
@@ -103,6 +104,78 @@ class TestOpenObserveHandler:
             # Cleanup
             handler.shutdown_event.set()
 
+    def test_flush_batch_posts_encoded_body(self):
+        """Test _flush_batch posts the batch as a pre-encoded JSON body."""
+        from app.core.logger import OpenObserveHandler
+
+        with patch.object(OpenObserveHandler, "_start_worker"):
+            handler = OpenObserveHandler(
+                url="http://localhost:5080",
+                token="test-token",
+                org="test-org",
+                stream="test-stream",
+            )
+
+            mock_client = MagicMock()
+            handler._client = mock_client
+            batch = [{"message": "héllo", "level": "INFO"}]
+
+            handler._flush_batch(batch)
+
+            mock_client.post.assert_called_once()
+            call = mock_client.post.call_args
+            assert call.args[0] == "http://localhost:5080/api/test-org/test-stream/_json"
+            assert isinstance(call.kwargs["content"], bytes)
+            assert json.loads(call.kwargs["content"]) == batch
+            assert call.kwargs["headers"]["Authorization"] == "Basic test-token"
+
+            # Cleanup
+            handler.shutdown_event.set()
+
+    def test_flush_batch_retries_with_backoff(self):
+        """Test _flush_batch retries failed posts and waits on the shutdown event."""
+        from app.core.logger import OpenObserveHandler
+
+        with patch.object(OpenObserveHandler, "_start_worker"):
+            handler = OpenObserveHandler(
+                url="http://localhost:5080",
+                token="test-token",
+                max_retries=3,
+            )
+
+            mock_client = MagicMock()
+            mock_client.post.side_effect = Exception("connection refused")
+            handler._client = mock_client
+
+            with patch.object(handler, "shutdown_event") as mock_event:
+                mock_event.is_set.return_value = False
+                handler._flush_batch([{"message": "test"}])
+
+            assert mock_client.post.call_count == 3
+            assert mock_event.wait.call_count == 2
+            for call in mock_event.wait.call_args_list:
+                assert 0 < call.args[0] <= handler.retry_deadline
+
+    def test_flush_batch_stops_retrying_on_shutdown(self):
+        """Test _flush_batch gives up after one attempt once shutdown has started."""
+        from app.core.logger import OpenObserveHandler
+
+        with patch.object(OpenObserveHandler, "_start_worker"):
+            handler = OpenObserveHandler(
+                url="http://localhost:5080",
+                token="test-token",
+                max_retries=3,
+            )
+
+            mock_client = MagicMock()
+            mock_client.post.side_effect = Exception("connection refused")
+            handler._client = mock_client
+            handler.shutdown_event.set()
+
+            handler._flush_batch([{"message": "test"}])
+
+            assert mock_client.post.call_count == 1
+
     def test_send_log_queues_message(self):
         """Test send_log adds log to queue."""
         from app.core.logger import OpenObserveHandler
@@ -145,6 +218,46 @@ class TestOpenObserveHandler:
             # Cleanup
             handler.shutdown_event.set()
 
+    def test_drop_log_reports_sampled(self):
+        """Test drop_log only reports the first drop and then every interval."""
+        from app.core.logger import OpenObserveHandler
+
+        with patch.object(OpenObserveHandler, "_start_worker"):
+            handler = OpenObserveHandler(
+                url="http://localhost:5080",
+                token="test-token",
+            )
+
+            with patch("builtins.print") as mock_print:
+                for _ in range(handler.DROP_REPORT_INTERVAL + 1):
+                    handler.drop_log()
+
+            assert handler._dropped == handler.DROP_REPORT_INTERVAL + 1
+            assert mock_print.call_count == 2
+
+            # Cleanup
+            handler.shutdown_event.set()
+
+    def test_is_saturated(self):
+        """Test is_saturated flips once the queue reaches the high watermark."""
+        from app.core.logger import OpenObserveHandler
+
+        with patch.object(OpenObserveHandler, "_start_worker"):
+            handler = OpenObserveHandler(
+                url="http://localhost:5080",
+                token="test-token",
+            )
+
+            assert handler.is_saturated() is False
+
+            for _ in range(handler.QUEUE_HIGH_WATERMARK):
+                handler.log_queue.put_nowait({"message": "log"})
+
+            assert handler.is_saturated() is True
+
+            # Cleanup
+            handler.shutdown_event.set()
+
     def test_shutdown(self):
         """Test shutdown method stops worker and closes client."""
         from app.core.logger import OpenObserveHandler
@@ -181,48 +294,48 @@ class TestOpenObserveHandler:
             handler.shutdown()
 
 
-class TestCorrelationFilter:
-    """Tests for correlation_filter function."""
+class TestCorrelationPatcher:
+    """Tests for correlation_patcher function."""
 
     def test_adds_request_id(self):
-        """Test correlation_filter adds request_id to record."""
-        from app.core.logger import correlation_filter, request_id_var
+        """Test correlation_patcher adds request_id to record."""
+        from app.core.logger import correlation_patcher, request_id_var
 
         # Set a request ID
         token = request_id_var.set("test-request-123")
 
         try:
             record = {"extra": {}}
-            result = correlation_filter(record)
+            correlation_patcher(record)
 
-            assert result is True
             assert record["extra"]["request_id"] == "test-request-123"
-            assert "process_id" in record["extra"]
         finally:
             request_id_var.reset(token)
 
     def test_generates_request_id_if_none(self):
-        """Test correlation_filter generates request_id if not set."""
-        from app.core.logger import correlation_filter, request_id_var
+        """Test correlation_patcher generates request_id if not set."""
+        from app.core.logger import correlation_patcher, request_id_var
 
         # Ensure no request ID is set
         request_id_var.set(None)
 
         record = {"extra": {}}
-        result = correlation_filter(record)
+        correlation_patcher(record)
 
-        assert result is True
         assert "request_id" in record["extra"]
         assert record["extra"]["request_id"] is not None
 
-    def test_adds_process_id(self):
-        """Test correlation_filter adds process_id."""
+
+class TestCorrelationFilter:
+    """Tests for correlation_filter function."""
+
+    def test_keeps_regular_logs(self):
+        """Test correlation_filter keeps non-OpenObserve logs."""
         from app.core.logger import correlation_filter
 
-        record = {"extra": {}}
-        correlation_filter(record)
+        record = {"name": "app.main", "message": "Application started", "extra": {}}
 
-        assert record["extra"]["process_id"] == os.getpid()
+        assert correlation_filter(record) is True
 
     def test_filters_openobserve_logs(self):
         """Test correlation_filter removes OpenObserve HTTP logs."""
@@ -294,6 +407,84 @@ class TestInterceptHandler:
 
             mock_logger.opt.assert_called()
 
+    def test_emit_caches_level_lookup(self):
+        """Test emit resolves the Loguru level once per stdlib level."""
+        from app.core.logger import InterceptHandler
+
+        handler = InterceptHandler()
+
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="test.py",
+            lineno=10,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+
+        with patch("app.core.logger.logger") as mock_logger:
+            mock_logger.level.return_value.name = "INFO"
+
+            handler.emit(record)
+            handler.emit(record)
+
+            mock_logger.level.assert_called_once_with("INFO")
+            assert mock_logger.opt.return_value.log.call_args.args[0] == "INFO"
+
+    def test_emit_formats_message_args(self):
+        """Test emit formats messages with args and passes plain strings through."""
+        from app.core.logger import InterceptHandler
+
+        handler = InterceptHandler()
+
+        with patch("app.core.logger.logger") as mock_logger:
+            mock_logger.level.return_value.name = "INFO"
+
+            for msg, args, expected in [
+                ("Plain message", (), "Plain message"),
+                ("Hello %s", ("world",), "Hello world"),
+                (404, (), "404"),
+            ]:
+                record = logging.LogRecord(
+                    name="test",
+                    level=logging.INFO,
+                    pathname="test.py",
+                    lineno=10,
+                    msg=msg,
+                    args=args,
+                    exc_info=None,
+                )
+                handler.emit(record)
+
+                assert mock_logger.opt.return_value.log.call_args.args[1] == expected
+
+    def test_emit_reports_original_caller(self):
+        """Test emit attributes records to the stdlib logging call site."""
+        from loguru import logger as loguru_logger
+
+        from app.core.logger import InterceptHandler
+
+        handler = InterceptHandler()
+        std_logger = logging.getLogger("tests.intercept_handler")
+        std_logger.handlers = [handler]
+        std_logger.propagate = False
+        std_logger.setLevel(logging.DEBUG)
+
+        records = []
+        sink_id = loguru_logger.add(lambda message: records.append(message.record), level=0)
+        try:
+            std_logger.info("first")
+            std_logger.warning("second")
+        finally:
+            loguru_logger.remove(sink_id)
+
+        assert [record["function"] for record in records] == [
+            "test_emit_reports_original_caller",
+            "test_emit_reports_original_caller",
+        ]
+        assert handler._depth is not None
+
 
 class TestSetupLogger:
     """Tests for setup_logger function."""
@@ -327,6 +518,92 @@ class TestSetupLogger:
                 # logger.add should be called for console and file
                 assert mock_logger.add.call_count >= 2
 
+    def test_setup_logger_console_colors_follow_tty(self):
+        """Test setup_logger only colorizes console output for a terminal."""
+        from app.core.logger import setup_logger
+
+        for is_tty in (True, False):
+            with patch("app.core.logger.logger") as mock_logger:
+                with patch("app.core.logger.settings") as mock_settings:
+                    with patch("app.core.logger.sys.stdout") as mock_stdout:
+                        mock_settings.current_environment = Environment.DEV
+                        mock_settings.log_level = 20  # INFO
+                        mock_settings.log_to_openobserve = False
+                        mock_stdout.isatty.return_value = is_tty
+
+                        setup_logger()
+
+                        console_call = mock_logger.add.call_args_list[0]
+                        assert console_call.args[0] is mock_stdout
+                        assert console_call.kwargs["colorize"] is is_tty
+                        assert ("<green>" in console_call.kwargs["format"]) is is_tty
+
+    def test_setup_logger_binds_process_id_once(self):
+        """Test setup_logger registers the patcher and binds process_id globally."""
+        from app.core.logger import correlation_patcher, setup_logger
+
+        with patch("app.core.logger.logger") as mock_logger:
+            with patch("app.core.logger.settings") as mock_settings:
+                mock_settings.current_environment = Environment.DEV
+                mock_settings.log_level = 20  # INFO
+                mock_settings.log_to_openobserve = False
+
+                setup_logger()
+
+                mock_logger.configure.assert_called_once_with(
+                    patcher=correlation_patcher, extra={"process_id": os.getpid()}
+                )
+
+    def test_openobserve_sink_builds_payload(self):
+        """Test the OpenObserve sink queues a payload built from the record."""
+        from datetime import UTC, datetime
+
+        from app.core import logger as logger_module
+
+        with patch.object(logger_module, "logger") as mock_logger:
+            with patch.object(logger_module, "settings") as mock_settings:
+                with patch.object(logger_module, "OpenObserveHandler") as mock_handler_cls:
+                    mock_settings.current_environment = Environment.DEV
+                    mock_settings.log_level = 20  # INFO
+                    mock_settings.log_to_openobserve = True
+                    mock_handler_cls.return_value.is_saturated.return_value = False
+
+                    try:
+                        logger_module.setup_logger()
+
+                        sink = mock_logger.add.call_args_list[-1].args[0]
+                        timestamp = datetime(2025, 1, 1, tzinfo=UTC)
+                        message = MagicMock()
+                        message.record = {
+                            "time": timestamp,
+                            "level": MagicMock(name="level"),
+                            "message": "hello",
+                            "extra": {"process_id": 123, "request_id": "abcd1234"},
+                            "name": "app.main",
+                            "function": "handler",
+                            "line": 42,
+                            "exception": None,
+                        }
+                        message.record["level"].name = "INFO"
+
+                        sink(message)
+                    finally:
+                        logger_module._openobserve_handler = None
+
+                    mock_handler_cls.return_value.send_log.assert_called_once_with(
+                        {
+                            "timestamp": timestamp.isoformat(),
+                            "level": "INFO",
+                            "message": "hello",
+                            "process_id": 123,
+                            "request_id": "abcd1234",
+                            "module": "app.main",
+                            "function": "handler",
+                            "line": 42,
+                            "environment": Environment.DEV.value,
+                        }
+                    )
+
 
 class TestConfigureUvicornLogging:
     """Tests for configure_uvicorn_logging function."""
@@ -373,18 +650,27 @@ class TestShutdownLogger:
 
 
 class TestLogLevels:
-    """Tests for LOG_LEVELs mapping."""
+    """Tests for LOG_LEVEL_NAMES mapping."""
 
     def test_log_levels_mapping(self):
-        """Test LOG_LEVELs contains correct mappings."""
-        from app.core.logger import LOG_LEVELs
-
-        assert LOG_LEVELs[50] == "CRITICAL"
-        assert LOG_LEVELs[40] == "ERROR"
-        assert LOG_LEVELs[30] == "WARNING"
-        assert LOG_LEVELs[20] == "INFO"
-        assert LOG_LEVELs[10] == "DEBUG"
-        assert LOG_LEVELs[0] == "NOTSET"
+        """Test LOG_LEVEL_NAMES maps each accepted level to its loguru name."""
+        from app.core.logger import LOG_LEVEL_NAMES
+
+        assert LOG_LEVEL_NAMES[logging.CRITICAL] == "CRITICAL"
+        assert LOG_LEVEL_NAMES[logging.ERROR] == "ERROR"
+        assert LOG_LEVEL_NAMES[logging.WARNING] == "WARNING"
+        assert LOG_LEVEL_NAMES[logging.INFO] == "INFO"
+        assert LOG_LEVEL_NAMES[logging.DEBUG] == "DEBUG"
+        assert LOG_LEVEL_NAMES[5] == "TRACE"
+
+    def test_log_level_numbers_match_loguru(self):
+        """Test every mapped name is a loguru level with the same number."""
+        from loguru import logger as loguru_logger
+
+        from app.core.logger import LOG_LEVEL_NAMES
+
+        for number, name in LOG_LEVEL_NAMES.items():
+            assert loguru_logger.level(name).no == number
 
 
 class TestRequestIdVar:
@@ -1,15 +1,26 @@
+import asyncio
 import hashlib
+import mmap
+import os
+import stat
 import tempfile
 import uuid
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+import aiohttp
 import pytest
 from fastapi import Request
+from starlette.datastructures import Headers
 
-from app.core.config import Environment, settings
 from app.core.utils import (
+    HASH_CHUNK_SIZE,
+    UPLOAD_SAMPLE_DATA,
+    _get_upload_session,
+    calculate_content_hash,
     calculate_md5_hash,
+    calculate_md5_hashes,
+    close_upload_session,
     estimate_upload_time,
     get_client_ip,
     parse_user_id,
@@ -48,14 +59,38 @@ class TestParseUserId:
         assert isinstance(result, int)
 
     def test_integer_input_converts_to_int(self):
-        """Test that integer input attempts UUID conversion first, then returns int."""
+        """Test that integer input is returned unchanged."""
         user_id = 12345
 
         result = parse_user_id(user_id)
 
-        # Will try UUID conversion first, fail, then try int (already int)
+        assert result == 12345
         assert isinstance(result, int)
 
+    def test_integer_string_skips_uuid_parsing(self):
+        """Test that integer strings are converted without attempting UUID parsing."""
+        with patch.object(uuid.UUID, "__init__") as mock_uuid_init:
+            result = parse_user_id("42")
+
+        mock_uuid_init.assert_not_called()
+        assert result == 42
+
+    def test_hex_uuid_string_converts_to_uuid(self):
+        """Test that an unhyphenated 32-digit UUID string converts to UUID."""
+        test_uuid = uuid.uuid4()
+
+        result = parse_user_id(test_uuid.hex)
+
+        assert result == test_uuid
+
+    def test_digit_string_of_uuid_length_converts_to_uuid(self):
+        """Test that a 32-digit numeric string is still parsed as a UUID."""
+        user_id = "1" * 32
+
+        result = parse_user_id(user_id)
+
+        assert result == uuid.UUID(user_id)
+
     def test_invalid_string_returns_as_is(self):
         """Test that invalid string (not UUID, not int) returns unchanged."""
         user_id = "some-random-string"
@@ -85,7 +120,7 @@ class TestGetClientIP:
         request.headers = {}
         request.client = MagicMock(host="192.168.1.1")
 
-        with patch.object(settings, "current_environment", Environment.LOCAL):
+        with patch("app.core.utils.IS_LOCAL_ENVIRONMENT", True):
             result = get_client_ip(request)
 
         assert result == "localhost"
@@ -96,7 +131,7 @@ class TestGetClientIP:
         request.headers = {"X-Forwarded-For": "203.0.113.195"}
         request.client = MagicMock(host="192.168.1.1")
 
-        with patch.object(settings, "current_environment", Environment.PRD):
+        with patch("app.core.utils.IS_LOCAL_ENVIRONMENT", False):
             result = get_client_ip(request)
 
         assert result == "203.0.113.195"
@@ -107,7 +142,7 @@ class TestGetClientIP:
         request.headers = {"X-Forwarded-For": "203.0.113.195, 70.41.3.18, 150.172.238.178"}
         request.client = MagicMock(host="192.168.1.1")
 
-        with patch.object(settings, "current_environment", Environment.PRD):
+        with patch("app.core.utils.IS_LOCAL_ENVIRONMENT", False):
             result = get_client_ip(request)
 
         assert result == "203.0.113.195"
@@ -118,7 +153,7 @@ class TestGetClientIP:
         request.headers = {"X-Forwarded-For": "  203.0.113.195  "}
         request.client = MagicMock(host="192.168.1.1")
 
-        with patch.object(settings, "current_environment", Environment.PRD):
+        with patch("app.core.utils.IS_LOCAL_ENVIRONMENT", False):
             result = get_client_ip(request)
 
         assert result == "203.0.113.195"
@@ -129,7 +164,7 @@ class TestGetClientIP:
         request.headers = {"X-Real-IP": "198.51.100.42"}
         request.client = MagicMock(host="192.168.1.1")
 
-        with patch.object(settings, "current_environment", Environment.PRD):
+        with patch("app.core.utils.IS_LOCAL_ENVIRONMENT", False):
             result = get_client_ip(request)
 
         assert result == "198.51.100.42"
@@ -140,7 +175,7 @@ class TestGetClientIP:
         request.headers = {"X-Real-IP": "  198.51.100.42  "}
         request.client = MagicMock(host="192.168.1.1")
 
-        with patch.object(settings, "current_environment", Environment.PRD):
+        with patch("app.core.utils.IS_LOCAL_ENVIRONMENT", False):
             result = get_client_ip(request)
 
         assert result == "198.51.100.42"
@@ -151,7 +186,7 @@ class TestGetClientIP:
         request.headers = {"X-Client-IP": "192.0.2.1"}
         request.client = MagicMock(host="192.168.1.1")
 
-        with patch.object(settings, "current_environment", Environment.PRD):
+        with patch("app.core.utils.IS_LOCAL_ENVIRONMENT", False):
             result = get_client_ip(request)
 
         assert result == "192.0.2.1"
@@ -162,7 +197,7 @@ class TestGetClientIP:
         request.headers = {"X-Client-IP": "  192.0.2.1  "}
         request.client = MagicMock(host="192.168.1.1")
 
-        with patch.object(settings, "current_environment", Environment.PRD):
+        with patch("app.core.utils.IS_LOCAL_ENVIRONMENT", False):
             result = get_client_ip(request)
 
         assert result == "192.0.2.1"
@@ -173,7 +208,7 @@ class TestGetClientIP:
         request.headers = {}
         request.client = MagicMock(host="192.168.1.100")
 
-        with patch.object(settings, "current_environment", Environment.PRD):
+        with patch("app.core.utils.IS_LOCAL_ENVIRONMENT", False):
             result = get_client_ip(request)
 
         assert result == "192.168.1.100"
@@ -184,7 +219,7 @@ class TestGetClientIP:
         request.headers = {}
         request.client = None
 
-        with patch.object(settings, "current_environment", Environment.PRD):
+        with patch("app.core.utils.IS_LOCAL_ENVIRONMENT", False):
             result = get_client_ip(request)
 
         assert result == "unknown"
@@ -199,7 +234,29 @@ class TestGetClientIP:
         }
         request.client = MagicMock(host="192.168.1.1")
 
-        with patch.object(settings, "current_environment", Environment.PRD):
+        with patch("app.core.utils.IS_LOCAL_ENVIRONMENT", False):
+            result = get_client_ip(request)
+
+        assert result == "203.0.113.195"
+
+    def test_empty_header_falls_through(self):
+        """Test that an empty X-Forwarded-For header falls through to the next header."""
+        request = MagicMock(spec=Request)
+        request.headers = {"X-Forwarded-For": "", "X-Real-IP": "198.51.100.42"}
+        request.client = MagicMock(host="192.168.1.1")
+
+        with patch("app.core.utils.IS_LOCAL_ENVIRONMENT", False):
+            result = get_client_ip(request)
+
+        assert result == "198.51.100.42"
+
+    def test_lowercase_headers_from_starlette(self):
+        """Test that header names are matched case-insensitively on real headers."""
+        request = MagicMock(spec=Request)
+        request.headers = Headers({"x-forwarded-for": "203.0.113.195, 70.41.3.18"})
+        request.client = MagicMock(host="192.168.1.1")
+
+        with patch("app.core.utils.IS_LOCAL_ENVIRONMENT", False):
             result = get_client_ip(request)
 
         assert result == "203.0.113.195"
@@ -222,6 +279,23 @@ class TestCalculateMd5Hash:
             with pytest.raises(FileNotFoundError, match="File not found"):
                 await calculate_md5_hash(tmpdir)
 
+    async def test_path_through_regular_file_raises_error(self):
+        """Test that a path nested under a regular file raises FileNotFoundError."""
+        with tempfile.NamedTemporaryFile() as tmp_file:
+            with pytest.raises(FileNotFoundError, match="File not found"):
+                await calculate_md5_hash(Path(tmp_file.name) / "child.txt")
+
+    async def test_stats_file_once(self):
+        """Test that existence, type and size come from a single stat call."""
+        with tempfile.NamedTemporaryFile() as tmp_file:
+            tmp_file.write(b"stat once")
+            tmp_file.flush()
+
+            with patch("app.core.utils.os.stat", wraps=os.stat) as mock_stat:
+                await calculate_md5_hash(tmp_file.name)
+
+            mock_stat.assert_called_once()
+
     async def test_calculates_hash_for_small_file(self):
         """Test MD5 hash calculation for small file."""
         with tempfile.NamedTemporaryFile(mode="wb", delete=False) as tmp_file:
@@ -242,8 +316,8 @@ class TestCalculateMd5Hash:
     async def test_calculates_hash_for_large_file(self):
         """Test MD5 hash calculation for file larger than chunk size."""
         with tempfile.NamedTemporaryFile(mode="wb", delete=False) as tmp_file:
-            # Create 10KB file (larger than 4096 byte chunk)
-            content = b"x" * (10 * 1024)
+            # Create a file spanning several chunks, with a partial last chunk
+            content = b"x" * (2 * HASH_CHUNK_SIZE + 10 * 1024)
             tmp_file.write(content)
             tmp_file.flush()
             file_path = tmp_file.name
@@ -257,6 +331,40 @@ class TestCalculateMd5Hash:
         finally:
             Path(file_path).unlink()
 
+    async def test_large_file_hashed_from_memory_map(self):
+        """Test that files above the mmap threshold are hashed from a memory map."""
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as tmp_file:
+            content = bytes(range(256)) * 4096
+            tmp_file.write(content)
+            tmp_file.flush()
+            file_path = tmp_file.name
+
+        try:
+            with patch("app.core.utils.HASH_MMAP_THRESHOLD", 1024):
+                with patch("app.core.utils.mmap.mmap", wraps=mmap.mmap) as mock_mmap:
+                    result = await calculate_md5_hash(file_path)
+
+            mock_mmap.assert_called_once()
+            assert result == hashlib.md5(content).hexdigest()
+        finally:
+            Path(file_path).unlink()
+
+    async def test_calculates_blake2b_hash(self):
+        """Test the optional BLAKE2b digest for non-MD5 callers."""
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as tmp_file:
+            content = b"y" * (300 * 1024)
+            tmp_file.write(content)
+            tmp_file.flush()
+            file_path = tmp_file.name
+
+        try:
+            result = await calculate_md5_hash(file_path, algorithm="blake2b")
+
+            expected_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+            assert result == expected_hash
+        finally:
+            Path(file_path).unlink()
+
     async def test_kb_file_size_display(self):
         """Test that KB size is logged correctly for files < 1MB."""
         with tempfile.NamedTemporaryFile(mode="wb", delete=False) as tmp_file:
@@ -274,6 +382,7 @@ class TestCalculateMd5Hash:
                 mock_logger.info.assert_called_once()
                 log_message = mock_logger.info.call_args[0][0]
                 assert "KB" in log_message
+                assert "500.00 KB" in log_message
         finally:
             Path(file_path).unlink()
 
@@ -294,6 +403,9 @@ class TestCalculateMd5Hash:
                 mock_logger.info.assert_called_once()
                 log_message = mock_logger.info.call_args[0][0]
                 assert "MB" in log_message
+                assert "2.00 MB" in log_message
+                # An exact multiple of the chunk size is not counted as an extra chunk
+                assert "in 1 chunk of 2 MiB" in log_message
         finally:
             Path(file_path).unlink()
 
@@ -307,17 +419,21 @@ class TestCalculateMd5Hash:
             file_path = tmp_file.name
 
         try:
-            # Mock Path.stat to return 1GB size and is_file to return True
-            with patch("pathlib.Path.stat") as mock_stat:
-                mock_stat.return_value = MagicMock(st_size=1024 * 1024 * 1024)
-                with patch("pathlib.Path.is_file", return_value=True):
-                    with patch("app.core.utils.logger") as mock_logger:
-                        await calculate_md5_hash(file_path)
-
-                        # Check that logger.info was called with GB in message
-                        mock_logger.info.assert_called_once()
-                        log_message = mock_logger.info.call_args[0][0]
-                        assert "GB" in log_message
+            # Mock os.stat to report a 1GB regular file
+            with patch("app.core.utils.os.stat") as mock_stat:
+                mock_stat.return_value = MagicMock(
+                    st_size=1024 * 1024 * 1024, st_mode=stat.S_IFREG | 0o644
+                )
+                with patch("app.core.utils.logger") as mock_logger:
+                    await calculate_md5_hash(file_path)
+
+                    # Check that logger.info was called with GB in message
+                    mock_logger.info.assert_called_once()
+                    log_message = mock_logger.info.call_args[0][0]
+                    assert "GB" in log_message
+                    assert "1.00 GB" in log_message
+                    assert "from a memory map in one pass" in log_message
+                    assert "chunk" not in log_message
         finally:
             Path(file_path).unlink()
 
@@ -352,10 +468,113 @@ class TestCalculateMd5Hash:
             file_path.unlink()
 
 
+@pytest.mark.anyio
+class TestCalculateMd5Hashes:
+    """Test calculate_md5_hashes function."""
+
+    async def test_hashes_files_in_order(self):
+        """Test hashes are returned in the same order as the input paths."""
+        contents = [b"first file", b"", b"z" * (HASH_CHUNK_SIZE + 1)]
+        file_paths = []
+        for content in contents:
+            with tempfile.NamedTemporaryFile(mode="wb", delete=False) as tmp_file:
+                tmp_file.write(content)
+                file_paths.append(Path(tmp_file.name))
+
+        try:
+            result = await calculate_md5_hashes(file_paths)
+
+            assert result == [hashlib.md5(content).hexdigest() for content in contents]
+        finally:
+            for file_path in file_paths:
+                file_path.unlink()
+
+    async def test_empty_list(self):
+        """Test that no files produce no hashes."""
+        assert await calculate_md5_hashes([]) == []
+
+    async def test_missing_file_raises_error(self):
+        """Test that a missing file fails the whole batch."""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            await calculate_md5_hashes(["/path/to/nonexistent/file.txt"])
+
+
+@pytest.mark.anyio
+class TestCalculateContentHash:
+    """Test calculate_content_hash function."""
+
+    async def test_returns_blake2b_digest(self):
+        """Test that the content hash is a 128-bit BLAKE2b digest."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "file.bin"
+            content = b"content hash" * 1000
+            path.write_bytes(content)
+
+            result = await calculate_content_hash(path)
+
+        assert result == hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    async def test_file_not_found_raises_error(self):
+        """Test that FileNotFoundError is raised for non-existent file."""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            await calculate_content_hash("/path/to/nonexistent/file.txt")
+
+
 @pytest.mark.anyio
 class TestEstimateUploadTime:
     """Test estimate_upload_time function."""
 
+    @pytest.fixture(autouse=True)
+    async def close_shared_session(self):
+        """Close the shared upload session after each test."""
+        yield
+        await close_upload_session()
+
+    async def test_reuses_session_across_calls(self):
+        """Test that consecutive estimates share one ClientSession."""
+        mock_response = AsyncMock()
+        mock_response.__aenter__.return_value = mock_response
+        mock_response.__aexit__.return_value = None
+
+        with patch("aiohttp.ClientSession.post", return_value=mock_response):
+            with patch("time.perf_counter", side_effect=[0.0, 1.0, 0.0, 1.0]):
+                with patch(
+                    "app.core.utils.aiohttp.ClientSession", wraps=aiohttp.ClientSession
+                ) as mock_session_cls:
+                    await estimate_upload_time(url="example.com")
+                    await estimate_upload_time(url="example.com")
+
+                    mock_session_cls.assert_called_once()
+
+    async def test_close_upload_session_allows_new_session(self):
+        """Test that closing the shared session makes the next call open a new one."""
+        mock_response = AsyncMock()
+        mock_response.__aenter__.return_value = mock_response
+        mock_response.__aexit__.return_value = None
+
+        with patch("aiohttp.ClientSession.post", return_value=mock_response):
+            with patch("time.perf_counter", side_effect=[0.0, 1.0, 0.0, 1.0]):
+                with patch(
+                    "app.core.utils.aiohttp.ClientSession", wraps=aiohttp.ClientSession
+                ) as mock_session_cls:
+                    await estimate_upload_time(url="example.com")
+                    await close_upload_session()
+                    await estimate_upload_time(url="example.com")
+
+                    assert mock_session_cls.call_count == 2
+
+    async def test_session_replaced_after_loop_change(self):
+        """Test a session created on another event loop is not reused."""
+        other_loop = asyncio.new_event_loop()
+        other_loop.close()
+        stale_session = Mock(closed=False)
+        with patch("app.core.utils._upload_session", (other_loop, stale_session)):
+            session = _get_upload_session()
+
+            assert session is not stale_session
+            assert session is _get_upload_session()
+            await session.close()
+
     async def test_https_url_default_port(self):
         """Test HTTPS URL construction with default port 443."""
         mock_response = AsyncMock()
@@ -363,7 +582,7 @@ class TestEstimateUploadTime:
         mock_response.__aexit__.return_value = None
 
         with patch("aiohttp.ClientSession.post", return_value=mock_response) as mock_post:
-            with patch("time.time", side_effect=[0.0, 1.0]):  # 1 second upload
+            with patch("time.perf_counter", side_effect=[0.0, 1.0]):  # 1 second upload
                 await estimate_upload_time(
                     url="example.com", path="/upload", port=443, file_size_mb=1
                 )
@@ -373,6 +592,21 @@ class TestEstimateUploadTime:
                 call_kwargs = mock_post.call_args[1]
                 assert call_kwargs["url"] == "https://example.com/upload"
 
+    async def test_reuses_module_level_payload(self):
+        """Test that the shared 1 MB sample payload is uploaded without copying."""
+        mock_response = AsyncMock()
+        mock_response.__aenter__.return_value = mock_response
+        mock_response.__aexit__.return_value = None
+
+        with patch("aiohttp.ClientSession.post", return_value=mock_response) as mock_post:
+            with patch("time.perf_counter", side_effect=[0.0, 1.0]):
+                result = await estimate_upload_time(url="example.com", file_size_mb=5)
+
+                assert mock_post.call_args[1]["data"] is UPLOAD_SAMPLE_DATA
+                assert len(UPLOAD_SAMPLE_DATA) == 1024 * 1024
+                # 1 MB in 1 second -> 5 MB takes 5 seconds
+                assert result == pytest.approx(5.0)
+
     async def test_http_url_default_port(self):
         """Test HTTP URL construction with default port 80."""
         mock_response = AsyncMock()
@@ -380,7 +614,7 @@ class TestEstimateUploadTime:
         mock_response.__aexit__.return_value = None
 
         with patch("aiohttp.ClientSession.post", return_value=mock_response) as mock_post:
-            with patch("time.time", side_effect=[0.0, 1.0]):
+            with patch("time.perf_counter", side_effect=[0.0, 1.0]):
                 await estimate_upload_time(
                     url="example.com", path="/upload", port=80, file_size_mb=1
                 )
@@ -397,7 +631,7 @@ class TestEstimateUploadTime:
         mock_response.__aexit__.return_value = None
 
         with patch("aiohttp.ClientSession.post", return_value=mock_response) as mock_post:
-            with patch("time.time", side_effect=[0.0, 1.0]):
+            with patch("time.perf_counter", side_effect=[0.0, 1.0]):
                 await estimate_upload_time(
                     url="example.com", path="/upload", port=8080, file_size_mb=1
                 )
@@ -414,7 +648,7 @@ class TestEstimateUploadTime:
         mock_response.__aexit__.return_value = None
 
         with patch("aiohttp.ClientSession.post", return_value=mock_response) as mock_post:
-            with patch("time.time", side_effect=[0.0, 1.0]):
+            with patch("time.perf_counter", side_effect=[0.0, 1.0]):
                 await estimate_upload_time(
                     url="example.com", path="/upload", port=8443, file_size_mb=1
                 )
@@ -431,7 +665,7 @@ class TestEstimateUploadTime:
         mock_response.__aexit__.return_value = None
 
         with patch("aiohttp.ClientSession.post", return_value=mock_response) as mock_post:
-            with patch("time.time", side_effect=[0.0, 1.0]):
+            with patch("time.perf_counter", side_effect=[0.0, 1.0]):
                 await estimate_upload_time(
                     url="https://example.com", path="/upload", port=443, file_size_mb=1
                 )
@@ -448,7 +682,7 @@ class TestEstimateUploadTime:
         mock_response.__aexit__.return_value = None
 
         with patch("aiohttp.ClientSession.post", return_value=mock_response) as mock_post:
-            with patch("time.time", side_effect=[0.0, 1.0]):
+            with patch("time.perf_counter", side_effect=[0.0, 1.0]):
                 await estimate_upload_time(
                     url="http://example.com", path="/upload", port=80, file_size_mb=1
                 )
@@ -466,7 +700,7 @@ class TestEstimateUploadTime:
 
         with patch("aiohttp.ClientSession.post", return_value=mock_response):
             # Simulate 0.5 second upload (2 MB/s speed)
-            with patch("time.time", side_effect=[0.0, 0.5]):
+            with patch("time.perf_counter", side_effect=[0.0, 0.5]):
                 result = await estimate_upload_time(
                     url="example.com",
                     path="/upload",
@@ -485,7 +719,7 @@ class TestEstimateUploadTime:
         mock_response.__aexit__.return_value = None
 
         with patch("aiohttp.ClientSession.post", return_value=mock_response) as mock_post:
-            with patch("time.time", side_effect=[0.0, 1.0]):
+            with patch("time.perf_counter", side_effect=[0.0, 1.0]):
                 await estimate_upload_time()
 
                 # Check data and headers
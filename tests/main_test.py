@@ -1,13 +1,17 @@
-from unittest.mock import AsyncMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import FastAPI
+from sqlalchemy.pool import QueuePool
 
 from app.core.config import Environment
 from app.main import (
     ALLOWED_ENVIRONMENTS,
     _check_dependencies,
+    _create_versioned_app,
     _shutdown_dependencies,
+    _warm_up_database_pool,
     app,
     lifespan,
 )
@@ -99,6 +103,77 @@ class TestDependencyChecks:
                         mock_cache.assert_called_once()
                         mock_rate.assert_called_once()
 
+    async def test_check_dependencies_runs_checks_concurrently(self):
+        """Test that health checks overlap instead of running one after another."""
+        rate_checked = asyncio.Event()
+
+        async def cache_check():
+            # Only completes if the rate limiter check runs while this one waits
+            await asyncio.wait_for(rate_checked.wait(), timeout=1)
+            return True
+
+        async def rate_check():
+            rate_checked.set()
+            return True
+
+        with patch("app.main.cache_manager.health_check", side_effect=cache_check):
+            with patch("app.main.rate_limiter.health_check", side_effect=rate_check):
+                with patch("app.main.settings.current_environment", Environment.LOCAL):
+                    await _check_dependencies()
+
+    async def test_check_dependencies_blacklist_unhealthy_only_warns(self):
+        """Test that an unhealthy token blacklist logs a warning without raising."""
+        with patch("app.main.cache_manager.health_check", new_callable=AsyncMock) as mock_cache:
+            with patch("app.main.rate_limiter.health_check", new_callable=AsyncMock) as mock_rate:
+                with patch(
+                    "app.main.token_blacklist.health_check", new_callable=AsyncMock
+                ) as mock_blacklist:
+                    with patch("app.main.settings.current_environment", Environment.DEV):
+                        with patch("app.main.logger") as mock_logger:
+                            mock_cache.return_value = True
+                            mock_rate.return_value = True
+                            mock_blacklist.return_value = False
+
+                            await _check_dependencies()
+
+                            mock_blacklist.assert_called_once()
+                            mock_logger.warning.assert_called_once()
+
+
+@pytest.mark.anyio
+class TestWarmUpDatabasePool:
+    """Test database pool warm-up on startup."""
+
+    async def test_opens_one_connection_per_pool_slot(self):
+        """Test that warm-up pings the database once per base pool connection."""
+        connection = MagicMock()
+        connection.execute = AsyncMock()
+        connect_context = MagicMock()
+        connect_context.__aenter__ = AsyncMock(return_value=connection)
+        connect_context.__aexit__ = AsyncMock(return_value=False)
+
+        with patch("app.main.engine") as mock_engine:
+            mock_engine.connect.return_value = connect_context
+            mock_engine.pool = MagicMock(spec=QueuePool)
+            mock_engine.pool.size.return_value = 3
+
+            await _warm_up_database_pool()
+
+            assert mock_engine.connect.call_count == 3
+            assert connection.execute.await_count == 3
+
+    async def test_failure_only_warns(self):
+        """Test that an unreachable database does not abort startup."""
+        with patch("app.main.engine") as mock_engine:
+            mock_engine.connect.side_effect = OSError("connection refused")
+            mock_engine.pool = MagicMock(spec=QueuePool)
+            mock_engine.pool.size.return_value = 2
+
+            with patch("app.main.logger") as mock_logger:
+                await _warm_up_database_pool()
+
+                mock_logger.warning.assert_called_once()
+
 
 @pytest.mark.anyio
 class TestShutdown:
@@ -138,6 +213,12 @@ class TestShutdown:
 class TestLifespan:
     """Test lifespan context manager."""
 
+    @pytest.fixture(autouse=True)
+    def mock_warm_up(self):
+        """Keep lifespan tests from opening real database connections."""
+        with patch("app.main._warm_up_database_pool", new_callable=AsyncMock) as mock:
+            yield mock
+
     async def test_lifespan_startup_success(self):
         """Test successful startup sequence."""
         test_app = FastAPI()
@@ -190,7 +271,7 @@ class TestLifespan:
                             mock_shutdown_logger.assert_called_once()
                             mock_shutdown.assert_called_once()
 
-    async def test_lifespan_calls_in_correct_order(self):
+    async def test_lifespan_calls_in_correct_order(self, mock_warm_up):
         """Test that lifespan calls happen in correct order."""
         test_app = FastAPI()
         call_order = []
@@ -210,6 +291,8 @@ class TestLifespan:
         async def track_shutdown():
             call_order.append("shutdown_dependencies")
 
+        mock_warm_up.side_effect = lambda: call_order.append("warm_up_database_pool")
+
         with patch("app.main.setup_logger", side_effect=track_setup_logger):
             with patch("app.main.configure_uvicorn_logging", side_effect=track_configure):
                 with patch(
@@ -229,6 +312,7 @@ class TestLifespan:
             "setup_logger",
             "configure_uvicorn",
             "check_dependencies",
+            "warm_up_database_pool",
             "shutdown_logger",
             "shutdown_dependencies",
         ]
@@ -322,6 +406,22 @@ class TestAppConfiguration:
             # In PRODUCTION, should be disabled
             assert Environment.PRD not in ALLOWED_ENVIRONMENTS
 
+    def test_versioned_app_docs_follow_docs_enabled(self):
+        """Test that versioned app docs endpoints follow DOCS_ENABLED."""
+        with patch("app.main.DOCS_ENABLED", False):
+            versioned_app = _create_versioned_app("v9")
+
+        assert versioned_app.openapi_url is None
+        assert versioned_app.docs_url is None
+        assert versioned_app.redoc_url is None
+
+        with patch("app.main.DOCS_ENABLED", True):
+            versioned_app = _create_versioned_app("v9")
+
+        assert versioned_app.openapi_url == "/openapi.json"
+        assert versioned_app.docs_url == "/docs"
+        assert versioned_app.redoc_url == "/redoc"
+
 
 @pytest.mark.anyio
 class TestAppEndpoints:
@@ -333,6 +433,7 @@ class TestAppEndpoints:
 
         assert response.status_code == 200
         assert response.json() == {"status": "healthy"}
+        assert response.headers["content-type"] == "application/json"
 
     async def test_root_docs_endpoints_are_disabled(self, client):
         """Root docs endpoints should not be exposed after versioned split."""
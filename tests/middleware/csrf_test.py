@@ -12,9 +12,11 @@ from app.middleware.csrf import (
     CSRF_HEADER_NAME,
     CSRF_TOKEN_LENGTH,
     EXEMPT_PATHS,
+    EXEMPT_PREFIXES,
     SAFE_METHODS,
     CSRFMiddleware,
     generate_csrf_token,
+    get_cookie,
 )
 
 
@@ -41,6 +43,31 @@ class TestGenerateCSRFToken:
         assert all(c in valid_chars for c in token)
 
 
+class TestGetCookie:
+    """Tests for reading a single cookie from the Cookie header."""
+
+    def test_returns_value_among_other_cookies(self):
+        """Test that the named cookie is found among several cookies."""
+        request = MagicMock(spec=Request)
+        request.headers = {"cookie": f"session=abc; {CSRF_COOKIE_NAME}=token-123; theme=dark"}
+
+        assert get_cookie(request, CSRF_COOKIE_NAME) == "token-123"
+
+    def test_ignores_cookie_with_name_as_suffix(self):
+        """Test that a cookie whose name merely ends with the name is not matched."""
+        request = MagicMock(spec=Request)
+        request.headers = {"cookie": f"x{CSRF_COOKIE_NAME}=wrong"}
+
+        assert get_cookie(request, CSRF_COOKIE_NAME) is None
+
+    def test_returns_none_without_cookie_header(self):
+        """Test that None is returned when no Cookie header is sent."""
+        request = MagicMock(spec=Request)
+        request.headers = {}
+
+        assert get_cookie(request, CSRF_COOKIE_NAME) is None
+
+
 class TestCSRFMiddlewareConstants:
     """Tests for CSRF middleware constants."""
 
@@ -72,6 +99,12 @@ class TestCSRFMiddlewareConstants:
         assert "/v1/docs" in EXEMPT_PATHS
         assert "/v2/docs" in EXEMPT_PATHS
 
+    def test_exempt_prefixes(self):
+        """Test path prefixes exempt from CSRF protection."""
+        assert "/v1/docs" in EXEMPT_PREFIXES
+        assert "/v2/openapi" in EXEMPT_PREFIXES
+        assert "/v1/users" not in EXEMPT_PREFIXES
+
 
 @pytest.mark.anyio
 class TestCSRFMiddlewareLocalEnvironment:
@@ -83,7 +116,6 @@ class TestCSRFMiddlewareLocalEnvironment:
         request = MagicMock(spec=Request)
         request.method = "POST"
         request.url = MagicMock(path="/v1/users")
-        request.cookies = {}  # No CSRF cookie
         request.headers = {}  # No CSRF header
 
         response = MagicMock(spec=_StreamingResponse)
@@ -92,9 +124,7 @@ class TestCSRFMiddlewareLocalEnvironment:
         async def call_next(req):
             return response
 
-        with patch("app.middleware.csrf.settings") as mock_settings:
-            mock_settings.current_environment = Environment.LOCAL
-
+        with patch("app.middleware.csrf.IS_LOCAL_ENVIRONMENT", True):
             result = await middleware.dispatch(request, call_next)
 
             assert result == response
@@ -110,7 +140,7 @@ class TestCSRFMiddlewareSafeMethods:
         request = MagicMock(spec=Request)
         request.method = "GET"
         request.url = MagicMock(path="/v1/users")
-        request.cookies = {}
+        request.headers = {}
 
         response = MagicMock(spec=_StreamingResponse)
         response.status_code = 200
@@ -132,7 +162,7 @@ class TestCSRFMiddlewareSafeMethods:
         request = MagicMock(spec=Request)
         request.method = "HEAD"
         request.url = MagicMock(path="/v1/users")
-        request.cookies = {}
+        request.headers = {}
 
         response = MagicMock(spec=_StreamingResponse)
         response.status_code = 200
@@ -154,7 +184,7 @@ class TestCSRFMiddlewareSafeMethods:
         request = MagicMock(spec=Request)
         request.method = "OPTIONS"
         request.url = MagicMock(path="/v1/users")
-        request.cookies = {}
+        request.headers = {}
 
         response = MagicMock(spec=_StreamingResponse)
         response.status_code = 200
@@ -181,7 +211,7 @@ class TestCSRFMiddlewareExemptPaths:
         request = MagicMock(spec=Request)
         request.method = "POST"
         request.url = MagicMock(path="/v1/auth/login")
-        request.cookies = {}  # No CSRF cookie
+        request.headers = {}  # No CSRF cookie
 
         response = MagicMock(spec=_StreamingResponse)
         response.status_code = 200
@@ -202,7 +232,7 @@ class TestCSRFMiddlewareExemptPaths:
         request = MagicMock(spec=Request)
         request.method = "POST"
         request.url = MagicMock(path="/v1/auth/signup")
-        request.cookies = {}
+        request.headers = {}
 
         response = MagicMock(spec=_StreamingResponse)
         response.status_code = 200
@@ -223,7 +253,7 @@ class TestCSRFMiddlewareExemptPaths:
         request = MagicMock(spec=Request)
         request.method = "POST"
         request.url = MagicMock(path="/v1/auth/refresh-token")
-        request.cookies = {}
+        request.headers = {}
 
         response = MagicMock(spec=_StreamingResponse)
         response.status_code = 200
@@ -244,7 +274,7 @@ class TestCSRFMiddlewareExemptPaths:
         request = MagicMock(spec=Request)
         request.method = "POST"
         request.url = MagicMock(path="/v1/docs/oauth2-redirect")
-        request.cookies = {}
+        request.headers = {}
 
         response = MagicMock(spec=_StreamingResponse)
         response.status_code = 200
@@ -270,8 +300,7 @@ class TestCSRFMiddlewareValidation:
         request = MagicMock(spec=Request)
         request.method = "POST"
         request.url = MagicMock(path="/v1/users")
-        request.cookies = {}  # No CSRF cookie
-        request.headers = {CSRF_HEADER_NAME: "some-token"}
+        request.headers = {CSRF_HEADER_NAME: "some-token"}  # No CSRF cookie
 
         async def call_next(req):
             return MagicMock()
@@ -290,8 +319,7 @@ class TestCSRFMiddlewareValidation:
         request = MagicMock(spec=Request)
         request.method = "POST"
         request.url = MagicMock(path="/v1/users")
-        request.cookies = {CSRF_COOKIE_NAME: "cookie-token"}
-        request.headers = {}  # No CSRF header
+        request.headers = {"cookie": f"{CSRF_COOKIE_NAME}=cookie-token"}  # No CSRF header
 
         async def call_next(req):
             return MagicMock()
@@ -310,8 +338,10 @@ class TestCSRFMiddlewareValidation:
         request = MagicMock(spec=Request)
         request.method = "POST"
         request.url = MagicMock(path="/v1/users")
-        request.cookies = {CSRF_COOKIE_NAME: "cookie-token-123"}
-        request.headers = {CSRF_HEADER_NAME: "different-token-456"}
+        request.headers = {
+            CSRF_HEADER_NAME: "different-token-456",
+            "cookie": f"{CSRF_COOKIE_NAME}=cookie-token-123",
+        }
 
         async def call_next(req):
             return MagicMock()
@@ -332,8 +362,10 @@ class TestCSRFMiddlewareValidation:
         request.url = MagicMock(path="/v1/users")
 
         csrf_token = generate_csrf_token()
-        request.cookies = {CSRF_COOKIE_NAME: csrf_token}
-        request.headers = {CSRF_HEADER_NAME: csrf_token}
+        request.headers = {
+            CSRF_HEADER_NAME: csrf_token,
+            "cookie": f"{CSRF_COOKIE_NAME}={csrf_token}",
+        }
 
         response = MagicMock(spec=_StreamingResponse)
         response.status_code = 200
@@ -354,7 +386,6 @@ class TestCSRFMiddlewareValidation:
         request = MagicMock(spec=Request)
         request.method = "PUT"
         request.url = MagicMock(path="/v1/users/1")
-        request.cookies = {}
         request.headers = {}
 
         async def call_next(req):
@@ -372,7 +403,6 @@ class TestCSRFMiddlewareValidation:
         request = MagicMock(spec=Request)
         request.method = "DELETE"
         request.url = MagicMock(path="/v1/users/1")
-        request.cookies = {}
         request.headers = {}
 
         async def call_next(req):
@@ -390,7 +420,6 @@ class TestCSRFMiddlewareValidation:
         request = MagicMock(spec=Request)
         request.method = "PATCH"
         request.url = MagicMock(path="/v1/users/1")
-        request.cookies = {}
         request.headers = {}
 
         async def call_next(req):
@@ -413,7 +442,7 @@ class TestCSRFMiddlewareCookieSetup:
         request = MagicMock(spec=Request)
         request.method = "GET"
         request.url = MagicMock(path="/v1/users")
-        request.cookies = {}  # No existing cookie
+        request.headers = {}  # No existing cookie
 
         response = MagicMock(spec=_StreamingResponse)
         response.status_code = 200
@@ -441,7 +470,7 @@ class TestCSRFMiddlewareCookieSetup:
         request = MagicMock(spec=Request)
         request.method = "GET"
         request.url = MagicMock(path="/v1/users")
-        request.cookies = {CSRF_COOKIE_NAME: "existing-token"}
+        request.headers = {"cookie": f"{CSRF_COOKIE_NAME}=existing-token"}
 
         response = MagicMock(spec=_StreamingResponse)
         response.status_code = 200
@@ -465,7 +494,7 @@ class TestCSRFMiddlewareCookieSetup:
         request = MagicMock(spec=Request)
         request.method = "GET"
         request.url = MagicMock(path="/v1/users")
-        request.cookies = {}
+        request.headers = {}
 
         response = MagicMock(spec=_StreamingResponse)
         response.status_code = 200
@@ -489,7 +518,7 @@ class TestCSRFMiddlewareCookieSetup:
         request = MagicMock(spec=Request)
         request.method = "GET"
         request.url = MagicMock(path="/v1/users")
-        request.cookies = {}
+        request.headers = {}
 
         response = MagicMock(spec=_StreamingResponse)
         response.status_code = 200
@@ -4,7 +4,60 @@ import pytest
 from fastapi import Request
 from starlette.middleware.base import _StreamingResponse
 
-from app.middleware.logging import LoggingMiddleware
+from app.middleware.logging import LoggingMiddleware, sanitize_body
+
+
+class TestSanitizeBody:
+    """Test sanitize_body redaction."""
+
+    def test_redacts_exact_and_partial_matches(self):
+        """Test keys equal to or containing a sensitive field are redacted."""
+        body = {
+            "username": "alice",
+            "password": "hunter2",
+            "New_Password": "hunter3",
+            "user_api_key": "abc",
+        }
+
+        assert sanitize_body(body) == {
+            "username": "alice",
+            "password": "***REDACTED***",
+            "New_Password": "***REDACTED***",
+            "user_api_key": "***REDACTED***",
+        }
+
+    def test_redacts_nested_dicts_and_lists(self):
+        """Test redaction reaches nested dicts and dicts inside lists."""
+        body = {
+            "profile": {"name": "alice", "ssn": "123-45-6789"},
+            "cards": [{"card_number": "4111", "label": "main"}, "plain"],
+        }
+
+        assert sanitize_body(body) == {
+            "profile": {"name": "alice", "ssn": "***REDACTED***"},
+            "cards": [{"card_number": "***REDACTED***", "label": "main"}, "plain"],
+        }
+
+    def test_clean_body_returned_without_copy(self):
+        """Test bodies with nothing to redact are returned as the same object."""
+        body = {"username": "alice", "tags": [{"name": "admin"}], "meta": {"age": 30}}
+
+        assert sanitize_body(body) is body
+
+    def test_deeply_nested_clean_body(self):
+        """Test deep nesting doesn't hit the recursion limit when nothing is redacted."""
+        body: dict = {"value": 1}
+        for _ in range(5000):
+            body = {"child": body}
+
+        assert sanitize_body(body) is body
+
+    def test_non_dict_returned_unchanged(self):
+        """Test non-dict payloads are returned as-is."""
+        payload = ["password", "token"]
+
+        assert sanitize_body(payload) is payload
+        assert sanitize_body("raw body") == "raw body"
 
 
 @pytest.mark.anyio
@@ -35,6 +88,7 @@ class TestLoggingMiddleware:
             assert hasattr(request.state, "request_id")
             assert isinstance(request.state.request_id, str)
             assert len(request.state.request_id) == 8
+            int(request.state.request_id, 16)  # hex encoded
 
     async def test_logs_successful_request(self):
         """Test that successful requests are logged."""
@@ -53,22 +107,47 @@ class TestLoggingMiddleware:
         async def call_next(req):
             return response
 
-        with patch("app.middleware.logging.logger") as mock_logger:
-            await middleware.dispatch(request, call_next)
+        with patch("app.middleware.logging.TRACE_ENABLED", True):
+            with patch("app.middleware.logging.logger") as mock_logger:
+                await middleware.dispatch(request, call_next)
 
-            # Should log twice: request and response
-            assert mock_logger.trace.call_count == 2
+                # Should log twice: request and response
+                assert mock_logger.trace.call_count == 2
 
-            # Check request log
-            first_call = mock_logger.trace.call_args_list[0]
-            assert "POST" in first_call[0][0]
-            assert "/api/test" in first_call[0][0]
-            assert "10.0.0.1" in first_call[0][0]
+                # Check request log
+                first_call = mock_logger.trace.call_args_list[0]
+                assert "POST" in first_call[0][0]
+                assert "/api/test" in first_call[0][0]
+                assert "10.0.0.1" in first_call[0][0]
 
-            # Check response log
-            second_call = mock_logger.trace.call_args_list[1]
-            assert "201" in second_call[0][0]
-            assert "Time:" in second_call[0][0]
+                # Check response log
+                second_call = mock_logger.trace.call_args_list[1]
+                assert "201" in second_call[0][0]
+                assert "Time:" in second_call[0][0]
+
+    async def test_skips_trace_when_disabled(self):
+        """Test that trace messages are not built when TRACE is disabled."""
+        middleware = LoggingMiddleware(MagicMock())
+        request = MagicMock(spec=Request)
+        request.state = MagicMock()
+        request.method = "GET"
+        request.url = MagicMock(path="/api/test")
+        request.client = MagicMock(host="10.0.0.1")
+        request.headers = MagicMock()
+
+        response = MagicMock(spec=_StreamingResponse)
+        response.status_code = 200
+        response.headers = {}
+
+        async def call_next(req):
+            return response
+
+        with patch("app.middleware.logging.TRACE_ENABLED", False):
+            with patch("app.middleware.logging.logger") as mock_logger:
+                await middleware.dispatch(request, call_next)
+
+                mock_logger.trace.assert_not_called()
+                request.headers.get.assert_not_called()
 
     async def test_adds_request_id_to_response(self):
         """Test that X-Request-ID header is added to response."""
@@ -106,11 +185,11 @@ class TestLoggingMiddleware:
         request.query_params = {"param": "value"}
         request.path_params = {"id": "123"}
 
-        # Mock json() to return data
-        async def mock_json():
-            return {"key": "value"}
+        # Mock body() to return JSON data
+        async def mock_body():
+            return b'{"key": "value"}'
 
-        request.json = mock_json
+        request.body = mock_body
 
         test_error = ValueError("Test error")
 
@@ -150,11 +229,11 @@ class TestLoggingMiddleware:
         request.query_params = {}
         request.path_params = {}
 
-        # Mock json() to raise exception
-        async def mock_json():
-            raise ValueError("Invalid JSON")
+        # Mock body() to return invalid JSON
+        async def mock_body():
+            return b"{not json"
 
-        request.json = mock_json
+        request.body = mock_body
 
         async def call_next(req):
             raise RuntimeError("Some error")
@@ -168,6 +247,34 @@ class TestLoggingMiddleware:
             error_call = mock_logger.error.call_args
             assert error_call[1]["request_body"] == ""
 
+    async def test_empty_body_skips_json_decode(self):
+        """Test that an empty body is logged as an empty string without decoding."""
+        middleware = LoggingMiddleware(MagicMock())
+        request = MagicMock(spec=Request)
+        request.state = MagicMock()
+        request.method = "GET"
+        request.url = MagicMock(path="/api/test")
+        request.client = MagicMock(host="192.168.1.1")
+        request.headers = {"user-agent": "test"}
+        request.query_params = {}
+        request.path_params = {}
+
+        async def mock_body():
+            return b""
+
+        request.body = mock_body
+
+        async def call_next(req):
+            raise RuntimeError("Some error")
+
+        with patch("app.middleware.logging.logger") as mock_logger:
+            with patch("app.middleware.logging.json.loads") as mock_loads:
+                with pytest.raises(RuntimeError):
+                    await middleware.dispatch(request, call_next)
+
+                mock_loads.assert_not_called()
+                assert mock_logger.error.call_args[1]["request_body"] == ""
+
     async def test_missing_user_agent(self):
         """Test handling of missing User-Agent header."""
         middleware = LoggingMiddleware(MagicMock())
@@ -185,12 +292,13 @@ class TestLoggingMiddleware:
         async def call_next(req):
             return response
 
-        with patch("app.middleware.logging.logger") as mock_logger:
-            await middleware.dispatch(request, call_next)
+        with patch("app.middleware.logging.TRACE_ENABLED", True):
+            with patch("app.middleware.logging.logger") as mock_logger:
+                await middleware.dispatch(request, call_next)
 
-            # Should log with 'unknown' user agent
-            first_call = mock_logger.trace.call_args_list[0]
-            assert "unknown" in first_call[0][0]
+                # Should log with 'unknown' user agent
+                first_call = mock_logger.trace.call_args_list[0]
+                assert "unknown" in first_call[0][0]
 
     async def test_missing_client(self):
         """Test handling when request.client is None."""
@@ -209,12 +317,13 @@ class TestLoggingMiddleware:
         async def call_next(req):
             return response
 
-        with patch("app.middleware.logging.logger") as mock_logger:
-            await middleware.dispatch(request, call_next)
+        with patch("app.middleware.logging.TRACE_ENABLED", True):
+            with patch("app.middleware.logging.logger") as mock_logger:
+                await middleware.dispatch(request, call_next)
 
-            # Should log with 'unknown' client IP
-            first_call = mock_logger.trace.call_args_list[0]
-            assert "unknown" in first_call[0][0]
+                # Should log with 'unknown' client IP
+                first_call = mock_logger.trace.call_args_list[0]
+                assert "unknown" in first_call[0][0]
 
     async def test_measures_processing_time(self):
         """Test that processing time is measured and logged."""
@@ -236,10 +345,11 @@ class TestLoggingMiddleware:
 
         import asyncio
 
-        with patch("app.middleware.logging.logger") as mock_logger:
-            await middleware.dispatch(request, call_next)
+        with patch("app.middleware.logging.TRACE_ENABLED", True):
+            with patch("app.middleware.logging.logger") as mock_logger:
+                await middleware.dispatch(request, call_next)
 
-            # Check that time is logged in response
-            second_call = mock_logger.trace.call_args_list[1]
-            assert "Time:" in second_call[0][0]
-            assert "s" in second_call[0][0]
+                # Check that time is logged in response
+                second_call = mock_logger.trace.call_args_list[1]
+                assert "Time:" in second_call[0][0]
+                assert "s" in second_call[0][0]
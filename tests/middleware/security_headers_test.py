@@ -1,11 +1,40 @@
-from unittest.mock import MagicMock, patch
+from dataclasses import dataclass
+from unittest.mock import patch
 
 import pytest
-from fastapi import Request
-from starlette.middleware.base import _StreamingResponse
+from fastapi import Response
+from starlette.datastructures import Headers
+from starlette.types import Message
 
 from app.core.config import Environment
-from app.middleware.security_headers import SecurityHeadersMiddleware
+from app.middleware.security_headers import SecurityHeadersMiddleware, build_security_headers
+
+
+@dataclass
+class SentResponse:
+    """Response start message as received by the client."""
+
+    status_code: int
+    headers: Headers
+
+
+async def run_middleware(
+    response: Response, method: str = "GET", path: str = "/v1/users/me"
+) -> SentResponse:
+    """Send a response through the middleware and capture what reaches the client."""
+    messages: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    scope = {"type": "http", "method": method, "path": path, "headers": []}
+    await SecurityHeadersMiddleware(response)(scope, receive, send)
+
+    start = messages[0]
+    return SentResponse(status_code=start["status"], headers=Headers(raw=start["headers"]))
 
 
 @pytest.mark.anyio
@@ -14,101 +43,61 @@ class TestSecurityHeadersMiddleware:
 
     async def test_adds_x_content_type_options(self):
         """Test X-Content-Type-Options header is added."""
-        middleware = SecurityHeadersMiddleware(MagicMock())
-        request = MagicMock(spec=Request)
-        request.method = "GET"
-
-        response = MagicMock(spec=_StreamingResponse)
-        response.status_code = 200
-        response.headers = {}
+        response = Response(status_code=200)
 
-        async def call_next(req):
-            return response
-
-        with patch("app.middleware.security_headers.settings") as mock_settings:
-            mock_settings.current_environment = Environment.DEV
-
-            result = await middleware.dispatch(request, call_next)
+        with patch(
+            "app.middleware.security_headers.SECURITY_HEADERS",
+            build_security_headers(Environment.DEV),
+        ):
+            result = await run_middleware(response)
 
             assert result.headers["X-Content-Type-Options"] == "nosniff"
 
     async def test_adds_x_frame_options(self):
         """Test X-Frame-Options header is added."""
-        middleware = SecurityHeadersMiddleware(MagicMock())
-        request = MagicMock(spec=Request)
-        request.method = "GET"
-
-        response = MagicMock(spec=_StreamingResponse)
-        response.status_code = 200
-        response.headers = {}
-
-        async def call_next(req):
-            return response
-
-        with patch("app.middleware.security_headers.settings") as mock_settings:
-            mock_settings.current_environment = Environment.DEV
+        response = Response(status_code=200)
 
-            result = await middleware.dispatch(request, call_next)
+        with patch(
+            "app.middleware.security_headers.SECURITY_HEADERS",
+            build_security_headers(Environment.DEV),
+        ):
+            result = await run_middleware(response)
 
             assert result.headers["X-Frame-Options"] == "DENY"
 
     async def test_adds_x_xss_protection(self):
         """Test X-XSS-Protection header is added."""
-        middleware = SecurityHeadersMiddleware(MagicMock())
-        request = MagicMock(spec=Request)
-        request.method = "GET"
+        response = Response(status_code=200)
 
-        response = MagicMock(spec=_StreamingResponse)
-        response.status_code = 200
-        response.headers = {}
-
-        async def call_next(req):
-            return response
-
-        with patch("app.middleware.security_headers.settings") as mock_settings:
-            mock_settings.current_environment = Environment.DEV
-
-            result = await middleware.dispatch(request, call_next)
+        with patch(
+            "app.middleware.security_headers.SECURITY_HEADERS",
+            build_security_headers(Environment.DEV),
+        ):
+            result = await run_middleware(response)
 
             assert result.headers["X-XSS-Protection"] == "1; mode=block"
 
     async def test_adds_referrer_policy(self):
         """Test Referrer-Policy header is added."""
-        middleware = SecurityHeadersMiddleware(MagicMock())
-        request = MagicMock(spec=Request)
-        request.method = "GET"
-
-        response = MagicMock(spec=_StreamingResponse)
-        response.status_code = 200
-        response.headers = {}
+        response = Response(status_code=200)
 
-        async def call_next(req):
-            return response
-
-        with patch("app.middleware.security_headers.settings") as mock_settings:
-            mock_settings.current_environment = Environment.DEV
-
-            result = await middleware.dispatch(request, call_next)
+        with patch(
+            "app.middleware.security_headers.SECURITY_HEADERS",
+            build_security_headers(Environment.DEV),
+        ):
+            result = await run_middleware(response)
 
             assert result.headers["Referrer-Policy"] == "strict-origin-when-cross-origin"
 
     async def test_adds_permissions_policy(self):
         """Test Permissions-Policy header is added."""
-        middleware = SecurityHeadersMiddleware(MagicMock())
-        request = MagicMock(spec=Request)
-        request.method = "GET"
-
-        response = MagicMock(spec=_StreamingResponse)
-        response.status_code = 200
-        response.headers = {}
-
-        async def call_next(req):
-            return response
-
-        with patch("app.middleware.security_headers.settings") as mock_settings:
-            mock_settings.current_environment = Environment.DEV
+        response = Response(status_code=200)
 
-            result = await middleware.dispatch(request, call_next)
+        with patch(
+            "app.middleware.security_headers.SECURITY_HEADERS",
+            build_security_headers(Environment.DEV),
+        ):
+            result = await run_middleware(response)
 
             permissions = result.headers["Permissions-Policy"]
             assert "accelerometer=()" in permissions
@@ -119,22 +108,13 @@ class TestSecurityHeadersMiddleware:
 
     async def test_adds_content_security_policy(self):
         """Test Content-Security-Policy header is added."""
-        middleware = SecurityHeadersMiddleware(MagicMock())
-        request = MagicMock(spec=Request)
-        request.method = "GET"
-        request.url = MagicMock(path="/v1/users/me")
+        response = Response(status_code=200)
 
-        response = MagicMock(spec=_StreamingResponse)
-        response.status_code = 200
-        response.headers = {}
-
-        async def call_next(req):
-            return response
-
-        with patch("app.middleware.security_headers.settings") as mock_settings:
-            mock_settings.current_environment = Environment.DEV
-
-            result = await middleware.dispatch(request, call_next)
+        with patch(
+            "app.middleware.security_headers.SECURITY_HEADERS",
+            build_security_headers(Environment.DEV),
+        ):
+            result = await run_middleware(response, path="/v1/users/me")
 
             csp = result.headers["Content-Security-Policy"]
             assert "default-src 'self'" in csp
@@ -142,22 +122,13 @@ class TestSecurityHeadersMiddleware:
 
     async def test_docs_path_uses_docs_csp_allowlist(self):
         """Docs routes should allow required CDN assets for Swagger/ReDoc."""
-        middleware = SecurityHeadersMiddleware(MagicMock())
-        request = MagicMock(spec=Request)
-        request.method = "GET"
-        request.url = MagicMock(path="/v1/docs")
-
-        response = MagicMock(spec=_StreamingResponse)
-        response.status_code = 200
-        response.headers = {}
+        response = Response(status_code=200)
 
-        async def call_next(req):
-            return response
-
-        with patch("app.middleware.security_headers.settings") as mock_settings:
-            mock_settings.current_environment = Environment.DEV
-
-            result = await middleware.dispatch(request, call_next)
+        with patch(
+            "app.middleware.security_headers.SECURITY_HEADERS",
+            build_security_headers(Environment.DEV),
+        ):
+            result = await run_middleware(response, path="/v1/docs")
 
             csp = result.headers["Content-Security-Policy"]
             assert "https://cdn.jsdelivr.net" in csp
@@ -166,22 +137,13 @@ class TestSecurityHeadersMiddleware:
 
     async def test_non_docs_path_uses_strict_csp(self):
         """Non-doc routes should not allow docs CDN or unsafe inline scripts."""
-        middleware = SecurityHeadersMiddleware(MagicMock())
-        request = MagicMock(spec=Request)
-        request.method = "GET"
-        request.url = MagicMock(path="/v1/users/me")
-
-        response = MagicMock(spec=_StreamingResponse)
-        response.status_code = 200
-        response.headers = {}
-
-        async def call_next(req):
-            return response
-
-        with patch("app.middleware.security_headers.settings") as mock_settings:
-            mock_settings.current_environment = Environment.DEV
+        response = Response(status_code=200)
 
-            result = await middleware.dispatch(request, call_next)
+        with patch(
+            "app.middleware.security_headers.SECURITY_HEADERS",
+            build_security_headers(Environment.DEV),
+        ):
+            result = await run_middleware(response, path="/v1/users/me")
 
             csp = result.headers["Content-Security-Policy"]
             assert "script-src 'self';" in csp
@@ -195,61 +157,37 @@ class TestHSTSHeader:
 
     async def test_hsts_not_added_in_dev(self):
         """Test HSTS is NOT added in DEV environment."""
-        middleware = SecurityHeadersMiddleware(MagicMock())
-        request = MagicMock(spec=Request)
-        request.method = "GET"
+        response = Response(status_code=200)
 
-        response = MagicMock(spec=_StreamingResponse)
-        response.status_code = 200
-        response.headers = {}
-
-        async def call_next(req):
-            return response
-
-        with patch("app.middleware.security_headers.settings") as mock_settings:
-            mock_settings.current_environment = Environment.DEV
-
-            result = await middleware.dispatch(request, call_next)
+        with patch(
+            "app.middleware.security_headers.SECURITY_HEADERS",
+            build_security_headers(Environment.DEV),
+        ):
+            result = await run_middleware(response)
 
             assert "Strict-Transport-Security" not in result.headers
 
     async def test_hsts_not_added_in_local(self):
         """Test HSTS is NOT added in LOCAL environment."""
-        middleware = SecurityHeadersMiddleware(MagicMock())
-        request = MagicMock(spec=Request)
-        request.method = "GET"
-
-        response = MagicMock(spec=_StreamingResponse)
-        response.status_code = 200
-        response.headers = {}
+        response = Response(status_code=200)
 
-        async def call_next(req):
-            return response
-
-        with patch("app.middleware.security_headers.settings") as mock_settings:
-            mock_settings.current_environment = Environment.LOCAL
-
-            result = await middleware.dispatch(request, call_next)
+        with patch(
+            "app.middleware.security_headers.SECURITY_HEADERS",
+            build_security_headers(Environment.LOCAL),
+        ):
+            result = await run_middleware(response)
 
             assert "Strict-Transport-Security" not in result.headers
 
     async def test_hsts_added_in_staging(self):
         """Test HSTS is added in STG environment."""
-        middleware = SecurityHeadersMiddleware(MagicMock())
-        request = MagicMock(spec=Request)
-        request.method = "GET"
-
-        response = MagicMock(spec=_StreamingResponse)
-        response.status_code = 200
-        response.headers = {}
-
-        async def call_next(req):
-            return response
-
-        with patch("app.middleware.security_headers.settings") as mock_settings:
-            mock_settings.current_environment = Environment.STG
+        response = Response(status_code=200)
 
-            result = await middleware.dispatch(request, call_next)
+        with patch(
+            "app.middleware.security_headers.SECURITY_HEADERS",
+            build_security_headers(Environment.STG),
+        ):
+            result = await run_middleware(response)
 
             hsts = result.headers["Strict-Transport-Security"]
             assert "max-age=31536000" in hsts
@@ -258,21 +196,13 @@ class TestHSTSHeader:
 
     async def test_hsts_added_in_production(self):
         """Test HSTS is added in PRD environment."""
-        middleware = SecurityHeadersMiddleware(MagicMock())
-        request = MagicMock(spec=Request)
-        request.method = "GET"
+        response = Response(status_code=200)
 
-        response = MagicMock(spec=_StreamingResponse)
-        response.status_code = 200
-        response.headers = {}
-
-        async def call_next(req):
-            return response
-
-        with patch("app.middleware.security_headers.settings") as mock_settings:
-            mock_settings.current_environment = Environment.PRD
-
-            result = await middleware.dispatch(request, call_next)
+        with patch(
+            "app.middleware.security_headers.SECURITY_HEADERS",
+            build_security_headers(Environment.PRD),
+        ):
+            result = await run_middleware(response)
 
             hsts = result.headers["Strict-Transport-Security"]
             assert "max-age=31536000" in hsts  # 1 year
@@ -287,21 +217,13 @@ class TestSecurityHeadersAllMethods:
     @pytest.mark.parametrize("method", ["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD"])
     async def test_headers_added_for_method(self, method):
         """Test security headers are added for various HTTP methods."""
-        middleware = SecurityHeadersMiddleware(MagicMock())
-        request = MagicMock(spec=Request)
-        request.method = method
-
-        response = MagicMock(spec=_StreamingResponse)
-        response.status_code = 200
-        response.headers = {}
+        response = Response(status_code=200)
 
-        async def call_next(req):
-            return response
-
-        with patch("app.middleware.security_headers.settings") as mock_settings:
-            mock_settings.current_environment = Environment.DEV
-
-            result = await middleware.dispatch(request, call_next)
+        with patch(
+            "app.middleware.security_headers.SECURITY_HEADERS",
+            build_security_headers(Environment.DEV),
+        ):
+            result = await run_middleware(response, method=method)
 
             # Verify all standard headers are present
             assert "X-Content-Type-Options" in result.headers
@@ -319,21 +241,13 @@ class TestSecurityHeadersStatusCodes:
     @pytest.mark.parametrize("status_code", [200, 201, 204, 400, 401, 403, 404, 500])
     async def test_headers_added_for_status_code(self, status_code):
         """Test security headers are added for various status codes."""
-        middleware = SecurityHeadersMiddleware(MagicMock())
-        request = MagicMock(spec=Request)
-        request.method = "GET"
-
-        response = MagicMock(spec=_StreamingResponse)
-        response.status_code = status_code
-        response.headers = {}
-
-        async def call_next(req):
-            return response
-
-        with patch("app.middleware.security_headers.settings") as mock_settings:
-            mock_settings.current_environment = Environment.DEV
+        response = Response(status_code=status_code)
 
-            result = await middleware.dispatch(request, call_next)
+        with patch(
+            "app.middleware.security_headers.SECURITY_HEADERS",
+            build_security_headers(Environment.DEV),
+        ):
+            result = await run_middleware(response)
 
             assert "X-Content-Type-Options" in result.headers
             assert "X-Frame-Options" in result.headers
@@ -345,44 +259,79 @@ class TestSecurityHeadersPreservesExisting:
 
     async def test_preserves_response_status_code(self):
         """Test that response status code is preserved."""
-        middleware = SecurityHeadersMiddleware(MagicMock())
-        request = MagicMock(spec=Request)
-        request.method = "GET"
+        response = Response(status_code=201)
 
-        response = MagicMock(spec=_StreamingResponse)
-        response.status_code = 201
-        response.headers = {}
-
-        async def call_next(req):
-            return response
-
-        with patch("app.middleware.security_headers.settings") as mock_settings:
-            mock_settings.current_environment = Environment.DEV
-
-            result = await middleware.dispatch(request, call_next)
+        with patch(
+            "app.middleware.security_headers.SECURITY_HEADERS",
+            build_security_headers(Environment.DEV),
+        ):
+            result = await run_middleware(response)
 
             assert result.status_code == 201
 
     async def test_preserves_existing_headers(self):
         """Test that existing response headers are preserved."""
-        middleware = SecurityHeadersMiddleware(MagicMock())
-        request = MagicMock(spec=Request)
-        request.method = "GET"
+        response = Response(status_code=200, headers={"X-Custom-Header": "custom-value"})
+
+        with patch(
+            "app.middleware.security_headers.SECURITY_HEADERS",
+            build_security_headers(Environment.DEV),
+        ):
+            result = await run_middleware(response)
 
-        response = MagicMock(spec=_StreamingResponse)
-        response.status_code = 200
-        response.headers = {"X-Custom-Header": "custom-value"}
+            assert result.headers["X-Custom-Header"] == "custom-value"
+            assert "X-Content-Type-Options" in result.headers
 
-        async def call_next(req):
-            return response
+    async def test_overrides_upstream_security_header(self):
+        """Test a managed header set upstream is replaced rather than duplicated."""
+        response = Response(status_code=200, headers={"X-Frame-Options": "SAMEORIGIN"})
 
-        with patch("app.middleware.security_headers.settings") as mock_settings:
-            mock_settings.current_environment = Environment.DEV
+        result = await run_middleware(response)
 
-            result = await middleware.dispatch(request, call_next)
+        assert result.headers.getlist("X-Frame-Options") == ["DENY"]
 
-            assert result.headers["X-Custom-Header"] == "custom-value"
-            assert "X-Content-Type-Options" in result.headers
+    async def test_preserves_upstream_cache_control(self):
+        """Test an endpoint-provided Cache-Control header is kept."""
+        response = Response(status_code=200, headers={"Cache-Control": "public, max-age=60"})
+
+        result = await run_middleware(response)
+
+        assert result.headers.getlist("Cache-Control") == ["public, max-age=60"]
+
+    async def test_adds_cache_control_when_missing(self):
+        """Test the no-store Cache-Control default is added."""
+        response = Response(status_code=200)
+
+        result = await run_middleware(response)
+
+        assert result.headers["Cache-Control"] == "no-store, no-cache, must-revalidate"
+
+    async def test_body_passes_through(self):
+        """Test the response body is forwarded unchanged."""
+        messages: list[Message] = []
+
+        async def receive() -> Message:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: Message) -> None:
+            messages.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": "/v1/users/me", "headers": []}
+        await SecurityHeadersMiddleware(Response(content=b"payload"))(scope, receive, send)
+
+        assert messages[-1]["type"] == "http.response.body"
+        assert messages[-1]["body"] == b"payload"
+
+    async def test_non_http_scope_is_passed_through(self):
+        """Test lifespan and websocket scopes bypass header injection."""
+        calls = []
+
+        async def app(scope, receive, send):
+            calls.append(scope["type"])
+
+        await SecurityHeadersMiddleware(app)({"type": "lifespan"}, None, None)
+
+        assert calls == ["lifespan"]
 
 
 class TestSecurityHeaderValues:
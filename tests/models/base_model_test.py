@@ -2,7 +2,7 @@ from datetime import datetime
 
 import pytest
 
-from app.models.base import Base
+from app.models.base import Base, camel_to_snake
 from app.models.user import User
 
 
@@ -13,6 +13,15 @@ class TestBaseModel:
         """Test that Base models have id field."""
         assert hasattr(Base, "id")
 
+    def test_id_is_identity_primary_key(self):
+        """Test that id is an identity primary key without a redundant index."""
+        id_column = User.__table__.c.id
+
+        assert id_column.primary_key
+        assert id_column.identity is not None
+        assert id_column.identity.cache == 1000
+        assert not id_column.index
+
     def test_has_created_at_field(self):
         """Test that Base models have created_at field."""
         assert hasattr(Base, "created_at")
@@ -46,6 +55,13 @@ class TestBaseModel:
 
         assert HTTPRequest.__tablename__ == "http_request"
 
+    def test_camel_to_snake_splits_class_names(self):
+        """Test the conversion used to derive snake_case table names."""
+        assert camel_to_snake("OrderLineItem") == "order_line_item"
+        assert camel_to_snake("User") == "user"
+        assert camel_to_snake("HTTPRequest") == "h_t_t_p_request"
+        assert camel_to_snake("") == ""
+
 
 @pytest.mark.anyio
 class TestToDict:
@@ -186,3 +202,21 @@ class TestToDict:
         assert "id" in result
         assert "email" in result
         assert "hashed_password" in result
+
+    async def test_to_dict_unloaded_attributes_fall_back_to_getattr(self):
+        """Test that attributes missing from the instance state still serialize."""
+        transient_user = User(email="transient@example.com")
+
+        result = transient_user.to_dict()
+
+        assert result["email"] == "transient@example.com"
+        assert result["id"] is None
+        assert result["username"] is None
+
+    def test_column_keys_computed_once(self):
+        """Test that column keys are computed once per model class."""
+        keys = User._column_keys()
+
+        assert isinstance(keys, tuple)
+        assert {"id", "email", "username", "created_at"} <= set(keys)
+        assert User._column_keys() is keys
@@ -1,10 +1,16 @@
+import dataclasses
+from unittest.mock import patch
+
 import pytest
 from faker import Faker
+from pydantic import BaseModel, computed_field
+from sqlalchemy.exc import MultipleResultsFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import repos
 from app.core.config import settings
 from app.models import User
+from app.repos.base import dump_schema
 from app.schemas import UserCreate, UserUpdate
 
 
@@ -27,6 +33,35 @@ class TestBaseRepositoryValidation:
         with pytest.raises(ValueError, match="Column 'nonexistent_column' does not exist"):
             repo._validate_column_exists("nonexistent_column")
 
+    async def test_validate_column_exists_non_column_attribute(self, db_session: AsyncSession):
+        """Test that validation fails for a model attribute that is not a column."""
+        repo = repos.UserRepo(db_session)
+
+        with pytest.raises(ValueError, match="Column 'to_dict' is not a valid SQLAlchemy column"):
+            repo._validate_column_exists("to_dict")
+
+    async def test_get_column_is_cached(self, db_session: AsyncSession):
+        """Test that resolved column attributes are cached per model and column."""
+        repo = repos.UserRepo(db_session)
+
+        assert repo._get_column("email") is User.email
+
+        with patch("app.repos.base.getattr", create=True) as mock_getattr:
+            assert repos.UserRepo(db_session)._get_column("email") is User.email
+            mock_getattr.assert_not_called()
+
+    async def test_by_id_statements_are_cached(self, db_session: AsyncSession):
+        """Test that id lookup statements are built once per model and column."""
+        repo = repos.UserRepo(db_session)
+
+        select_stmt = repo._select_by_id_stmt("email")
+        delete_stmt = repo._delete_by_id_stmt("email")
+
+        other_repo = repos.UserRepo(db_session)
+        assert other_repo._select_by_id_stmt("email") is select_stmt
+        assert other_repo._delete_by_id_stmt("email") is delete_stmt
+        assert other_repo._select_by_id_stmt("id") is not select_stmt
+
     async def test_get_by_id_invalid_column(self, db_session: AsyncSession, user: User):
         """Test get_by_id with invalid column name raises ValueError."""
         repo = repos.UserRepo(db_session)
@@ -77,6 +112,28 @@ class TestBaseRepositoryCreate:
         assert created_user.email == user_data.email
         assert created_user.last_name == ""  # Empty string, not None
 
+    async def test_create_one_does_not_commit_by_default(
+        self, db_session: AsyncSession, faker: Faker, pre_hashed_password: str
+    ):
+        """Test that writes leave committing to the caller unless auto_commit is set."""
+        repo = repos.UserRepo(db_session)
+        user_data = UserCreate(
+            email=faker.safe_email(),
+            username=faker.user_name(),
+            hashed_password=pre_hashed_password,
+            first_name=faker.first_name(),
+            last_name=faker.last_name(),
+        )
+
+        with patch.object(db_session, "commit", wraps=db_session.commit) as mock_commit:
+            created_user = await repo.create_one(user_data)
+            mock_commit.assert_not_called()
+
+            await repo.update_by_id(
+                created_user.id, UserUpdate(first_name="Committed"), auto_commit=True
+            )
+            mock_commit.assert_called_once()
+
     async def test_create_bulk_empty_list(self, db_session: AsyncSession):
         """Test that create_bulk with empty list returns empty list."""
         repo = repos.UserRepo(db_session)
@@ -130,6 +187,85 @@ class TestBaseRepositoryCreate:
         assert len(created_users) == 2
         assert all(user.last_name == "" for user in created_users)
 
+    async def test_create_bulk_ids_empty_list(self, db_session: AsyncSession):
+        """Test that create_bulk_ids with empty list returns empty list."""
+        repo = repos.UserRepo(db_session)
+
+        result = await repo.create_bulk_ids([])
+
+        assert result == []
+
+    async def test_create_bulk_ids_success(
+        self, db_session: AsyncSession, faker: Faker, pre_hashed_password: str
+    ):
+        """Test bulk creation returning only the new IDs."""
+        repo = repos.UserRepo(db_session)
+        users_data = [
+            UserCreate(
+                email=faker.safe_email(),
+                username=faker.user_name(),
+                hashed_password=pre_hashed_password,
+                first_name=faker.first_name(),
+                last_name=faker.last_name(),
+            )
+            for _ in range(3)
+        ]
+
+        created_ids = await repo.create_bulk_ids(users_data)
+
+        assert len(created_ids) == 3
+        assert all(isinstance(created_id, int) for created_id in created_ids)
+
+        created_users = await repo.get_multi_by_ids(obj_ids=created_ids)
+        assert {user.email for user in created_users} == {user.email for user in users_data}
+
+    async def test_create_bulk_ids_invalid_column(self, db_session: AsyncSession, faker: Faker):
+        """Test create_bulk_ids with invalid column name raises ValueError."""
+        repo = repos.UserRepo(db_session)
+        user_data = UserCreate(
+            email=faker.safe_email(),
+            username=faker.user_name(),
+            hashed_password="hashed",
+            first_name=faker.first_name(),
+            last_name=faker.last_name(),
+        )
+
+        with pytest.raises(ValueError, match="Column 'invalid_column' does not exist"):
+            await repo.create_bulk_ids([user_data], id_column_name="invalid_column")
+
+    async def test_create_bulk_copy_empty_list(self, db_session: AsyncSession):
+        """Test that create_bulk_copy with empty list copies nothing."""
+        repo = repos.UserRepo(db_session)
+
+        result = await repo.create_bulk_copy([])
+
+        assert result == 0
+
+    async def test_create_bulk_copy_success(
+        self, db_session: AsyncSession, faker: Faker, pre_hashed_password: str
+    ):
+        """Test bulk creation of users through COPY."""
+        repo = repos.UserRepo(db_session)
+        users_data = [
+            UserCreate(
+                email=f"copy{i}@example.com",
+                username=f"copy_user_{i}",
+                hashed_password=pre_hashed_password,
+                first_name=faker.first_name(),
+                last_name=faker.last_name(),
+            )
+            for i in range(5)
+        ]
+
+        copied_count = await repo.create_bulk_copy(users_data)
+
+        assert copied_count == 5
+        for user_data in users_data:
+            created_user = await repo.get_by_email(user_data.email)
+            assert created_user is not None
+            assert created_user.username == user_data.username
+            assert created_user.created_at is not None
+
 
 @pytest.mark.anyio
 class TestBaseRepositoryRead:
@@ -195,6 +331,83 @@ class TestBaseRepositoryRead:
 
         assert len(result) == 0
 
+    async def test_iter_multi_by_ids_streams_rows(
+        self, db_session: AsyncSession, faker: Faker, pre_hashed_password: str
+    ):
+        """Test iter_multi_by_ids yields the same rows as get_multi_by_ids."""
+        repo = repos.UserRepo(db_session)
+
+        users_data = [
+            UserCreate(
+                email=faker.unique.email(),
+                username=faker.unique.user_name(),
+                hashed_password=pre_hashed_password,
+                first_name=faker.first_name(),
+                last_name=faker.last_name(),
+            )
+            for _ in range(5)
+        ]
+        created_users = await repo.create_bulk(users_data)
+        user_ids = [user.id for user in created_users]
+
+        streamed = [user async for user in repo.iter_multi_by_ids(obj_ids=user_ids, yield_per=2)]
+
+        assert sorted(user.id for user in streamed) == sorted(user_ids)
+
+        paged = [user async for user in repo.iter_multi_by_ids(skip=0, limit=2, obj_ids=user_ids)]
+        assert len(paged) == 2
+
+    async def test_iter_multi_by_ids_invalid_column(self, db_session: AsyncSession):
+        """Test iter_multi_by_ids with invalid column name raises ValueError."""
+        repo = repos.UserRepo(db_session)
+
+        with pytest.raises(ValueError, match="Column 'invalid_column' does not exist"):
+            async for _ in repo.iter_multi_by_ids(id_column_name="invalid_column", obj_ids=[1]):
+                pass
+
+    async def test_existing_ids_returns_present_subset(
+        self, db_session: AsyncSession, faker: Faker, pre_hashed_password: str
+    ):
+        """Test existing_ids returns only the IDs found in the table."""
+        repo = repos.UserRepo(db_session)
+        users_data = [
+            UserCreate(
+                email=faker.safe_email(),
+                username=faker.user_name(),
+                hashed_password=pre_hashed_password,
+                first_name=faker.first_name(),
+                last_name=faker.last_name(),
+            )
+            for _ in range(2)
+        ]
+        created_users = await repo.create_bulk(users_data)
+        user_ids = {user.id for user in created_users}
+
+        result = await repo.existing_ids([*user_ids, 999999999])
+
+        assert result == user_ids
+
+    async def test_existing_ids_custom_column(self, db_session: AsyncSession, user: User):
+        """Test existing_ids with a custom ID column."""
+        repo = repos.UserRepo(db_session)
+
+        result = await repo.existing_ids(
+            [user.email, "missing@example.com"], id_column_name="email"
+        )
+
+        assert result == {user.email}
+
+    async def test_existing_ids_empty_list(self, db_session: AsyncSession):
+        """Test existing_ids with empty ID list skips the query."""
+        repo = repos.UserRepo(db_session)
+
+        with patch.object(db_session, "scalars") as mock_scalars:
+            result = await repo.existing_ids([])
+
+            mock_scalars.assert_not_called()
+
+        assert result == set()
+
     async def test_get_multi_by_ids_custom_column(
         self, db_session: AsyncSession, faker: Faker, pre_hashed_password: str
     ):
@@ -370,6 +583,112 @@ class TestBaseRepositoryUpdate:
         for i, updated_user in enumerate(result):
             assert updated_user.first_name == f"NewName{i}"
 
+    async def test_update_bulk_single_statement(
+        self, db_session: AsyncSession, faker: Faker, pre_hashed_password: str
+    ):
+        """Test that updates of the same columns run as one statement."""
+        repo = repos.UserRepo(db_session)
+        created_users = await repo.create_bulk(
+            [
+                UserCreate(
+                    email=f"single{i}@example.com",
+                    username=f"single_user_{i}",
+                    hashed_password=pre_hashed_password,
+                    first_name=faker.first_name(),
+                    last_name=faker.last_name(),
+                )
+                for i in range(3)
+            ]
+        )
+        updates = [
+            (user.id, UserUpdate(first_name=f"Batch{i}")) for i, user in enumerate(created_users)
+        ]
+
+        with patch.object(db_session, "execute", wraps=db_session.execute) as mock_execute:
+            result = await repo.update_bulk(updates)
+
+        mock_execute.assert_called_once()
+        assert [user.first_name for user in result] == ["Batch0", "Batch1", "Batch2"]
+
+    async def test_update_bulk_mixed_columns_and_repeated_ids(
+        self, db_session: AsyncSession, faker: Faker, pre_hashed_password: str
+    ):
+        """Test different column sets and repeated identifiers in one call."""
+        repo = repos.UserRepo(db_session)
+        created_users = await repo.create_bulk(
+            [
+                UserCreate(
+                    email=f"mixed{i}@example.com",
+                    username=f"mixed_user_{i}",
+                    hashed_password=pre_hashed_password,
+                    first_name=faker.first_name(),
+                    last_name=faker.last_name(),
+                )
+                for i in range(2)
+            ]
+        )
+        first, second = created_users
+        updates = [
+            (first.id, UserUpdate(first_name="First")),
+            (second.id, UserUpdate(last_name="Second")),
+            (first.id, UserUpdate(last_name="Merged")),
+        ]
+
+        result = await repo.update_bulk(updates)
+
+        assert len(result) == 2
+        assert result[0].id == first.id
+        assert result[0].first_name == "First"
+        assert result[0].last_name == "Merged"
+        assert result[1].id == second.id
+        assert result[1].last_name == "Second"
+
+    async def test_update_bulk_multiple_matches_raises(
+        self, db_session: AsyncSession, faker: Faker, pre_hashed_password: str
+    ):
+        """Test that a tuple matching several rows raises unless allowed."""
+        repo = repos.UserRepo(db_session)
+        await repo.create_bulk(
+            [
+                UserCreate(
+                    email=f"shared{i}@example.com",
+                    username=f"shared_user_{i}",
+                    hashed_password=pre_hashed_password,
+                    first_name=faker.first_name(),
+                    last_name="SharedLastName",
+                )
+                for i in range(2)
+            ]
+        )
+        updates = [("SharedLastName", UserUpdate(first_name="Same"))]
+
+        with pytest.raises(MultipleResultsFound, match="allow_multiple=True"):
+            await repo.update_bulk(updates, id_column_name="last_name")
+
+    async def test_update_bulk_allow_multiple(
+        self, db_session: AsyncSession, faker: Faker, pre_hashed_password: str
+    ):
+        """Test that allow_multiple returns every row a tuple matched."""
+        repo = repos.UserRepo(db_session)
+        await repo.create_bulk(
+            [
+                UserCreate(
+                    email=f"multi{i}@example.com",
+                    username=f"multi_user_{i}",
+                    hashed_password=pre_hashed_password,
+                    first_name=faker.first_name(),
+                    last_name="MultiLastName",
+                )
+                for i in range(2)
+            ]
+        )
+        updates = [("MultiLastName", UserUpdate(first_name="Same"))]
+
+        result = await repo.update_bulk(updates, id_column_name="last_name", allow_multiple=True)
+
+        assert len(result) == 2
+        assert all(user.first_name == "Same" for user in result)
+
 
 @pytest.mark.anyio
 class TestBaseRepositoryDelete:
@@ -554,3 +873,66 @@ class TestBaseRepositoryCustomQuery:
         count = result.scalar()
         assert count is not None
         assert count >= 5
+
+
+class _FlatSchema(BaseModel):
+    first_name: str | None = None
+    last_name: str | None = None
+
+
+class TestDumpSchema:
+    """Test schema dumping used by repository writes."""
+
+    def test_flat_schema_matches_model_dump(self):
+        """Test that flat schemas dump to the same values as model_dump."""
+        schema = _FlatSchema(first_name="Jane", last_name=None)
+
+        assert dump_schema(schema, exclude_none=True) == schema.model_dump(exclude_none=True)
+        assert dump_schema(schema, exclude_none=False) == schema.model_dump()
+
+    def test_flat_schema_skips_model_dump(self):
+        """Test that flat schemas are read without calling model_dump."""
+        schema = _FlatSchema(first_name="Jane")
+
+        with patch.object(_FlatSchema, "model_dump") as mock_model_dump:
+            dump_schema(schema, exclude_none=True)
+
+            mock_model_dump.assert_not_called()
+
+    def test_dataclass_schema(self):
+        """Test that dataclass schemas dump their fields, honouring exclude_none."""
+        schema = UserUpdate(first_name="Jane")
+
+        assert dump_schema(schema, exclude_none=True) == {"first_name": "Jane"}
+        assert dump_schema(schema, exclude_none=False) == dataclasses.asdict(schema)
+
+    def test_nested_values_fall_back_to_model_dump(self):
+        """Test that nested models are converted to dicts like model_dump does."""
+
+        class Inner(BaseModel):
+            value: int
+
+        class Outer(BaseModel):
+            inner: Inner
+
+        schema = Outer(inner=Inner(value=1))
+
+        assert dump_schema(schema, exclude_none=True) == {"inner": {"value": 1}}
+
+    def test_computed_fields_fall_back_to_model_dump(self):
+        """Test that computed fields are included like model_dump does."""
+
+        class WithComputedField(BaseModel):
+            first_name: str
+
+            @computed_field  # type: ignore[prop-decorator]
+            @property
+            def display_name(self) -> str:
+                return self.first_name.title()
+
+        schema = WithComputedField(first_name="jane")
+
+        assert dump_schema(schema, exclude_none=True) == {
+            "first_name": "jane",
+            "display_name": "Jane",
+        }
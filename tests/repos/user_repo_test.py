@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import repos
+from app.models import User
+
+
+@pytest.mark.anyio
+class TestUserRepoLookups:
+    """Test the prebuilt username/email lookups in UserRepo."""
+
+    async def test_get_by_username(self, db_session: AsyncSession, user: User):
+        """Test get_by_username finds the user."""
+        result = await repos.UserRepo(db_session).get_by_username(user.username)
+
+        assert result is not None
+        assert result.id == user.id
+
+    async def test_get_by_email(self, db_session: AsyncSession, user: User):
+        """Test get_by_email finds the user."""
+        result = await repos.UserRepo(db_session).get_by_email(user.email)
+
+        assert result is not None
+        assert result.id == user.id
+
+    async def test_get_by_identifier_matches_username_and_email(
+        self, db_session: AsyncSession, user: User
+    ):
+        """Test get_by_identifier accepts either the username or the email."""
+        repo = repos.UserRepo(db_session)
+
+        by_username = await repo.get_by_identifier(user.username)
+        by_email = await repo.get_by_identifier(user.email)
+
+        assert by_username is not None and by_username.id == user.id
+        assert by_email is not None and by_email.id == user.id
+
+    async def test_lookups_return_none_when_missing(self, db_session: AsyncSession):
+        """Test every lookup returns None for unknown values."""
+        repo = repos.UserRepo(db_session)
+
+        assert await repo.get_by_username("missing-user") is None
+        assert await repo.get_by_email("missing@example.com") is None
+        assert await repo.get_by_identifier("missing-user") is None
+
+    async def test_lookups_reuse_prebuilt_statements(self, db_session: AsyncSession, user: User):
+        """Test lookups execute the class-level statements with bound values."""
+        repo = repos.UserRepo(db_session)
+
+        with patch.object(db_session, "scalar", wraps=db_session.scalar) as mock_scalar:
+            await repo.get_by_username(user.username)
+            await repo.get_by_email(user.email)
+            await repo.get_by_identifier(user.username)
+
+        calls = [call.args for call in mock_scalar.call_args_list]
+        assert calls == [
+            (repos.UserRepo._GET_BY_USERNAME_STMT, {"username": user.username}),
+            (repos.UserRepo._GET_BY_EMAIL_STMT, {"email": user.email}),
+            (repos.UserRepo._GET_BY_IDENTIFIER_STMT, {"identifier": user.username}),
+        ]
@@ -0,0 +1,74 @@
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.schemas import BaseSchema, BaseTimestampSchema, UserResponse
+
+
+class _Wrapper(BaseSchema):
+    user: UserResponse
+
+
+class TestBaseSchemaConfig:
+    """Test the shared schema configuration."""
+
+    def test_instances_are_never_revalidated(self):
+        """Test both base schemas disable instance revalidation."""
+        assert BaseSchema.model_config["revalidate_instances"] == "never"
+        assert BaseTimestampSchema.model_config["revalidate_instances"] == "never"
+
+    def test_nested_instance_passes_through(self):
+        """Test a nested schema instance is reused without running validators."""
+        user = UserResponse(
+            id=1,
+            username="nested_user",
+            email="nested@example.com",
+            first_name="Nested",
+            last_name="User",
+            created_at=datetime.now(UTC),
+        )
+
+        with patch.object(UserResponse, "model_validate") as mock_validate:
+            wrapper = _Wrapper(user=user)
+
+        assert wrapper.user is user
+        mock_validate.assert_not_called()
+
+
+class TestDumpTrustedJson:
+    """Test serializing trusted data without building a schema instance."""
+
+    def _row(self, **overrides):
+        values = {
+            "id": 7,
+            "username": "trusted_user1",
+            "email": "trusted@example.com",
+            "first_name": "Trusted",
+            "last_name": "User",
+            "created_at": datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC),
+            "updated_at": None,
+            "hashed_password": "not-serialized",
+        }
+        values.update(overrides)
+        return SimpleNamespace(**values)
+
+    def test_matches_model_dump_json(self):
+        """Test the output is identical to the validated-model serialization."""
+        row = self._row(updated_at=datetime(2026, 2, 3, tzinfo=UTC))
+
+        expected = UserResponse.model_validate(row).model_dump_json().encode()
+
+        assert UserResponse.dump_trusted_json(row) == expected
+
+    def test_excludes_attributes_outside_the_schema(self):
+        """Test attributes the schema doesn't declare are never serialized."""
+        assert b"hashed_password" not in UserResponse.dump_trusted_json(self._row())
+
+    def test_serializer_is_built_once(self):
+        """Test the mirror serializer is cached per schema."""
+        UserResponse.dump_trusted_json(self._row())
+
+        with patch("app.schemas.base.TypeAdapter") as mock_adapter:
+            UserResponse.dump_trusted_json(self._row())
+
+            mock_adapter.assert_not_called()
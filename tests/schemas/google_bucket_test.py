@@ -0,0 +1,75 @@
+import base64
+import hashlib
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas import BucketFile
+
+
+def _bucket_file_data(**overrides) -> dict:
+    data = {
+        "id": "bucket/folder/file.txt/1",
+        "basename": "file.txt",
+        "extension": ".txt",
+        "file_path_in_bucket": "folder/file.txt",
+        "bucket_name": "bucket",
+        "public_url": "https://storage.googleapis.com/bucket/folder/file.txt",
+        "authenticated_url": "https://storage.cloud.google.com/bucket/folder/file.txt",
+        "size_bytes": 11,
+        "md5_hash": None,
+        "crc32c_checksum": None,
+        "content_type": "text/plain",
+        "creation_date": datetime(2026, 1, 1, tzinfo=UTC),
+        "modification_date": datetime(2026, 1, 2, tzinfo=UTC),
+    }
+    data.update(overrides)
+    return data
+
+
+class TestBucketFileHashDecoding:
+    """Test decoding of the GCS base64 hash fields."""
+
+    def test_decodes_md5_hash_to_hex(self):
+        """Test the base64 MD5 digest is decoded to its hex form."""
+        digest = hashlib.md5(b"hello world", usedforsecurity=False).digest()
+
+        bucket_file = BucketFile.model_validate(
+            _bucket_file_data(md5_hash=base64.b64encode(digest).decode())
+        )
+
+        assert bucket_file.md5_hash == digest.hex()
+
+    def test_decodes_crc32c_checksum_to_int(self):
+        """Test the base64 big-endian CRC32C checksum is decoded to an int."""
+        checksum = 0xC99465AA
+
+        bucket_file = BucketFile.model_validate(
+            _bucket_file_data(
+                crc32c_checksum=base64.b64encode(checksum.to_bytes(4, "big")).decode()
+            )
+        )
+
+        assert bucket_file.crc32c_checksum == checksum
+
+    def test_missing_hashes_stay_none(self):
+        """Test objects without hashes validate with both fields unset."""
+        bucket_file = BucketFile.model_validate(_bucket_file_data())
+
+        assert bucket_file.md5_hash is None
+        assert bucket_file.crc32c_checksum is None
+
+    def test_input_is_not_mutated(self):
+        """Test decoding works on a copy of the caller's data."""
+        data = _bucket_file_data(md5_hash="AAAA", crc32c_checksum="AAAAAA==")
+
+        BucketFile.model_validate(data)
+
+        assert data["md5_hash"] == "AAAA"
+        assert data["crc32c_checksum"] == "AAAAAA=="
+
+    def test_invalid_base64_raises_validation_error(self):
+        """Test malformed base64 is reported as a validation error."""
+        with pytest.raises(ValidationError):
+            BucketFile.model_validate(_bucket_file_data(md5_hash="A"))
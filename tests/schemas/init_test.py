@@ -0,0 +1,29 @@
+import pytest
+
+import app.schemas as schemas
+from app.schemas import token, user
+
+
+class TestLazySchemaExports:
+    """Test lazy re-exports from the app.schemas package."""
+
+    def test_export_resolves_to_submodule_class(self):
+        """Test that package exports are the classes defined in their submodules."""
+        assert schemas.UserCreate is user.UserCreate
+        assert schemas.TokenPayload is token.TokenPayload
+
+    def test_export_is_cached_after_first_access(self):
+        """Test that a resolved export is stored on the package."""
+        schemas.UserResponse
+
+        assert vars(schemas)["UserResponse"] is user.UserResponse
+
+    def test_every_name_in_all_resolves(self):
+        """Test that every name listed in __all__ can be imported."""
+        for name in schemas.__all__:
+            assert getattr(schemas, name) is not None
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+            schemas.Missing  # noqa: B018
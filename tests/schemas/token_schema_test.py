@@ -0,0 +1,30 @@
+import pytest
+from pydantic import ValidationError
+
+from app.schemas import HealthCheckResponse, Token, TokenData, TokenPayload
+
+
+class TestFrozenSchemas:
+    """Test that the per-request token and health schemas are immutable."""
+
+    @pytest.mark.parametrize(
+        ("schema", "field", "value"),
+        [
+            (Token(access_token="access"), "access_token", "other"),
+            (TokenData(user_id=1), "user_id", 2),
+            (TokenPayload(refresh_token="refresh"), "refresh_token", "other"),
+            (HealthCheckResponse(status="healthy"), "status", "unhealthy"),
+        ],
+    )
+    def test_assignment_is_rejected(self, schema, field, value):
+        """Test that fields can't be reassigned after construction."""
+        with pytest.raises(ValidationError, match="frozen"):
+            setattr(schema, field, value)
+
+    def test_base_config_is_kept(self):
+        """Test that frozen schemas still inherit the shared base configuration."""
+        assert Token.model_config["extra"] == "forbid"
+        assert Token.model_config["from_attributes"] is True
+
+        with pytest.raises(ValidationError):
+            Token(access_token="access", unexpected="value")  # type: ignore[call-arg]
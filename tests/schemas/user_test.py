@@ -0,0 +1,191 @@
+import dataclasses
+import random
+import re
+
+import pytest
+from pydantic import SecretStr, ValidationError
+
+from app.schemas.user import (
+    UserBase,
+    UserCreate,
+    UserResponse,
+    UserSignup,
+    UserUpdate,
+    is_valid_password,
+    is_valid_username,
+)
+
+# Patterns the classifiers replaced, kept here to check they accept the same values
+PASSWORD_REGEX = re.compile(
+    r"^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[@$!%*?&])[A-Za-z\d@$!%*?&]{8,}\Z"
+)
+USERNAME_REGEX = re.compile(r"^(?=.*\d)[A-Za-z0-9_]{3,50}\Z")
+
+SAMPLE_CHARACTERS = "aZ9_@$!%*?&#- .\n"
+
+
+class TestIsValidPassword:
+    """Test password complexity checks."""
+
+    @pytest.mark.parametrize("password", ["P@ssword123", "aB3$aB3$", "Zz9&" * 20])
+    def test_accepts_complex_passwords(self, password):
+        """Test that passwords meeting every requirement are accepted."""
+        assert is_valid_password(password)
+
+    @pytest.mark.parametrize(
+        "password",
+        [
+            "aB3$aB3",  # too short
+            "password123@",  # no uppercase
+            "PASSWORD123@",  # no lowercase
+            "Password@@@",  # no digit
+            "Password123",  # no special character
+            "Password 123@",  # space is not allowed
+            "Password123#",  # special character outside the allowed set
+            "Pässword123@",  # non-ASCII
+            "Password123@\n",  # trailing newline
+        ],
+    )
+    def test_rejects_weak_passwords(self, password):
+        """Test that passwords missing a requirement are rejected."""
+        assert not is_valid_password(password)
+
+    def test_matches_regex_on_random_values(self):
+        """Test that the classifier agrees with the original pattern."""
+        rng = random.Random(0)
+        for _ in range(2000):
+            value = "".join(rng.choices(SAMPLE_CHARACTERS, k=rng.randint(0, 12)))
+            assert is_valid_password(value) == bool(PASSWORD_REGEX.match(value)), value
+
+
+class TestIsValidUsername:
+    """Test username format checks."""
+
+    @pytest.mark.parametrize("username", ["abc1", "user_42", "9" * 50])
+    def test_accepts_valid_usernames(self, username):
+        """Test that valid usernames are accepted."""
+        assert is_valid_username(username)
+
+    @pytest.mark.parametrize("username", ["a1", "9" * 51, "username", "user 1", "user-1", "usér1"])
+    def test_rejects_invalid_usernames(self, username):
+        """Test that invalid usernames are rejected."""
+        assert not is_valid_username(username)
+
+    def test_matches_regex_on_random_values(self):
+        """Test that the classifier agrees with the original pattern."""
+        rng = random.Random(0)
+        for _ in range(2000):
+            value = "".join(rng.choices(SAMPLE_CHARACTERS, k=rng.randint(0, 8)))
+            assert is_valid_username(value) == bool(USERNAME_REGEX.match(value)), value
+
+
+class TestUserSignupValidation:
+    """Test UserSignup field validators."""
+
+    def test_valid_signup(self):
+        """Test that a valid signup payload passes validation."""
+        signup = UserSignup(
+            username="new_user1",
+            email="new_user1@example.com",
+            password=SecretStr("P@ssword123"),
+        )
+
+        assert signup.username == "new_user1"
+
+    def test_invalid_password_rejected(self):
+        """Test that a weak password fails validation."""
+        with pytest.raises(ValidationError, match="Password must be"):
+            UserSignup(
+                username="new_user1",
+                email="new_user1@example.com",
+                password=SecretStr("password123"),
+            )
+
+    def test_invalid_username_rejected(self):
+        """Test that a malformed username fails validation."""
+        with pytest.raises(ValidationError, match="Username must be"):
+            UserSignup(
+                username="no digits",
+                email="new_user1@example.com",
+                password=SecretStr("P@ssword123"),
+            )
+
+
+class TestTrustedEmail:
+    """Test the shape-only email check used on internal user schemas."""
+
+    @pytest.mark.parametrize("email", ["user@example.com", "first.last+tag@sub.example.org"])
+    def test_accepts_email_addresses(self, email):
+        """Test that well-formed addresses pass unchanged."""
+        user = UserBase(
+            username="user1",
+            email=email,
+            hashed_password="hash",
+            first_name="First",
+            last_name="Last",
+        )
+
+        assert user.email == email
+
+    @pytest.mark.parametrize(
+        "email", ["", "user", "user@", "@example.com", "user@example", "a b@c.d"]
+    )
+    def test_rejects_malformed_addresses(self, email):
+        """Test that values not shaped like an email address are rejected."""
+        with pytest.raises(ValidationError, match="not a valid email address"):
+            UserBase(
+                username="user1",
+                email=email,
+                hashed_password="hash",
+                first_name="First",
+                last_name="Last",
+            )
+
+    def test_signup_still_uses_email_validator(self):
+        """Test that the signup edge keeps full EmailStr validation."""
+        with pytest.raises(ValidationError):
+            UserSignup(
+                username="user1",
+                email="user@example..com",
+                password=SecretStr("P@ssword123"),
+            )
+
+    def test_json_schema_keeps_email_format(self):
+        """Test that the OpenAPI schema still advertises the email format."""
+        schema = UserResponse.model_json_schema()
+
+        assert schema["properties"]["email"]["format"] == "email"
+
+
+class TestInternalUserDataclasses:
+    """Test the dataclasses carrying user data from the service to the repository."""
+
+    def test_user_create_is_not_validated(self):
+        """Test that UserCreate stores already-validated values as given."""
+        user = UserCreate(
+            username="user1",
+            email="user@example.com",
+            hashed_password="hash",
+            first_name="",
+            last_name="",
+        )
+
+        assert dataclasses.asdict(user) == {
+            "username": "user1",
+            "email": "user@example.com",
+            "hashed_password": "hash",
+            "first_name": "",
+            "last_name": "",
+        }
+
+    def test_user_update_defaults_to_no_changes(self):
+        """Test that every UserUpdate field defaults to None."""
+        assert all(value is None for value in dataclasses.asdict(UserUpdate()).values())
+
+    def test_instances_are_frozen_and_slotted(self):
+        """Test that the dataclasses are immutable and carry no instance dict."""
+        update = UserUpdate(first_name="Jane")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            update.first_name = "John"  # type: ignore[misc]
+        assert not hasattr(update, "__dict__")
@@ -2,8 +2,8 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from app.core.config import Environment
-from app.services.cache.base import BaseRedisClient, get_redis_pool
+from app.core.config import Environment, settings
+from app.services.cache.base import BaseRedisClient, get_redis_client, get_redis_pool
 
 
 class TestGetRedisPool:
@@ -16,10 +16,17 @@ class TestGetRedisPool:
 
         base_module._redis_pool = None
 
-        with patch("app.services.cache.base.ConnectionPool.from_url", return_value=mock_redis_pool):
+        with patch(
+            "app.services.cache.base.BlockingConnectionPool.from_url", return_value=mock_redis_pool
+        ) as mock_from_url:
             pool = get_redis_pool()
 
             assert pool == mock_redis_pool
+            kwargs = mock_from_url.call_args.kwargs
+            assert kwargs["max_connections"] == settings.redis_max_pool_connections
+            assert kwargs["timeout"] == settings.redis_pool_wait_timeout
+            assert kwargs["health_check_interval"] == settings.redis_health_check_interval
+            assert kwargs["protocol"] == settings.redis_protocol
 
     def test_get_redis_pool_returns_existing_pool(self, mock_redis_pool: Mock):
         """Test returning existing Redis pool."""
@@ -32,6 +39,46 @@ class TestGetRedisPool:
         assert pool == mock_redis_pool
 
 
+@pytest.fixture
+def reset_shared_redis():
+    """Drop the shared Redis client so each test builds its own."""
+    import app.services.cache.base as base_module
+
+    base_module._shared_redis = None
+    yield
+    base_module._shared_redis = None
+
+
+@pytest.mark.usefixtures("reset_shared_redis")
+class TestGetRedisClient:
+    """Test get_redis_client function."""
+
+    def test_get_redis_client_creates_client_on_shared_pool(self, mock_redis_pool: Mock):
+        """Test creating the shared client on the shared pool."""
+        with (
+            patch("app.services.cache.base.get_redis_pool", return_value=mock_redis_pool),
+            patch("app.services.cache.base.Redis") as mock_redis_class,
+        ):
+            client = get_redis_client()
+
+            assert client == mock_redis_class.return_value
+            mock_redis_class.assert_called_once_with(connection_pool=mock_redis_pool)
+
+    def test_services_share_one_client(self, mock_redis_pool: Mock):
+        """Test every BaseRedisClient reuses the same Redis instance."""
+        with (
+            patch("app.services.cache.base.settings.current_environment", Environment.DEV),
+            patch("app.services.cache.base.get_redis_pool", return_value=mock_redis_pool),
+            patch("app.services.cache.base.Redis") as mock_redis_class,
+        ):
+            first = BaseRedisClient()
+            second = BaseRedisClient()
+
+            assert first.redis_client is second.redis_client
+            mock_redis_class.assert_called_once()
+
+
+@pytest.mark.usefixtures("reset_shared_redis")
 class TestBaseRedisClient:
     """Test BaseRedisClient class."""
 
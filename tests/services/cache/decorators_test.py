@@ -1,8 +1,10 @@
+import asyncio
+from hashlib import blake2b
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from app.services.cache.decorators import cache_result
+from app.services.cache.decorators import _inflight, cache_result
 
 
 class TestCacheResultDecorator:
@@ -107,3 +109,108 @@ class TestCacheResultDecorator:
             call_args_1 = mock_cache_manager.get.call_args_list[0][0][0]
             call_args_2 = mock_cache_manager.get.call_args_list[1][0][0]
             assert call_args_1 != call_args_2
+
+    @pytest.mark.anyio
+    async def test_cache_result_key_is_stable(self):
+        """Test the same call maps to a process-independent key."""
+        mock_cache_manager = AsyncMock()
+        mock_cache_manager.get = AsyncMock(return_value=None)
+        mock_cache_manager.set = AsyncMock()
+
+        with patch("app.services.cache.cache_manager", mock_cache_manager):
+
+            @cache_result(key_prefix="calc")
+            async def test_function(x: int, y: int = 0) -> int:
+                return x + y
+
+            await test_function(1, y=2)
+
+            digest = blake2b(b"(1,)[('y', 2)]", digest_size=16).hexdigest()
+            expected_key = f"calc:{__name__}.{test_function.__qualname__}:{digest}"
+            mock_cache_manager.get.assert_called_once_with(expected_key)
+
+    @pytest.mark.anyio
+    async def test_cache_result_key_skips_bound_self(self):
+        """Test instances of a class share keys for a decorated method."""
+        mock_cache_manager = AsyncMock()
+        mock_cache_manager.get = AsyncMock(return_value=None)
+        mock_cache_manager.set = AsyncMock()
+
+        with patch("app.services.cache.cache_manager", mock_cache_manager):
+
+            class Service:
+                @cache_result(key_prefix="svc")
+                async def lookup(self, x: int) -> int:
+                    return x
+
+            await Service().lookup(1)
+            await Service().lookup(1)
+
+            first, second = (c.args[0] for c in mock_cache_manager.get.call_args_list)
+            assert first == second
+            assert "0x" not in first
+
+    @pytest.mark.anyio
+    async def test_cache_result_key_builder(self):
+        """Test key_builder replaces the digest of the arguments."""
+        mock_cache_manager = AsyncMock()
+        mock_cache_manager.get = AsyncMock(return_value=None)
+        mock_cache_manager.set = AsyncMock()
+
+        with patch("app.services.cache.cache_manager", mock_cache_manager):
+
+            @cache_result(key_prefix="user", key_builder=lambda session, user_id: str(user_id))
+            async def test_function(session: object, user_id: int) -> int:
+                return user_id
+
+            await test_function(object(), 42)
+
+            expected_key = f"user:{__name__}.{test_function.__qualname__}:42"
+            mock_cache_manager.get.assert_called_once_with(expected_key)
+
+    @pytest.mark.anyio
+    async def test_cache_result_concurrent_misses_compute_once(self):
+        """Test concurrent misses for the same key share one computation."""
+        mock_cache_manager = AsyncMock()
+        mock_cache_manager.get = AsyncMock(return_value=None)
+        mock_cache_manager.set = AsyncMock()
+        calls = 0
+        release = asyncio.Event()
+
+        with patch("app.services.cache.cache_manager", mock_cache_manager):
+
+            @cache_result(key_prefix="slow")
+            async def test_function(value: int) -> int:
+                nonlocal calls
+                calls += 1
+                await release.wait()
+                return value * 2
+
+            pending = [asyncio.create_task(test_function(4)) for _ in range(5)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*pending)
+
+            assert results == [8] * 5
+            assert calls == 1
+            mock_cache_manager.set.assert_called_once()
+            assert _inflight == {}
+
+    @pytest.mark.anyio
+    async def test_cache_result_error_propagates_and_clears(self):
+        """Test a failed computation reaches callers and is not reused."""
+        mock_cache_manager = AsyncMock()
+        mock_cache_manager.get = AsyncMock(return_value=None)
+        mock_cache_manager.set = AsyncMock()
+
+        with patch("app.services.cache.cache_manager", mock_cache_manager):
+
+            @cache_result(key_prefix="fail")
+            async def test_function() -> int:
+                raise RuntimeError("boom")
+
+            with pytest.raises(RuntimeError, match="boom"):
+                await test_function()
+
+            mock_cache_manager.set.assert_not_called()
+            assert _inflight == {}
@@ -1,9 +1,16 @@
 import pickle
-from unittest.mock import AsyncMock
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
 
+import msgpack
 import pytest
 
-from app.services.cache.manager import CacheManager
+from app.services.cache.manager import CacheManager, _deserialize, _serialize
+
+
+async def _async_iter(items):
+    for item in items:
+        yield item
 
 
 class TestCacheManager:
@@ -13,7 +20,7 @@ class TestCacheManager:
     async def test_get_success(self, mock_redis_client: AsyncMock):
         """Test successful get operation."""
         cached_value = {"test": "data"}
-        mock_redis_client.get = AsyncMock(return_value=pickle.dumps(cached_value))
+        mock_redis_client.get = AsyncMock(return_value=_serialize(cached_value))
 
         cache_manager = CacheManager()
         cache_manager.redis_client = mock_redis_client  # type: ignore
@@ -23,6 +30,19 @@ class TestCacheManager:
         assert result == cached_value
         mock_redis_client.get.assert_called_once_with("test_key")
 
+    @pytest.mark.anyio
+    async def test_get_legacy_pickle(self, mock_redis_client: AsyncMock):
+        """Test get still decodes untagged pickle blobs written before msgpack."""
+        cached_value = {"test": "data"}
+        mock_redis_client.get = AsyncMock(return_value=pickle.dumps(cached_value))
+
+        cache_manager = CacheManager()
+        cache_manager.redis_client = mock_redis_client
+
+        result = await cache_manager.get("test_key")
+
+        assert result == cached_value
+
     @pytest.mark.anyio
     async def test_get_not_found(self, mock_redis_client: AsyncMock):
         """Test get when key not found."""
@@ -68,7 +88,9 @@ class TestCacheManager:
         result = await cache_manager.set("test_key", {"data": "value"}, expire=60)
 
         assert result is True
-        mock_redis_client.set.assert_called_once()
+        mock_redis_client.set.assert_called_once_with(
+            "test_key", b"\x01" + msgpack.packb({"data": "value"}), ex=60
+        )
 
     @pytest.mark.anyio
     async def test_set_with_default_expire(self, mock_redis_client: AsyncMock):
@@ -154,8 +176,8 @@ class TestCacheManager:
     @pytest.mark.anyio
     async def test_delete_pattern_success(self, mock_redis_client: AsyncMock):
         """Test successful delete_pattern operation."""
-        mock_redis_client.keys = AsyncMock(return_value=[b"key1", b"key2"])
-        mock_redis_client.delete = AsyncMock(return_value=2)
+        mock_redis_client.scan_iter = Mock(return_value=_async_iter([b"key1", b"key2"]))
+        mock_redis_client.unlink = AsyncMock(return_value=2)
 
         cache_manager = CacheManager()
         cache_manager.redis_client = mock_redis_client
@@ -163,13 +185,30 @@ class TestCacheManager:
         result = await cache_manager.delete_pattern("test_*")
 
         assert result == 2
-        mock_redis_client.keys.assert_called_once_with("test_*")
-        mock_redis_client.delete.assert_called_once()
+        mock_redis_client.scan_iter.assert_called_once_with(match="test_*", count=500)
+        mock_redis_client.unlink.assert_called_once_with(b"key1", b"key2")
+        mock_redis_client.keys.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_delete_pattern_unlinks_in_batches(self, mock_redis_client: AsyncMock):
+        """Test delete_pattern removes large match sets in bounded batches."""
+        keys = [f"key{i}".encode() for i in range(1001)]
+        mock_redis_client.scan_iter = Mock(return_value=_async_iter(keys))
+        mock_redis_client.unlink = AsyncMock(side_effect=lambda *batch: len(batch))
+
+        cache_manager = CacheManager()
+        cache_manager.redis_client = mock_redis_client
+
+        result = await cache_manager.delete_pattern("key*")
+
+        assert result == 1001
+        batch_sizes = [len(c.args) for c in mock_redis_client.unlink.call_args_list]
+        assert batch_sizes == [500, 500, 1]
 
     @pytest.mark.anyio
     async def test_delete_pattern_no_matches(self, mock_redis_client: AsyncMock):
         """Test delete_pattern with no matching keys."""
-        mock_redis_client.keys = AsyncMock(return_value=[])
+        mock_redis_client.scan_iter = Mock(return_value=_async_iter([]))
 
         cache_manager = CacheManager()
         cache_manager.redis_client = mock_redis_client
@@ -177,6 +216,7 @@ class TestCacheManager:
         result = await cache_manager.delete_pattern("test_*")
 
         assert result == 0
+        mock_redis_client.unlink.assert_not_called()
 
     @pytest.mark.anyio
     async def test_delete_pattern_no_redis_client(self):
@@ -191,7 +231,7 @@ class TestCacheManager:
     @pytest.mark.anyio
     async def test_delete_pattern_with_exception(self, mock_redis_client: AsyncMock):
         """Test delete_pattern with exception."""
-        mock_redis_client.keys = AsyncMock(side_effect=Exception("Redis error"))
+        mock_redis_client.scan_iter = Mock(side_effect=Exception("Redis error"))
 
         cache_manager = CacheManager()
         cache_manager.redis_client = mock_redis_client
@@ -246,3 +286,177 @@ class TestCacheManager:
         result = await cache_manager.exists("test_key")
 
         assert result is False
+
+
+class TestCacheManagerBatch:
+    """Test CacheManager multi-key operations."""
+
+    @pytest.mark.anyio
+    async def test_mget_success(self, mock_redis_client: AsyncMock):
+        """Test mget decodes hits and keeps misses as None in key order."""
+        mock_redis_client.mget = AsyncMock(
+            return_value=[_serialize({"a": 1}), None, _serialize("text")]
+        )
+
+        cache_manager = CacheManager()
+        cache_manager.redis_client = mock_redis_client
+
+        result = await cache_manager.mget(["k1", "k2", "k3"])
+
+        assert result == [{"a": 1}, None, "text"]
+        mock_redis_client.mget.assert_called_once_with(["k1", "k2", "k3"])
+
+    @pytest.mark.anyio
+    async def test_mget_empty_keys(self, mock_redis_client: AsyncMock):
+        """Test mget with no keys skips Redis."""
+        cache_manager = CacheManager()
+        cache_manager.redis_client = mock_redis_client
+
+        assert await cache_manager.mget([]) == []
+        mock_redis_client.mget.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_mget_no_redis_client(self):
+        """Test mget when Redis client not initialized."""
+        cache_manager = CacheManager()
+        cache_manager.redis_client = None
+
+        assert await cache_manager.mget(["k1", "k2"]) == [None, None]
+
+    @pytest.mark.anyio
+    async def test_mget_with_exception(self, mock_redis_client: AsyncMock):
+        """Test mget with exception."""
+        mock_redis_client.mget = AsyncMock(side_effect=Exception("Redis error"))
+
+        cache_manager = CacheManager()
+        cache_manager.redis_client = mock_redis_client
+
+        assert await cache_manager.mget(["k1", "k2"]) == [None, None]
+
+    @pytest.mark.anyio
+    async def test_mset_success(self, mock_redis_client: AsyncMock):
+        """Test mset writes every key with expiration in one pipeline."""
+        mock_pipeline = Mock()
+        mock_pipeline.execute = AsyncMock(return_value=[True, True])
+        mock_redis_client.pipeline = Mock(return_value=mock_pipeline)
+
+        cache_manager = CacheManager()
+        cache_manager.redis_client = mock_redis_client
+
+        result = await cache_manager.mset({"k1": {"a": 1}, "k2": "text"}, expire=60)
+
+        assert result is True
+        mock_redis_client.pipeline.assert_called_once_with(transaction=False)
+        assert [c.args for c in mock_pipeline.set.call_args_list] == [
+            ("k1", _serialize({"a": 1})),
+            ("k2", _serialize("text")),
+        ]
+        assert all(c.kwargs == {"ex": 60} for c in mock_pipeline.set.call_args_list)
+        mock_pipeline.execute.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_mset_empty_mapping(self, mock_redis_client: AsyncMock):
+        """Test mset with nothing to write skips Redis."""
+        cache_manager = CacheManager()
+        cache_manager.redis_client = mock_redis_client
+
+        assert await cache_manager.mset({}) is True
+        mock_redis_client.pipeline.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_mset_no_redis_client(self):
+        """Test mset when Redis client not initialized."""
+        cache_manager = CacheManager()
+        cache_manager.redis_client = None
+
+        assert await cache_manager.mset({"k1": "v"}) is False
+
+    @pytest.mark.anyio
+    async def test_mset_with_exception(self, mock_redis_client: AsyncMock):
+        """Test mset with exception."""
+        mock_pipeline = Mock()
+        mock_pipeline.execute = AsyncMock(side_effect=Exception("Redis error"))
+        mock_redis_client.pipeline = Mock(return_value=mock_pipeline)
+
+        cache_manager = CacheManager()
+        cache_manager.redis_client = mock_redis_client
+
+        assert await cache_manager.mset({"k1": "v"}) is False
+
+    @pytest.mark.anyio
+    async def test_mdelete_success(self, mock_redis_client: AsyncMock):
+        """Test mdelete removes every key in one call."""
+        mock_redis_client.delete = AsyncMock(return_value=2)
+
+        cache_manager = CacheManager()
+        cache_manager.redis_client = mock_redis_client
+
+        result = await cache_manager.mdelete(["k1", "k2", "k3"])
+
+        assert result == 2
+        mock_redis_client.delete.assert_called_once_with("k1", "k2", "k3")
+
+    @pytest.mark.anyio
+    async def test_mdelete_empty_keys(self, mock_redis_client: AsyncMock):
+        """Test mdelete with no keys skips Redis."""
+        cache_manager = CacheManager()
+        cache_manager.redis_client = mock_redis_client
+
+        assert await cache_manager.mdelete([]) == 0
+        mock_redis_client.delete.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_mdelete_with_exception(self, mock_redis_client: AsyncMock):
+        """Test mdelete with exception."""
+        mock_redis_client.delete = AsyncMock(side_effect=Exception("Redis error"))
+
+        cache_manager = CacheManager()
+        cache_manager.redis_client = mock_redis_client
+
+        assert await cache_manager.mdelete(["k1"]) == 0
+
+
+class TestCacheSerialization:
+    """Test the tagged cache payload encoding."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "text",
+            "",
+            b"\x80raw",
+            42,
+            None,
+            {"nested": [1, 2.5, {"flag": True}], 3: b"bytes"},
+            ["a", "b"],
+        ],
+    )
+    def test_round_trip(self, value):
+        """Test values survive a serialize/deserialize round trip."""
+        assert _deserialize(_serialize(value)) == value
+
+    def test_str_and_bytes_stored_raw(self):
+        """Test str and bytes skip serialization."""
+        assert _serialize("text") == b"\x03text"
+        assert _serialize(b"data") == b"\x02data"
+
+    def test_plain_data_uses_msgpack(self):
+        """Test dicts and lists are encoded with msgpack."""
+        assert _serialize({"a": [1, 2]}) == b"\x01" + msgpack.packb({"a": [1, 2]})
+
+    @pytest.mark.parametrize(
+        "value",
+        [(1, 2), {1, 2}, datetime(2024, 1, 1), {"items": (1, 2)}],
+    )
+    def test_non_msgpack_types_fall_back_to_pickle(self, value):
+        """Test types msgpack would not round-trip exactly are pickled."""
+        payload = _serialize(value)
+
+        assert payload[:1] == b"\x00"
+        assert _deserialize(payload) == value
+        assert type(_deserialize(payload)) is type(value)
+
+    def test_unknown_tag_raises(self):
+        """Test an unknown format tag is rejected."""
+        with pytest.raises(ValueError, match="Unknown cache payload tag"):
+            _deserialize(b"\x7fgarbage")
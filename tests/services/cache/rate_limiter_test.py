@@ -1,6 +1,8 @@
+import hashlib
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from redis.exceptions import NoScriptError
 
 from app.core.exceptions.rate_limiter import RateLimitConfigurationError
 from app.services.cache.rate_limiter import RateLimiter
@@ -112,15 +114,7 @@ class TestRateLimiterOperations:
     async def test_check_rate_limit_allowed(self, mock_redis_client: AsyncMock):
         """Test check_rate_limit when request is allowed."""
         with patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True):
-            # Mock pipeline operations
-            mock_pipeline = AsyncMock()
-            mock_pipeline.zremrangebyscore = Mock(return_value=mock_pipeline)
-            mock_pipeline.zadd = Mock(return_value=mock_pipeline)
-            mock_pipeline.zcard = Mock(return_value=mock_pipeline)
-            mock_pipeline.expire = Mock(return_value=mock_pipeline)
-            mock_pipeline.execute = AsyncMock(return_value=[0, 1, 3, True])  # 3 requests in window
-
-            mock_redis_client.pipeline = Mock(return_value=mock_pipeline)
+            mock_redis_client.evalsha = AsyncMock(return_value=3)  # 3 requests in window
 
             rate_limiter = RateLimiter()
             rate_limiter.redis_client = mock_redis_client
@@ -136,16 +130,7 @@ class TestRateLimiterOperations:
     async def test_check_rate_limit_exceeded(self, mock_redis_client: AsyncMock):
         """Test check_rate_limit when limit is exceeded."""
         with patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True):
-            mock_pipeline = AsyncMock()
-            mock_pipeline.zremrangebyscore = Mock(return_value=mock_pipeline)
-            mock_pipeline.zadd = Mock(return_value=mock_pipeline)
-            mock_pipeline.zcard = Mock(return_value=mock_pipeline)
-            mock_pipeline.expire = Mock(return_value=mock_pipeline)
-            mock_pipeline.execute = AsyncMock(
-                return_value=[0, 1, 11, True]
-            )  # 11 requests, limit is 10
-
-            mock_redis_client.pipeline = Mock(return_value=mock_pipeline)
+            mock_redis_client.evalsha = AsyncMock(return_value=11)  # 11 requests, limit is 10
 
             rate_limiter = RateLimiter()
             rate_limiter.redis_client = mock_redis_client
@@ -159,14 +144,7 @@ class TestRateLimiterOperations:
     async def test_check_rate_limit_at_boundary(self, mock_redis_client: AsyncMock):
         """Test check_rate_limit at exact limit boundary."""
         with patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True):
-            mock_pipeline = AsyncMock()
-            mock_pipeline.zremrangebyscore = Mock(return_value=mock_pipeline)
-            mock_pipeline.zadd = Mock(return_value=mock_pipeline)
-            mock_pipeline.zcard = Mock(return_value=mock_pipeline)
-            mock_pipeline.expire = Mock(return_value=mock_pipeline)
-            mock_pipeline.execute = AsyncMock(return_value=[0, 1, 10, True])  # Exactly at limit
-
-            mock_redis_client.pipeline = Mock(return_value=mock_pipeline)
+            mock_redis_client.evalsha = AsyncMock(return_value=10)  # Exactly at limit
 
             rate_limiter = RateLimiter()
             rate_limiter.redis_client = mock_redis_client
@@ -180,7 +158,7 @@ class TestRateLimiterOperations:
     async def test_check_rate_limit_with_exception(self, mock_redis_client: AsyncMock):
         """Test check_rate_limit handles exceptions gracefully."""
         with patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True):
-            mock_redis_client.pipeline = Mock(side_effect=Exception("Redis error"))
+            mock_redis_client.evalsha = AsyncMock(side_effect=Exception("Redis error"))
 
             rate_limiter = RateLimiter()
             rate_limiter.redis_client = mock_redis_client
@@ -291,16 +269,9 @@ class TestRateLimiterSlidingWindow:
 
     @pytest.mark.anyio
     async def test_sliding_window_removes_old_requests(self, mock_redis_client: AsyncMock):
-        """Test that sliding window removes old requests."""
+        """Test that sliding window trims entries older than the window."""
         with patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True):
-            mock_pipeline = AsyncMock()
-            mock_pipeline.zremrangebyscore = Mock(return_value=mock_pipeline)
-            mock_pipeline.zadd = Mock(return_value=mock_pipeline)
-            mock_pipeline.zcard = Mock(return_value=mock_pipeline)
-            mock_pipeline.expire = Mock(return_value=mock_pipeline)
-            mock_pipeline.execute = AsyncMock(return_value=[5, 1, 3, True])  # Removed 5 old entries
-
-            mock_redis_client.pipeline = Mock(return_value=mock_pipeline)
+            mock_redis_client.evalsha = AsyncMock(return_value=3)
 
             rate_limiter = RateLimiter()
             rate_limiter.redis_client = mock_redis_client
@@ -308,63 +279,95 @@ class TestRateLimiterSlidingWindow:
             is_allowed, info = await rate_limiter.check_rate_limit("test_key", limit=10, window=60)
 
             assert is_allowed is True
-            # Verify zremrangebyscore was called (removes old entries)
-            mock_pipeline.zremrangebyscore.assert_called_once()
+            # Verify the trim cutoff is exactly one window before the current request
+            _, _, _, window_start, now, _, _ = mock_redis_client.evalsha.call_args.args
+            assert now - window_start == 60 * 1000000
 
     @pytest.mark.anyio
     async def test_sliding_window_adds_current_request(self, mock_redis_client: AsyncMock):
         """Test that sliding window adds current request."""
         with patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True):
-            mock_pipeline = AsyncMock()
-            mock_pipeline.zremrangebyscore = Mock(return_value=mock_pipeline)
-            mock_pipeline.zadd = Mock(return_value=mock_pipeline)
-            mock_pipeline.zcard = Mock(return_value=mock_pipeline)
-            mock_pipeline.expire = Mock(return_value=mock_pipeline)
-            mock_pipeline.execute = AsyncMock(return_value=[0, 1, 5, True])
+            mock_redis_client.evalsha = AsyncMock(return_value=5)
 
-            mock_redis_client.pipeline = Mock(return_value=mock_pipeline)
+            rate_limiter = RateLimiter()
+            rate_limiter.redis_client = mock_redis_client
+
+            await rate_limiter.check_rate_limit("test_key", limit=10, window=60)
+
+            # Verify a single script call records the request under the rate limit key
+            mock_redis_client.evalsha.assert_called_once()
+            sha, num_keys, key, _, now, member, _ = mock_redis_client.evalsha.call_args.args
+            assert sha == RateLimiter._SLIDING_WINDOW_SHA
+            assert (num_keys, key) == (1, "test_key")
+            assert member.startswith(f"{now}:")
+
+    @pytest.mark.anyio
+    async def test_sliding_window_members_unique_within_same_microsecond(
+        self, mock_redis_client: AsyncMock
+    ):
+        """Test that requests sharing a timestamp still get distinct members."""
+        with (
+            patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True),
+            patch(
+                "app.services.cache.rate_limiter.time.time_ns",
+                return_value=1_700_000_000_000_000_000,
+            ),
+        ):
+            mock_redis_client.evalsha = AsyncMock(return_value=1)
 
             rate_limiter = RateLimiter()
             rate_limiter.redis_client = mock_redis_client
 
+            await rate_limiter.check_rate_limit("test_key", limit=10, window=60)
             await rate_limiter.check_rate_limit("test_key", limit=10, window=60)
 
-            # Verify zadd was called (adds current request)
-            mock_pipeline.zadd.assert_called_once()
+            first, second = (c.args[5] for c in mock_redis_client.evalsha.call_args_list)
+            assert first != second
+            assert first.split(":")[0] == second.split(":")[0]
 
     @pytest.mark.anyio
     async def test_sliding_window_sets_expiration(self, mock_redis_client: AsyncMock):
         """Test that sliding window sets key expiration."""
         with patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True):
-            mock_pipeline = AsyncMock()
-            mock_pipeline.zremrangebyscore = Mock(return_value=mock_pipeline)
-            mock_pipeline.zadd = Mock(return_value=mock_pipeline)
-            mock_pipeline.zcard = Mock(return_value=mock_pipeline)
-            mock_pipeline.expire = Mock(return_value=mock_pipeline)
-            mock_pipeline.execute = AsyncMock(return_value=[0, 1, 5, True])
-
-            mock_redis_client.pipeline = Mock(return_value=mock_pipeline)
+            mock_redis_client.evalsha = AsyncMock(return_value=5)
 
             rate_limiter = RateLimiter()
             rate_limiter.redis_client = mock_redis_client
 
             await rate_limiter.check_rate_limit("test_key", limit=10, window=60)
 
-            # Verify expire was called
-            mock_pipeline.expire.assert_called_once()
+            # Verify the window is passed as the key expiration
+            assert mock_redis_client.evalsha.call_args.args[-1] == 60
+
+    @pytest.mark.anyio
+    async def test_sliding_window_reloads_missing_script(self, mock_redis_client: AsyncMock):
+        """Test that a NOSCRIPT reply falls back to EVAL with the script source."""
+        with patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True):
+            mock_redis_client.evalsha = AsyncMock(side_effect=NoScriptError("NOSCRIPT"))
+            mock_redis_client.eval = AsyncMock(return_value=4)
+
+            rate_limiter = RateLimiter()
+            rate_limiter.redis_client = mock_redis_client
+
+            is_allowed, info = await rate_limiter.check_rate_limit("test_key", limit=10, window=60)
+
+            assert is_allowed is True
+            assert info["remaining"] == 6
+            script, num_keys, key, *_ = mock_redis_client.eval.call_args.args
+            assert script == RateLimiter._SLIDING_WINDOW_SCRIPT
+            assert (num_keys, key) == (1, "test_key")
+
+    def test_sliding_window_sha_matches_script(self):
+        """Test the cached SHA is the SHA1 Redis assigns to the script."""
+        expected = hashlib.sha1(RateLimiter._SLIDING_WINDOW_SCRIPT.encode()).hexdigest()
+
+        assert RateLimiter._SLIDING_WINDOW_SHA == expected
 
     @pytest.mark.anyio
     async def test_sliding_window_custom_window(self, mock_redis_client: AsyncMock):
         """Test sliding window with custom window size."""
         with patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True):
-            mock_pipeline = AsyncMock()
-            mock_pipeline.zremrangebyscore = Mock(return_value=mock_pipeline)
-            mock_pipeline.zadd = Mock(return_value=mock_pipeline)
-            mock_pipeline.zcard = Mock(return_value=mock_pipeline)
-            mock_pipeline.expire = Mock(return_value=mock_pipeline)
-            mock_pipeline.execute = AsyncMock(return_value=[0, 1, 5, True])
-
-            mock_redis_client.pipeline = Mock(return_value=mock_pipeline)
+            mock_redis_client.evalsha = AsyncMock(return_value=5)
 
             rate_limiter = RateLimiter()
             rate_limiter.redis_client = mock_redis_client
@@ -376,3 +379,171 @@ class TestRateLimiterSlidingWindow:
             assert is_allowed is True
             assert info["window"] == 120
             assert info["limit"] == 100
+
+    @pytest.mark.anyio
+    async def test_sliding_window_reset_time_in_seconds(self, mock_redis_client: AsyncMock):
+        """Test that reset_time is a Unix timestamp in seconds, not microseconds."""
+        with (
+            patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True),
+            patch(
+                "app.services.cache.rate_limiter.time.time_ns",
+                return_value=1_700_000_000_250_000_000,
+            ),
+        ):
+            mock_redis_client.evalsha = AsyncMock(return_value=1)
+
+            rate_limiter = RateLimiter()
+            rate_limiter.redis_client = mock_redis_client
+
+            _, info = await rate_limiter.check_rate_limit("test_key", limit=10, window=60)
+
+            assert info["reset_time"] == 1_700_000_060
+            _, _, _, window_start, now, _, _ = mock_redis_client.evalsha.call_args.args
+            assert now == 1_700_000_000_250_000
+            assert window_start == 1_699_999_940_250_000
+
+    @pytest.mark.anyio
+    async def test_get_limit_info_trims_in_microseconds(self, mock_redis_client: AsyncMock):
+        """Test that get_limit_info trims with the same microsecond scores it counts."""
+        with (
+            patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True),
+            patch(
+                "app.services.cache.rate_limiter.time.time_ns",
+                return_value=1_700_000_000_000_000_000,
+            ),
+        ):
+            mock_pipeline = Mock()
+            mock_pipeline.execute = AsyncMock(return_value=[0, 2])
+            mock_redis_client.pipeline = Mock(return_value=mock_pipeline)
+
+            rate_limiter = RateLimiter()
+            rate_limiter.redis_client = mock_redis_client
+
+            info = await rate_limiter.get_limit_info("test_key", limit=10, window=60)
+
+            mock_pipeline.zremrangebyscore.assert_called_once_with(
+                "test_key", 0, 1_699_999_940_000_000
+            )
+            assert info["remaining"] == 8
+            assert info["reset_time"] == 1_700_000_060
+
+
+class TestRateLimiterFixedWindow:
+    """Test RateLimiter fixed window algorithm."""
+
+    @staticmethod
+    def _mock_pipeline(mock_redis_client: AsyncMock, count: int) -> Mock:
+        pipe = Mock()
+        pipe.execute = AsyncMock(return_value=[True, count])
+        mock_redis_client.pipeline = Mock(return_value=pipe)
+        return pipe
+
+    @pytest.mark.anyio
+    async def test_fixed_window_counts_in_current_bucket(self, mock_redis_client: AsyncMock):
+        """Test that fixed window increments the counter of the current bucket."""
+        with (
+            patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True),
+            patch("app.services.cache.rate_limiter.time.time", return_value=1700000030.5),
+        ):
+            pipe = self._mock_pipeline(mock_redis_client, count=3)
+
+            rate_limiter = RateLimiter()
+            rate_limiter.redis_client = mock_redis_client
+
+            is_allowed, info = await rate_limiter.check_rate_limit(
+                "test_key", limit=10, window=60, algorithm="fixed"
+            )
+
+            bucket = 1700000030 // 60
+            assert is_allowed is True
+            assert info["remaining"] == 7
+            assert info["reset_time"] == (bucket + 1) * 60
+            pipe.set.assert_called_once_with(f"test_key:{bucket}", 0, ex=60, nx=True)
+            pipe.incr.assert_called_once_with(f"test_key:{bucket}")
+            mock_redis_client.evalsha.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_fixed_window_exceeded(self, mock_redis_client: AsyncMock):
+        """Test that fixed window rejects requests over the limit."""
+        with patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True):
+            self._mock_pipeline(mock_redis_client, count=11)
+
+            rate_limiter = RateLimiter()
+            rate_limiter.redis_client = mock_redis_client
+
+            is_allowed, info = await rate_limiter.check_rate_limit(
+                "test_key", limit=10, window=60, algorithm="fixed"
+            )
+
+            assert is_allowed is False
+            assert info["remaining"] == 0
+
+    @pytest.mark.anyio
+    async def test_fixed_window_with_exception(self, mock_redis_client: AsyncMock):
+        """Test that fixed window fails open on Redis errors."""
+        with patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True):
+            pipe = self._mock_pipeline(mock_redis_client, count=1)
+            pipe.execute = AsyncMock(side_effect=Exception("Redis error"))
+
+            rate_limiter = RateLimiter()
+            rate_limiter.redis_client = mock_redis_client
+
+            is_allowed, info = await rate_limiter.check_rate_limit(
+                "test_key", limit=10, window=60, algorithm="fixed"
+            )
+
+            assert is_allowed is True
+            assert info["remaining"] == 10
+
+    @pytest.mark.anyio
+    async def test_fixed_window_get_limit_info(self, mock_redis_client: AsyncMock):
+        """Test that get_limit_info reads the counter of the current bucket."""
+        with (
+            patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True),
+            patch("app.services.cache.rate_limiter.time.time", return_value=1700000030.5),
+        ):
+            mock_redis_client.get = AsyncMock(return_value=b"4")
+
+            rate_limiter = RateLimiter()
+            rate_limiter.redis_client = mock_redis_client
+
+            info = await rate_limiter.get_limit_info(
+                "test_key", limit=10, window=60, algorithm="fixed"
+            )
+
+            bucket = 1700000030 // 60
+            mock_redis_client.get.assert_called_once_with(f"test_key:{bucket}")
+            assert info["remaining"] == 6
+            assert info["reset_time"] == (bucket + 1) * 60
+
+    @pytest.mark.anyio
+    async def test_fixed_window_get_limit_info_no_counter(self, mock_redis_client: AsyncMock):
+        """Test that get_limit_info reports the full limit before the first request."""
+        with patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True):
+            mock_redis_client.get = AsyncMock(return_value=None)
+
+            rate_limiter = RateLimiter()
+            rate_limiter.redis_client = mock_redis_client
+
+            info = await rate_limiter.get_limit_info(
+                "test_key", limit=10, window=60, algorithm="fixed"
+            )
+
+            assert info["remaining"] == 10
+
+    @pytest.mark.anyio
+    async def test_fixed_window_reset_limit(self, mock_redis_client: AsyncMock):
+        """Test that reset_limit deletes the counter of the current bucket."""
+        with (
+            patch("app.services.cache.rate_limiter.settings.rate_limit_enabled", True),
+            patch("app.services.cache.rate_limiter.time.time", return_value=1700000030.5),
+        ):
+            mock_redis_client.delete = AsyncMock(return_value=1)
+
+            rate_limiter = RateLimiter()
+            rate_limiter.redis_client = mock_redis_client
+
+            result = await rate_limiter.reset_limit("test_key", window=60, algorithm="fixed")
+
+            assert result is True
+            mock_redis_client.delete.assert_called_once_with(f"test_key:{1700000030 // 60}")
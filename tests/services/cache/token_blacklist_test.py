@@ -1,4 +1,6 @@
-from unittest.mock import AsyncMock, patch
+import asyncio
+from hashlib import blake2b
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -6,6 +8,10 @@ from app.core.config import Environment
 from app.services.cache.token_blacklist import TokenBlacklist
 
 
+def _hashed_key(jti: str) -> bytes:
+    return b"tb:" + blake2b(jti.encode(), digest_size=16).digest()
+
+
 class TestTokenBlacklistRevokeToken:
     """Tests for revoking tokens."""
 
@@ -14,7 +20,24 @@ class TestTokenBlacklistRevokeToken:
         """Test successfully revoking a token."""
         blacklist = TokenBlacklist()
         blacklist.redis_client = mock_redis_client
-        mock_redis_client.setex = AsyncMock(return_value=True)
+        mock_redis_client.set = AsyncMock(return_value=True)
+
+        with patch("app.services.cache.token_blacklist.settings") as mock_settings:
+            mock_settings.current_environment = Environment.DEV
+
+            result = await blacklist.revoke_token("test-jti-123", 3600)
+
+            assert result is True
+            mock_redis_client.set.assert_called_once_with(_hashed_key("test-jti-123"), b"", ex=3600)
+            mock_redis_client.publish.assert_called_once_with("token:revoked", "test-jti-123")
+
+    @pytest.mark.anyio
+    async def test_revoke_token_publish_failure(self, mock_redis_client: AsyncMock):
+        """Test a failed revocation broadcast does not fail the revocation."""
+        blacklist = TokenBlacklist()
+        blacklist.redis_client = mock_redis_client
+        mock_redis_client.set = AsyncMock(return_value=True)
+        mock_redis_client.publish = AsyncMock(side_effect=Exception("Redis error"))
 
         with patch("app.services.cache.token_blacklist.settings") as mock_settings:
             mock_settings.current_environment = Environment.DEV
@@ -22,9 +45,6 @@ class TestTokenBlacklistRevokeToken:
             result = await blacklist.revoke_token("test-jti-123", 3600)
 
             assert result is True
-            mock_redis_client.setex.assert_called_once_with(
-                "token:blacklist:test-jti-123", 3600, "revoked"
-            )
 
     @pytest.mark.anyio
     async def test_revoke_token_local_environment(self):
@@ -56,7 +76,7 @@ class TestTokenBlacklistRevokeToken:
         """Test revoke_token handles Redis exceptions."""
         blacklist = TokenBlacklist()
         blacklist.redis_client = mock_redis_client
-        mock_redis_client.setex = AsyncMock(side_effect=Exception("Redis connection error"))
+        mock_redis_client.set = AsyncMock(side_effect=Exception("Redis connection error"))
 
         with patch("app.services.cache.token_blacklist.settings") as mock_settings:
             mock_settings.current_environment = Environment.DEV
@@ -82,7 +102,9 @@ class TestTokenBlacklistIsRevoked:
             result = await blacklist.is_revoked("revoked-jti")
 
             assert result is True
-            mock_redis_client.exists.assert_called_once_with("token:blacklist:revoked-jti")
+            mock_redis_client.exists.assert_called_once_with(
+                _hashed_key("revoked-jti"), "token:blacklist:revoked-jti"
+            )
 
     @pytest.mark.anyio
     async def test_is_revoked_false(self, mock_redis_client: AsyncMock):
@@ -140,6 +162,174 @@ class TestTokenBlacklistIsRevoked:
             assert result is False
 
 
+class TestTokenBlacklistRevocationCache:
+    """Tests for the in-process revocation cache."""
+
+    @pytest.mark.anyio
+    async def test_not_revoked_result_cached(self, mock_redis_client: AsyncMock):
+        """Test repeated checks of a valid token hit Redis once."""
+        blacklist = TokenBlacklist()
+        blacklist.redis_client = mock_redis_client
+        mock_redis_client.exists = AsyncMock(return_value=0)
+
+        with patch("app.services.cache.token_blacklist.settings") as mock_settings:
+            mock_settings.current_environment = Environment.DEV
+
+            assert await blacklist.is_revoked("valid-jti") is False
+            assert await blacklist.is_revoked("valid-jti") is False
+
+            mock_redis_client.exists.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_not_revoked_result_expires(self, mock_redis_client: AsyncMock):
+        """Test a cached valid result is rechecked after the TTL."""
+        blacklist = TokenBlacklist()
+        blacklist.redis_client = mock_redis_client
+        mock_redis_client.exists = AsyncMock(side_effect=[0, 1])
+
+        with (
+            patch("app.services.cache.token_blacklist.settings") as mock_settings,
+            patch("app.services.cache.token_blacklist.time.monotonic") as mock_monotonic,
+        ):
+            mock_settings.current_environment = Environment.DEV
+            mock_monotonic.return_value = 100.0
+            assert await blacklist.is_revoked("jti") is False
+
+            mock_monotonic.return_value = 100.0 + blacklist._jti_cache.ttl_seconds
+            assert await blacklist.is_revoked("jti") is True
+
+    @pytest.mark.anyio
+    async def test_revoke_token_overrides_cached_result(self, mock_redis_client: AsyncMock):
+        """Test revoking a token in this worker takes effect immediately."""
+        blacklist = TokenBlacklist()
+        blacklist.redis_client = mock_redis_client
+        mock_redis_client.exists = AsyncMock(return_value=0)
+        mock_redis_client.set = AsyncMock(return_value=True)
+
+        with patch("app.services.cache.token_blacklist.settings") as mock_settings:
+            mock_settings.current_environment = Environment.DEV
+
+            assert await blacklist.is_revoked("jti") is False
+            await blacklist.revoke_token("jti", 3600)
+
+            assert await blacklist.is_revoked("jti") is True
+            mock_redis_client.exists.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_redis_error_not_cached(self, mock_redis_client: AsyncMock):
+        """Test a failed lookup is retried rather than cached as valid."""
+        blacklist = TokenBlacklist()
+        blacklist.redis_client = mock_redis_client
+        mock_redis_client.exists = AsyncMock(side_effect=[Exception("Redis error"), 1])
+
+        with patch("app.services.cache.token_blacklist.settings") as mock_settings:
+            mock_settings.current_environment = Environment.DEV
+
+            assert await blacklist.is_revoked("jti") is False
+            assert await blacklist.is_revoked("jti") is True
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test the cache stays within its maximum size."""
+        blacklist = TokenBlacklist()
+        blacklist._jti_cache.max_size = 2
+
+        blacklist._cache_revocation("a", revoked=True)
+        blacklist._cache_revocation("b", revoked=True)
+        blacklist._get_cached_revocation("a")
+        blacklist._cache_revocation("c", revoked=True)
+
+        assert list(blacklist._jti_cache._entries) == ["a", "c"]
+
+    def test_zero_ttl_disables_cache(self):
+        """Test a TTL of zero caches nothing."""
+        blacklist = TokenBlacklist()
+        blacklist._jti_cache.ttl_seconds = 0
+
+        blacklist._cache_revocation("jti", revoked=False)
+
+        assert blacklist._get_cached_revocation("jti") is None
+
+
+class TestTokenBlacklistRevocationListener:
+    """Tests for the cross-worker revocation listener."""
+
+    @staticmethod
+    def _mock_pubsub(messages: list[dict]) -> MagicMock:
+        async def listen():
+            for message in messages:
+                yield message
+            await asyncio.Event().wait()
+
+        pubsub = MagicMock()
+        pubsub.__aenter__ = AsyncMock(return_value=pubsub)
+        pubsub.__aexit__ = AsyncMock(return_value=None)
+        pubsub.subscribe = AsyncMock()
+        pubsub.listen = listen
+        return pubsub
+
+    @pytest.mark.anyio
+    async def test_listener_marks_published_tokens_revoked(self, mock_redis_client: AsyncMock):
+        """Test a revocation published by another worker evicts the cached result."""
+        blacklist = TokenBlacklist()
+        blacklist.redis_client = mock_redis_client
+        blacklist._cache_revocation("jti", revoked=False)
+        pubsub = self._mock_pubsub(
+            [{"type": "message", "channel": b"token:revoked", "data": b"jti"}]
+        )
+        mock_redis_client.pubsub = MagicMock(return_value=pubsub)
+
+        with patch("app.services.cache.base.settings") as mock_settings:
+            mock_settings.current_environment = Environment.DEV
+
+            blacklist.start_revocation_listener()
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+            assert blacklist._get_cached_revocation("jti") is True
+            pubsub.subscribe.assert_called_once_with("token:revoked", "token:user_revoked")
+
+            await blacklist.close()
+
+        assert blacklist._listener_task is None
+        mock_redis_client.close.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_listener_drops_revoked_user_marker(self, mock_redis_client: AsyncMock):
+        """Test a revoke-all published by another worker drops the cached marker."""
+        blacklist = TokenBlacklist()
+        blacklist.redis_client = mock_redis_client
+        blacklist._user_revocation_cache.set("42", 0)
+        pubsub = self._mock_pubsub(
+            [{"type": "message", "channel": b"token:user_revoked", "data": b"42"}]
+        )
+        mock_redis_client.pubsub = MagicMock(return_value=pubsub)
+
+        with (
+            patch("app.services.cache.base.settings") as mock_settings,
+            patch("app.services.cache.token_blacklist.user_cache") as mock_user_cache,
+        ):
+            mock_settings.current_environment = Environment.DEV
+
+            blacklist.start_revocation_listener()
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+            assert blacklist._user_revocation_cache.get("42") is None
+            # The stale User row is dropped from this worker's user cache too
+            mock_user_cache.invalidate.assert_called_once_with("42")
+
+            await blacklist.close()
+
+    def test_listener_not_started_without_redis(self):
+        """Test the listener is skipped when Redis is unavailable."""
+        blacklist = TokenBlacklist()
+        blacklist._redis_client = None
+
+        blacklist.start_revocation_listener()
+
+        assert blacklist._listener_task is None
+
+
 class TestTokenBlacklistRevokeAllUserTokens:
     """Tests for revoking all tokens for a user."""
 
@@ -160,6 +350,24 @@ class TestTokenBlacklistRevokeAllUserTokens:
             call_args = mock_redis_client.setex.call_args
             assert call_args[0][0] == "token:revoke_all:user-123"
             assert call_args[0][1] == 7200
+            mock_redis_client.publish.assert_called_once_with("token:user_revoked", "user-123")
+            # This worker sees the new marker without another Redis read
+            assert blacklist._user_revocation_cache.get("user-123") == int(call_args[0][2])
+
+    @pytest.mark.anyio
+    async def test_revoke_all_user_tokens_invalidates_cached_user(self):
+        """Test revoking all user tokens drops the user from the in-process cache."""
+        blacklist = TokenBlacklist()
+
+        with (
+            patch("app.services.cache.token_blacklist.settings") as mock_settings,
+            patch("app.services.cache.token_blacklist.user_cache") as mock_user_cache,
+        ):
+            mock_settings.current_environment = Environment.LOCAL
+
+            await blacklist.revoke_all_user_tokens("user-123", 7200)
+
+            mock_user_cache.invalidate.assert_called_once_with("user-123")
 
     @pytest.mark.anyio
     async def test_revoke_all_user_tokens_local_environment(self):
@@ -233,6 +441,21 @@ class TestTokenBlacklistGetUserRevocationTime:
 
             assert result is None
 
+    @pytest.mark.anyio
+    async def test_get_user_revocation_time_cached(self, mock_redis_client: AsyncMock):
+        """Test repeated lookups, including misses, hit Redis once."""
+        blacklist = TokenBlacklist()
+        blacklist.redis_client = mock_redis_client
+        mock_redis_client.get = AsyncMock(return_value=None)
+
+        with patch("app.services.cache.token_blacklist.settings") as mock_settings:
+            mock_settings.current_environment = Environment.DEV
+
+            assert await blacklist.get_user_revocation_time("user-123") is None
+            assert await blacklist.get_user_revocation_time("user-123") is None
+
+            mock_redis_client.get.assert_called_once()
+
     @pytest.mark.anyio
     async def test_get_user_revocation_time_local_environment(self):
         """Test get_user_revocation_time in LOCAL environment."""
@@ -273,33 +496,172 @@ class TestTokenBlacklistGetUserRevocationTime:
             assert result is None
 
 
+class TestTokenBlacklistGetRevocationState:
+    """Tests for the combined token/user revocation lookup."""
+
+    @staticmethod
+    def _mock_pipeline(mock_redis_client: AsyncMock, results: list) -> Mock:
+        pipe = Mock()
+        pipe.execute = AsyncMock(return_value=results)
+        mock_redis_client.pipeline = Mock(return_value=pipe)
+        return pipe
+
+    @pytest.mark.anyio
+    async def test_single_pipelined_round_trip(self, mock_redis_client: AsyncMock):
+        """Test both lookups share one non-transactional pipeline."""
+        blacklist = TokenBlacklist()
+        blacklist.redis_client = mock_redis_client
+        pipe = self._mock_pipeline(mock_redis_client, [0, b"1700000000"])
+
+        with patch("app.services.cache.token_blacklist.settings") as mock_settings:
+            mock_settings.current_environment = Environment.DEV
+
+            result = await blacklist.get_revocation_state("jti", "42")
+
+        assert result == (False, 1700000000)
+        mock_redis_client.pipeline.assert_called_once_with(transaction=False)
+        pipe.exists.assert_called_once_with(_hashed_key("jti"), "token:blacklist:jti")
+        pipe.get.assert_called_once_with("token:revoke_all:42")
+        pipe.execute.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_revoked_token(self, mock_redis_client: AsyncMock):
+        """Test a blacklisted JTI is reported and cached as revoked."""
+        blacklist = TokenBlacklist()
+        blacklist.redis_client = mock_redis_client
+        self._mock_pipeline(mock_redis_client, [1, None])
+
+        with patch("app.services.cache.token_blacklist.settings") as mock_settings:
+            mock_settings.current_environment = Environment.DEV
+
+            assert await blacklist.get_revocation_state("jti", "42") == (True, None)
+            assert await blacklist.get_revocation_state("jti", "42") == (True, None)
+
+        mock_redis_client.pipeline.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_cached_jti_only_reads_user_marker(self, mock_redis_client: AsyncMock):
+        """Test a cached valid JTI skips the EXISTS and only GETs the marker."""
+        blacklist = TokenBlacklist()
+        blacklist.redis_client = mock_redis_client
+        blacklist._cache_revocation("jti", revoked=False)
+        pipe = self._mock_pipeline(mock_redis_client, [None])
+
+        with patch("app.services.cache.token_blacklist.settings") as mock_settings:
+            mock_settings.current_environment = Environment.DEV
+
+            result = await blacklist.get_revocation_state("jti", "42")
+
+        assert result == (False, None)
+        pipe.exists.assert_not_called()
+        pipe.get.assert_called_once_with("token:revoke_all:42")
+
+    @pytest.mark.anyio
+    async def test_fully_cached_skips_redis(self, mock_redis_client: AsyncMock):
+        """Test a repeat check for the same token and user makes no Redis call."""
+        blacklist = TokenBlacklist()
+        blacklist.redis_client = mock_redis_client
+        self._mock_pipeline(mock_redis_client, [0, b"1700000000"])
+
+        with patch("app.services.cache.token_blacklist.settings") as mock_settings:
+            mock_settings.current_environment = Environment.DEV
+
+            first = await blacklist.get_revocation_state("jti", "42")
+            second = await blacklist.get_revocation_state("jti", "42")
+
+        assert first == second == (False, 1700000000)
+        mock_redis_client.pipeline.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_token_without_jti(self, mock_redis_client: AsyncMock):
+        """Test tokens without a jti only check the user marker."""
+        blacklist = TokenBlacklist()
+        blacklist.redis_client = mock_redis_client
+        pipe = self._mock_pipeline(mock_redis_client, [b"1700000000"])
+
+        with patch("app.services.cache.token_blacklist.settings") as mock_settings:
+            mock_settings.current_environment = Environment.DEV
+
+            result = await blacklist.get_revocation_state(None, "42")
+
+        assert result == (False, 1700000000)
+        pipe.exists.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_local_environment(self):
+        """Test nothing is revoked in LOCAL environment."""
+        blacklist = TokenBlacklist()
+
+        with patch("app.services.cache.token_blacklist.settings") as mock_settings:
+            mock_settings.current_environment = Environment.LOCAL
+
+            assert await blacklist.get_revocation_state("jti", "42") == (False, None)
+
+    @pytest.mark.anyio
+    async def test_no_redis_client(self):
+        """Test fail open when Redis client is not initialized."""
+        blacklist = TokenBlacklist()
+        blacklist._redis_client = None
+
+        with patch("app.services.cache.token_blacklist.settings") as mock_settings:
+            mock_settings.current_environment = Environment.DEV
+
+            assert await blacklist.get_revocation_state("jti", "42") == (False, None)
+
+    @pytest.mark.anyio
+    async def test_redis_exception(self, mock_redis_client: AsyncMock):
+        """Test fail open on Redis errors without caching the result."""
+        blacklist = TokenBlacklist()
+        blacklist.redis_client = mock_redis_client
+        pipe = self._mock_pipeline(mock_redis_client, [])
+        pipe.execute = AsyncMock(side_effect=Exception("Redis error"))
+
+        with patch("app.services.cache.token_blacklist.settings") as mock_settings:
+            mock_settings.current_environment = Environment.DEV
+
+            assert await blacklist.get_revocation_state("jti", "42") == (False, None)
+
+        assert blacklist._get_cached_revocation("jti") is None
+
+
 class TestTokenBlacklistKeyPrefix:
     """Tests for key prefix functionality."""
 
     def test_key_prefix_constant(self):
         """Test KEY_PREFIX is correctly defined."""
-        assert TokenBlacklist.KEY_PREFIX == "token:blacklist:"
+        assert TokenBlacklist.KEY_PREFIX == b"tb:"
+        assert TokenBlacklist.LEGACY_KEY_PREFIX == "token:blacklist:"
 
     @pytest.mark.anyio
     async def test_keys_use_correct_prefix(self, mock_redis_client: AsyncMock):
         """Test that keys use the correct prefix."""
         blacklist = TokenBlacklist()
         blacklist.redis_client = mock_redis_client
-        mock_redis_client.setex = AsyncMock(return_value=True)
+        mock_redis_client.set = AsyncMock(return_value=True)
         mock_redis_client.exists = AsyncMock(return_value=0)
 
         with patch("app.services.cache.token_blacklist.settings") as mock_settings:
             mock_settings.current_environment = Environment.DEV
 
-            await blacklist.revoke_token("my-jti", 3600)
             await blacklist.is_revoked("my-jti")
+            await blacklist.revoke_token("my-jti", 3600)
 
             # Verify correct key format
-            setex_key = mock_redis_client.setex.call_args[0][0]
-            exists_key = mock_redis_client.exists.call_args[0][0]
+            set_key = mock_redis_client.set.call_args[0][0]
+            exists_keys = mock_redis_client.exists.call_args[0]
+
+            assert set_key == _hashed_key("my-jti")
+            assert exists_keys == (_hashed_key("my-jti"), "token:blacklist:my-jti")
+
+    def test_key_is_fixed_length(self):
+        """Test that keys are the prefix plus a 16-byte digest whatever the JTI length."""
+        blacklist = TokenBlacklist()
+
+        short_key = blacklist._blacklist_key("a")
+        long_key = blacklist._blacklist_key("123e4567-e89b-12d3-a456-426614174000")
 
-            assert setex_key == "token:blacklist:my-jti"
-            assert exists_key == "token:blacklist:my-jti"
+        assert len(short_key) == len(long_key) == len(b"tb:") + 16
+        assert short_key != long_key
 
 
 class TestTokenBlacklistGlobalInstance:
@@ -0,0 +1,116 @@
+from unittest.mock import patch
+
+from sqlalchemy import inspect
+
+from app.models import User
+from app.services.cache.user_cache import UserCache
+
+
+def _make_user(user_id: int) -> User:
+    return User(
+        id=user_id,
+        username=f"user{user_id}",
+        email=f"user{user_id}@example.com",
+        hashed_password="hashed",
+        first_name="First",
+        last_name="Last",
+    )
+
+
+class TestUserCache:
+    """Tests for the in-process user cache."""
+
+    def test_get_returns_cached_user(self):
+        """Test a cached user is returned regardless of the ID's type."""
+        cache = UserCache(max_size=10, ttl_seconds=30)
+        user = _make_user(1)
+
+        cache.set(1, user)
+
+        assert cache.get(1).to_dict() == user.to_dict()
+        assert cache.get("1").to_dict() == user.to_dict()
+
+    def test_get_returns_new_detached_instance(self):
+        """Test every get builds a separate detached copy of the cached user."""
+        cache = UserCache(max_size=10, ttl_seconds=30)
+        cache.set(1, _make_user(1))
+
+        first, second = cache.get(1), cache.get(1)
+
+        assert first is not second
+        assert inspect(first).detached
+        assert inspect(first).identity == (1,)
+
+    def test_changes_do_not_reach_cache(self):
+        """Test changing the cached or returned user does not change the cache."""
+        cache = UserCache(max_size=10, ttl_seconds=30)
+        user = _make_user(1)
+        cache.set(1, user)
+
+        user.first_name = "Changed"
+        cache.get(1).last_name = "Changed"
+
+        cached = cache.get(1)
+        assert cached.first_name == "First"
+        assert cached.last_name == "Last"
+
+    def test_get_missing_user(self):
+        """Test get returns None for an unknown user."""
+        cache = UserCache(max_size=10, ttl_seconds=30)
+
+        assert cache.get(1) is None
+
+    def test_entry_expires_after_ttl(self):
+        """Test entries are dropped once the TTL elapses."""
+        cache = UserCache(max_size=10, ttl_seconds=30)
+
+        with patch("app.services.cache.user_cache.time.monotonic", return_value=100.0):
+            cache.set(1, _make_user(1))
+
+        with patch("app.services.cache.user_cache.time.monotonic", return_value=129.0):
+            assert cache.get(1) is not None
+
+        with patch("app.services.cache.user_cache.time.monotonic", return_value=130.0):
+            assert cache.get(1) is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the least recently used user is evicted when the cache is full."""
+        cache = UserCache(max_size=2, ttl_seconds=30)
+
+        cache.set(1, _make_user(1))
+        cache.set(2, _make_user(2))
+        cache.get(1)
+        cache.set(3, _make_user(3))
+
+        assert cache.get(1).id == 1
+        assert cache.get(2) is None
+        assert cache.get(3).id == 3
+
+    def test_zero_ttl_disables_cache(self):
+        """Test a non-positive TTL stores nothing."""
+        cache = UserCache(max_size=10, ttl_seconds=0)
+
+        cache.set(1, _make_user(1))
+
+        assert cache.get(1) is None
+
+    def test_invalidate(self):
+        """Test invalidate drops a single user."""
+        cache = UserCache(max_size=10, ttl_seconds=30)
+        cache.set(1, _make_user(1))
+        cache.set(2, _make_user(2))
+
+        cache.invalidate("1")
+        cache.invalidate(99)
+
+        assert cache.get(1) is None
+        assert cache.get(2).id == 2
+
+    def test_clear(self):
+        """Test clear drops every user."""
+        cache = UserCache(max_size=10, ttl_seconds=30)
+        cache.set(1, _make_user(1))
+
+        cache.clear()
+
+        assert cache.get(1) is None
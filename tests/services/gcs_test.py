@@ -36,6 +36,11 @@ class TestGCSInitialization:
         gcs = GCS(service_account_file)
         assert gcs._GCS__service_account_info == str(service_account_file)
 
+    def test_init_with_incomplete_service_account(self):
+        """Test GCS init rejects a service account dict missing fields."""
+        with pytest.raises(ValidationError):
+            GCS({"project_id": "project"})  # type: ignore[typeddict-item]
+
     def test_init_with_invalid_type(self):
         """Test GCS init with unsupported type."""
         with pytest.raises(NotImplementedError) as exc_info: